@@ -1,33 +1,197 @@
 import sqlite3
+import threading
+import atexit
+import os
 from datetime import datetime
-from contextlib import closing
+from contextlib import closing, contextmanager
 import calendar
+import json
+import re
+import time
+import warnings
+from collections import OrderedDict
 
 DB_NAME = "members.db"
 
-conn = None
+# ------------------ Connection Manager ----------------- #
+# Every function below used to open (and close) its own sqlite3 connection, so
+# a single report refresh could connect hundreds of times. Connections are now
+# long-lived and handed out per thread: each thread gets one connection per
+# database file, configured once, and reused until the process exits.
 
-def get_connection():
+PRAGMAS = (
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",
+)
+
+_local = threading.local()
+_all_connections = []
+_all_connections_lock = threading.Lock()
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    A shared per-thread connection.
+
+    Callers written against the old connect-per-call style still call close();
+    for a pooled connection that only ends the caller's unit of work (anything
+    left uncommitted is rolled back, exactly as a real close would) and keeps
+    the connection open for the next caller.
+
+    Inside a transaction() block the block owns the unit of work, so the
+    commit() and close() calls made by helper functions are deferred to it,
+    and so are the member change notifications they send (see
+    _notify_member_change).
+    """
+
+    is_closed = False
+
+    def commit(self):
+        if getattr(_local, "transaction_depth", 0):
+            return
+        super().commit()
+
+    def close(self):
+        if getattr(_local, "transaction_depth", 0):
+            return
+        if self.in_transaction:
+            self.rollback()
+
+    def really_close(self):
+        self.is_closed = True
+        super().close()
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, factory=PooledConnection, check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # ← allows access by column name
     try:
-        conn = sqlite3.connect(DB_NAME)
-        conn.row_factory = sqlite3.Row  # ← allows access by column name
-        return conn
-    except sqlite3.Error as e:
-        print(f"Connection error: {e}")
-        return None
-    
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        _ensure_schema(conn, path)
+    except Exception:
+        conn.really_close()
+        raise
+    with _all_connections_lock:
+        _all_connections.append(conn)
+    return conn
+
+
+def get_connection(db_path=None):
+    """
+    Return this thread's shared connection to db_path (default DB_NAME).
+    Raises sqlite3.Error if the database cannot be opened.
+    """
+    path = os.path.abspath(db_path or DB_NAME)
+    pool = getattr(_local, "connections", None)
+    if pool is None:
+        pool = _local.connections = {}
+    conn = pool.get(path)
+    if conn is None or conn.is_closed:
+        conn = pool[path] = _connect(path)
+    elif conn.in_transaction and not getattr(_local, "transaction_depth", 0):
+        # A previous caller raised before it could commit or close; don't let
+        # this caller's commit() save its half-finished writes.
+        conn.rollback()
+    return conn
 
-def get_conn():
-    return sqlite3.connect(DB_NAME)
 
-    
-# ------------------ Initialization ----------------- #
-def init_members_table():
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
+@contextmanager
+def transaction(db_path=None):
+    """
+    Run a block of work as one transaction on the shared connection.
+
+    Commits when the block finishes, rolls back if it raises. Nested
+    transaction() blocks join the outermost one.
+    """
+    conn = get_connection(db_path)
+    depth = getattr(_local, "transaction_depth", 0)
+    if depth == 0:
+        _local.pending_notifications = []
+    _local.transaction_depth = depth + 1
+    try:
+        if depth == 0 and not conn.in_transaction:
+            conn.execute("BEGIN")
+        yield conn
+        if depth == 0:
+            sqlite3.Connection.commit(conn)
+    except Exception:
+        if depth == 0:
+            conn.rollback()
+            _local.pending_notifications = []
+        raise
+    finally:
+        _local.transaction_depth = depth
+    if depth == 0:
+        pending, _local.pending_notifications = _local.pending_notifications, []
+        for action, member_id in pending:
+            _call_member_listeners(action, member_id)
+
+
+def close_all_connections():
+    """Close every pooled connection (all threads). Called at interpreter exit."""
+    with _all_connections_lock:
+        connections = list(_all_connections)
+        _all_connections.clear()
+    for conn in connections:
+        try:
+            conn.really_close()
+        except sqlite3.Error:
+            pass
+    _local.__dict__.pop("connections", None)
+
+
+atexit.register(close_all_connections)
+
+
+def data_stamp(db_path=None):
+    """
+    A value that changes whenever the database may have changed: another
+    connection committed (PRAGMA data_version) or this thread's connection
+    modified rows (total_changes). Compare stamps to tell whether a cached
+    query result is stale.
+    """
+    conn = get_connection(db_path)
+    return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+
+# ------------------ Schema Migrations ----------------- #
+# The schema version lives in PRAGMA user_version. Each migration below moves
+# the database from version N-1 to N; pending ones run in order, inside one
+# transaction, the first time a connection to a database file is opened. A
+# database that is already current costs a single PRAGMA read.
+#
+# Every step is written to be safe against databases created by older builds
+# (CREATE ... IF NOT EXISTS, column checks before ALTER TABLE), since the
+# members.db files in the field all report user_version 0 regardless of shape.
+
+def _table_columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _add_column(conn, table, column, decl):
+    if column not in _table_columns(conn, table):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def _rename_column(conn, table, old, new):
+    columns = _table_columns(conn, table)
+    if old in columns and new not in columns:
+        conn.execute(f"ALTER TABLE {table} RENAME COLUMN {old} TO {new}")
+
+
+def _migration_1_baseline(conn):
+    """
+    Create the tables in the shape the application actually uses.
+
+    meeting_attendance.status keeps its INTEGER declaration from the existing
+    databases, but holds the text statuses ('Attended', 'Exempt', ...); with
+    INTEGER affinity SQLite stores non-numeric text unchanged.
+    """
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS members (
-            id INTEGER PRIMARY KEY,
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
             badge_number TEXT,
             membership_type TEXT,
             first_name TEXT,
@@ -44,91 +208,53 @@ def init_members_table():
             sponsor TEXT,
             card_internal TEXT,
             card_external TEXT,
+            deleted INTEGER DEFAULT 0,
             phone2 TEXT,
-            waiver TEXT DEFAULT 'No',
-            deleted_at TEXT
+            waiver INTEGER DEFAULT 0,
+            middle_name TEXT DEFAULT '',
+            nickname TEXT DEFAULT '',
+            suffix TEXT DEFAULT ''
         )
     """)
-    conn.commit()
-    conn.close()
-
-def init_dues_table():
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS dues (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             member_id INTEGER,
-            amount REAL,
             payment_date TEXT,
             year TEXT DEFAULT (strftime('%Y','now')),
+            amount REAL,
             method TEXT,
             notes TEXT,
             FOREIGN KEY (member_id) REFERENCES members(id) ON DELETE CASCADE
         )
     """)
-    conn.commit()
-    conn.close()
-
-def init_settings_table():
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS settings (
             key TEXT PRIMARY KEY,
             value TEXT
         )
     """)
-    defaults = {
-        "dues_probationary": "150",
-        "dues_associate": "300",
-        "dues_active": "150",
-        "dues_life": "0",
-        "default_year": str(datetime.now().year),
-    }
-    for k, v in defaults.items():
-        c.execute("INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)", (k, v))
-    conn.commit()
-    conn.close()
-
-def init_work_hours_table():
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS work_hours (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            member_id INTEGER NOT NULL,
-            date TEXT NOT NULL,
-            hours REAL NOT NULL,
-            work_type TEXT,
-            notes TEXT,
-            FOREIGN KEY (member_id) REFERENCES members(id) ON DELETE CASCADE
+            id INTEGER PRIMARY KEY,
+            member_id INTEGER,
+            date TEXT,
+            activity TEXT,
+            hours REAL,
+            notes TEXT
         )
     """)
-    conn.commit()
-    conn.close()
-
-def init_meeting_attendance_table():
-    conn = get_connection()
-    c = conn.cursor()
-    # Updated to use "status" instead of "attended"
-    c.execute("""
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS meeting_attendance (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             member_id INTEGER NOT NULL,
             meeting_date TEXT NOT NULL,
-            status TEXT NOT NULL CHECK(status IN ('Attended','Exemption Approved')),
+            status INTEGER NOT NULL DEFAULT 1,
             notes TEXT,
             FOREIGN KEY (member_id) REFERENCES members(id) ON DELETE CASCADE
         )
     """)
-    conn.commit()
-    conn.close()
-
-def init_deleted_members_table():
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("""
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS deleted_members (
             id INTEGER PRIMARY KEY,
             badge_number TEXT,
@@ -141,39 +267,267 @@ def init_deleted_members_table():
             address TEXT,
             city TEXT,
             state TEXT,
-            zip TEXT,
+            zip_code TEXT,
             join_date TEXT,
             email2 TEXT,
             sponsor TEXT,
             card_internal TEXT,
             card_external TEXT,
-            phone2 TEXT,
-            waiver TEXT DEFAULT 'No',
             deleted_at TEXT
         )
     """)
-    conn.commit()
-    conn.close()
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS recycle_bin (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            first TEXT NOT NULL,
+            last TEXT NOT NULL,
+            membership_type TEXT NOT NULL,
+            badge INTEGER
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS deletion_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            member_id INTEGER,
+            action TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS roles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            member_id INTEGER NOT NULL,
+            position TEXT NOT NULL,
+            term_start DATE,
+            term_end DATE,
+            FOREIGN KEY (member_id) REFERENCES members(id)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS committees (
+            committee_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            member_id INTEGER NOT NULL UNIQUE,
+            executive_committee TEXT,
+            membership TEXT,
+            trap TEXT,
+            still_target TEXT,
+            gun_bingo_social_events TEXT,
+            rifle TEXT,
+            pistol TEXT,
+            archery TEXT,
+            building_and_grounds TEXT,
+            hunting TEXT,
+            notes TEXT,
+            FOREIGN KEY (member_id) REFERENCES members(id) ON DELETE CASCADE
+        )
+    """)
+    defaults = {
+        "dues_probationary": "150",
+        "dues_associate": "300",
+        "dues_active": "150",
+        "dues_life": "0",
+        "default_year": str(datetime.now().year),
+    }
+    conn.executemany(
+        "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)", defaults.items()
+    )
+
+
+def _migration_2_reconcile_columns(conn):
+    """
+    Bring tables created by the old init_* functions in line with the queries:
+    members gets the deleted flag and name fields, work_hours.work_type becomes
+    activity and deleted_members.zip becomes zip_code.
+    """
+    _add_column(conn, "members", "deleted", "INTEGER DEFAULT 0")
+    _add_column(conn, "members", "phone2", "TEXT")
+    _add_column(conn, "members", "waiver", "INTEGER DEFAULT 0")
+    _add_column(conn, "members", "middle_name", "TEXT DEFAULT ''")
+    _add_column(conn, "members", "nickname", "TEXT DEFAULT ''")
+    _add_column(conn, "members", "suffix", "TEXT DEFAULT ''")
+    _rename_column(conn, "work_hours", "work_type", "activity")
+    _rename_column(conn, "deleted_members", "zip", "zip_code")
+
+
+def _migration_3_report_indexes(conn):
+    """
+    Composite indexes backing the per-member year/month lookups. Every report
+    filters one of these tables by member and a date (or dues year) range.
+    """
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_meeting_attendance_member_date
+        ON meeting_attendance (member_id, meeting_date)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_dues_member_payment_date
+        ON dues (member_id, payment_date)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_dues_member_year
+        ON dues (member_id, year)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_work_hours_member_date
+        ON work_hours (member_id, date)
+    """)
+
+
+# Searchable members columns mirrored into the members_fts index.
+MEMBER_FTS_COLUMNS = ("badge_number", "first_name", "middle_name", "last_name",
+                      "nickname", "email", "email2", "phone", "phone2")
 
-# Initialize all tables
-try:
-    init_members_table()
-    init_dues_table()
-    init_settings_table()
-    init_work_hours_table()
-    init_meeting_attendance_table()
-    init_deleted_members_table()
-except Exception as e:
-    print("⚠️ Failed to initialize tables:", e)
+
+def _migration_4_member_fts(conn):
+    """
+    Full-text index over the searchable members columns, stored as an FTS5
+    external-content table so the text is not duplicated. Triggers keep it in
+    step with members; the initial contents come from a 'rebuild'. Skipped on
+    SQLite builds without FTS5 (search_members() then falls back to LIKE).
+    """
+    columns = ", ".join(MEMBER_FTS_COLUMNS)
+    new_values = ", ".join(f"new.{col}" for col in MEMBER_FTS_COLUMNS)
+    old_values = ", ".join(f"old.{col}" for col in MEMBER_FTS_COLUMNS)
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS members_fts USING fts5(
+                {columns},
+                content='members', content_rowid='id',
+                prefix='2 3'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        warnings.warn(f"FTS5 unavailable, member search will use LIKE: {e}", RuntimeWarning)
+        return
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS members_fts_ai AFTER INSERT ON members BEGIN
+            INSERT INTO members_fts (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS members_fts_ad AFTER DELETE ON members BEGIN
+            INSERT INTO members_fts (members_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS members_fts_au AFTER UPDATE ON members BEGIN
+            INSERT INTO members_fts (members_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO members_fts (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute("INSERT INTO members_fts (members_fts) VALUES ('rebuild')")
+
+
+MIGRATIONS = (
+    _migration_1_baseline,
+    _migration_2_reconcile_columns,
+    _migration_3_report_indexes,
+    _migration_4_member_fts,
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+_migrated_paths = set()
+_migrate_lock = threading.Lock()
+
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """
+    Apply any pending migrations to conn's database in one transaction.
+    Returns the number of migrations applied (0 when already current).
+    """
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return 0
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-read under the write lock in case another process just migrated.
+        version = get_schema_version(conn)
+        pending = MIGRATIONS[version:]
+        for migration in pending:
+            migration(conn)
+        conn.execute(f"PRAGMA user_version = {max(version, SCHEMA_VERSION)}")
+        # Not conn.commit(): that is deferred inside a transaction() block
+        sqlite3.Connection.commit(conn)
+    except Exception:
+        conn.rollback()
+        raise
+    return len(pending)
+
+
+def _ensure_schema(conn, path):
+    """
+    Migrate each database file once per process, on its first connection.
+    A failed migration is rolled back and raised, and is tried again on the
+    next connection.
+    """
+    if path in _migrated_paths:
+        return
+    with _migrate_lock:
+        if path in _migrated_paths:
+            return
+        migrate(conn)
+        _migrated_paths.add(path)
+
+# ------------------ Date Ranges ----------------- #
+# Dates are stored as ISO text (YYYY-MM-DD), so a year or month filter can be a
+# half-open range on the raw column. Unlike strftime('%Y', col) = ?, a range
+# predicate lets SQLite use the (member_id, date) indexes below.
+def _year_range(year):
+    """Return (start, end) bounds so that start <= date < end covers the year."""
+    year = int(year)
+    return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+
+def _month_range(year, month):
+    """Return (start, end) bounds so that start <= date < end covers the month."""
+    year, month = int(year), int(month)
+    if month == 12:
+        return f"{year:04d}-12-01", f"{year + 1:04d}-01-01"
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month + 1:02d}-01"
 
 # ------------------ Settings ----------------- #
-def get_setting(key):
+# Settings are read far more often than they are written, so they are loaded
+# once and served from memory. set_setting()/set_settings() drop the cache;
+# a change committed by any other connection (another thread, or another
+# copy of the program) is noticed through PRAGMA data_version, which moves
+# whenever some other connection commits to the database.
+_settings = None  # {"values": {key: text}, "typed": {accessor: parsed value}}
+_settings_lock = threading.Lock()
+
+
+def _settings_cache():
+    global _settings
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-    row = cursor.fetchone()
-    return row[0] if row else None
+    version = conn.execute("PRAGMA data_version").fetchone()[0]
+    seen = getattr(_local, "settings_version", None)
+    _local.settings_version = version
+    with _settings_lock:
+        if _settings is None or seen != version:
+            rows = conn.execute("SELECT key, value FROM settings").fetchall()
+            _settings = {"values": {k: v for k, v in rows}, "typed": {}}
+        return _settings
+
 
+def _invalidate_settings():
+    global _settings
+    with _settings_lock:
+        _settings = None
+
+
+def _typed_setting(name, parse):
+    """parse(values) for the current settings, computed once per reload."""
+    cache = _settings_cache()
+    typed = cache["typed"]
+    if name not in typed:
+        typed[name] = parse(cache["values"])
+    return typed[name]
+
+
+def get_setting(key):
+    return _settings_cache()["values"].get(key)
 
 
 def set_setting(key, value):
@@ -182,20 +536,227 @@ def set_setting(key, value):
     c.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, str(value)))
     conn.commit()
     conn.close()
+    _invalidate_settings()
+
+
+def set_settings(values):
+    """Write several settings in one transaction."""
+    with transaction() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            [(key, str(value)) for key, value in values.items()],
+        )
+    _invalidate_settings()
+
 
 def get_all_settings():
+    return dict(_settings_cache()["values"])
+
+
+def _parse_default_year(values):
+    try:
+        return int(values.get("default_year") or datetime.now().year)
+    except ValueError:
+        return datetime.now().year
+
+
+def _parse_dues_amounts(values):
+    amounts = {}
+    for key, value in values.items():
+        if key.startswith("dues_"):
+            try:
+                amounts[key[len("dues_"):]] = float(value)
+            except (TypeError, ValueError):
+                pass
+    return amounts
+
+
+def get_default_year():
+    return _typed_setting("default_year", _parse_default_year)
+
+
+def get_dues_amounts():
+    """Yearly dues by membership type (lower case), from the dues_* settings."""
+    return dict(_typed_setting("dues_amounts", _parse_dues_amounts))
+
+
+def get_dues_amount(membership_type):
+    return _typed_setting("dues_amounts", _parse_dues_amounts).get((membership_type or "").lower(), 0.0)
+
+
+# ------------------ Member Cache ----------------- #
+# Member rows are looked up over and over (forms, reports, exports, card
+# swipes), so the most recently used ones are kept in memory, reachable by
+# id, badge number and internal card number. Every member write in this
+# module ends in _notify_member_change(), which drops that member first.
+# Commits by any other connection (another program, or SQL outside these
+# functions) clear the cache through PRAGMA data_version, as for settings;
+# so that a loop of cache hits stays off SQLite, each thread checks it at
+# most once every MEMBER_CACHE_CHECK_INTERVAL seconds.
+MEMBER_CACHE_SIZE = 512
+MEMBER_CACHE_CHECK_INTERVAL = 1.0
+MEMBER_ROW_COLUMNS = (
+    "id", "badge_number", "membership_type", "first_name", "last_name", "dob",
+    "email", "phone", "address", "city", "state", "zip", "join_date", "email2",
+    "sponsor", "card_internal", "card_external", "deleted", "phone2", "waiver",
+    "middle_name", "nickname", "suffix",
+)
+_MEMBER_LOOKUP_COLUMNS = {"id": "id", "badge": "badge_number", "card": "card_internal"}
+
+_member_rows = OrderedDict()  # member id -> row, least recently used first
+_member_keys = {}             # (lookup, str(value)) -> member id
+_member_generation = 0        # bumped by every invalidation
+_member_cache_lock = threading.Lock()
+
+
+def _member_row_keys(row):
+    keys = []
+    for lookup, column in _MEMBER_LOOKUP_COLUMNS.items():
+        value = row[column]
+        if value is not None and value != "":
+            keys.append((lookup, str(value)))
+    return keys
+
+
+def _drop_member_locked(member_id):
+    row = _member_rows.pop(member_id, None)
+    if row is not None:
+        for key in _member_row_keys(row):
+            if _member_keys.get(key) == member_id:
+                del _member_keys[key]
+
+
+def _forget_member(member_id):
+    global _member_generation
+    with _member_cache_lock:
+        _member_generation += 1
+        _drop_member_locked(int(member_id))
+
+
+def _clear_member_cache():
+    global _member_generation
+    with _member_cache_lock:
+        _member_generation += 1
+        _member_rows.clear()
+        _member_keys.clear()
+
+
+def _check_member_cache(conn):
+    """Clear the cache if another connection has committed since this thread last looked."""
+    now = time.monotonic()
+    checked_at = getattr(_local, "members_checked_at", None)
+    if checked_at is not None and now - checked_at < MEMBER_CACHE_CHECK_INTERVAL:
+        return
+    _local.members_checked_at = now
+    version = conn.execute("PRAGMA data_version").fetchone()[0]
+    if getattr(_local, "members_version", None) != version:
+        _local.members_version = version
+        _clear_member_cache()
+
+
+def _cached_member(lookup, value, db_path=None):
+    """
+    The members row whose id, badge or card (lookup) is value, or None.
+    Only rows of the default database (DB_NAME) are cached.
+    """
+    if value is None or value == "":
+        return None
+    if db_path is not None and os.path.abspath(db_path) != os.path.abspath(DB_NAME):
+        conn = get_connection(db_path)
+        row = conn.execute(
+            f"SELECT {', '.join(MEMBER_ROW_COLUMNS)} FROM members WHERE {_MEMBER_LOOKUP_COLUMNS[lookup]} = ?",
+            (value,),
+        ).fetchone()
+        conn.close()
+        return row
     conn = get_connection()
-    c = conn.cursor()
-    c.execute("SELECT key, value FROM settings")
-    rows = c.fetchall()
+    _check_member_cache(conn)
+
+    key = (lookup, str(value))
+    with _member_cache_lock:
+        member_id = _member_keys.get(key)
+        if member_id is not None:
+            _member_rows.move_to_end(member_id)
+            return _member_rows[member_id]
+        generation = _member_generation
+
+    row = conn.execute(
+        f"SELECT {', '.join(MEMBER_ROW_COLUMNS)} FROM members WHERE {_MEMBER_LOOKUP_COLUMNS[lookup]} = ?",
+        (value,),
+    ).fetchone()
+    # Rows read inside an open transaction may yet be rolled back
+    cacheable = row is not None and not conn.in_transaction
     conn.close()
-    return {k: v for k, v in rows}
 
-# In database.py
+    if cacheable:
+        with _member_cache_lock:
+            # Skip it if the member changed while we were reading
+            if generation == _member_generation:
+                member_id = row["id"]
+                _drop_member_locked(member_id)
+                _member_rows[member_id] = row
+                for key in _member_row_keys(row):
+                    _member_keys[key] = member_id
+                while len(_member_rows) > MEMBER_CACHE_SIZE:
+                    _drop_member_locked(next(iter(_member_rows)))
+    return row
+
+
+# ------------------ Change Notifications ----------------- #
+# Windows that show members subscribe here instead of reloading the whole
+# roster after every write. Listeners are called as listener(action, member_id)
+# after the change is committed, on the thread that made it. A change made
+# inside transaction() is announced when the outermost block commits, and
+# not at all if it rolls back. A bulk import is announced once, as
+# MEMBERS_IMPORTED with member_id None: listeners should reload every member.
+MEMBER_ADDED = "added"
+MEMBER_UPDATED = "updated"
+MEMBER_DELETED = "deleted"
+MEMBER_RESTORED = "restored"
+MEMBERS_IMPORTED = "imported"
+
+_member_listeners = []
+
+
+def add_member_listener(listener):
+    if listener not in _member_listeners:
+        _member_listeners.append(listener)
+
+
+def remove_member_listener(listener):
+    if listener in _member_listeners:
+        _member_listeners.remove(listener)
+
+
+def _notify_member_change(action, member_id):
+    _forget_changed(member_id)
+    if getattr(_local, "transaction_depth", 0):
+        pending = _local.pending_notifications
+        if member_id is None and (action, None) in pending:
+            return  # one announcement per bulk change
+        pending.append((action, member_id))
+        return
+    _call_member_listeners(action, member_id)
+
+
+def _call_member_listeners(action, member_id):
+    # Forget the member again: another thread may have cached the old row
+    # while the change was still uncommitted.
+    _forget_changed(member_id)
+    if member_id is not None:
+        member_id = int(member_id)
+    for listener in list(_member_listeners):
+        try:
+            listener(action, member_id)
+        except Exception as e:
+            print(f"Member listener failed for {action} {member_id}: {e}")
 
-def get_default_year():
-    return int(get_setting("default_year") or datetime.now().year)
 
+def _forget_changed(member_id):
+    if member_id is None:
+        _clear_member_cache()
+    else:
+        _forget_member(member_id)
 
 # ------------------ Members ----------------- #
 def add_member(data):
@@ -211,6 +772,7 @@ def add_member(data):
     conn.commit()
     member_id = c.lastrowid
     conn.close()
+    _notify_member_change(MEMBER_ADDED, member_id)
     return member_id
 
 def update_member(member_id, data):
@@ -225,6 +787,7 @@ def update_member(member_id, data):
     """, data + (member_id,))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_UPDATED, member_id)
 
 # --- Member updates used by member_form.py ---
 def update_member_basic(member_id, first_name, last_name, dob):
@@ -235,6 +798,7 @@ def update_member_basic(member_id, first_name, last_name, dob):
     """, (first_name, last_name, dob, member_id))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_UPDATED, member_id)
 
 def update_member_contact(member_id, email, email2, phone, address, city, state, zip_code):
     conn = get_connection()
@@ -246,6 +810,7 @@ def update_member_contact(member_id, email, email2, phone, address, city, state,
     """, (email, email2, phone, address, city, state, zip_code, member_id))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_UPDATED, member_id)
 
 def update_member_membership(member_id, badge_number, membership_type, join_date,
                              sponsor, card_internal, card_external, phone2="", waiver="No"):
@@ -266,6 +831,7 @@ def update_member_membership(member_id, badge_number, membership_type, join_date
           card_external, phone2, waiver, member_id))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_UPDATED, member_id)
 
 def delete_member(member_id):
     conn = get_connection()
@@ -273,6 +839,7 @@ def delete_member(member_id):
     c.execute("DELETE FROM members WHERE id=?", (member_id,))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_DELETED, member_id)
 
 def soft_delete_member_by_id(member_id):
     conn = get_connection()
@@ -280,6 +847,7 @@ def soft_delete_member_by_id(member_id):
     c.execute("UPDATE members SET deleted=1 WHERE id=?", (member_id,))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_DELETED, member_id)
     
 def delete_member_permanently(member_id):
     conn = get_connection()
@@ -287,10 +855,11 @@ def delete_member_permanently(member_id):
     cursor.execute("DELETE FROM members WHERE id=?", (member_id,))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_DELETED, member_id)
 
 
 def permanently_delete_member_by_id(member_id):
-    conn = sqlite3.connect("members.db")
+    conn = get_connection()
     c = conn.cursor()
     try:
         # Get member data from recycle_bin
@@ -307,7 +876,7 @@ def permanently_delete_member_by_id(member_id):
                 address, city, state, zip_code, join_date, sponsor,
                 card_fob_internal, card_fob_external, deleted_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, member + (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
+        """, tuple(member) + (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
 
         # Delete from recycle_bin
         c.execute("DELETE FROM recycle_bin WHERE id=?", (member_id,))
@@ -321,7 +890,7 @@ def log_and_delete_member(recycle_id, db_path="members.db"):
     Logs a permanently deleted member into deleted_members,
     then removes them from recycle_bin.
     """
-    conn = sqlite3.connect(db_path)
+    conn = get_connection(db_path)
     c = conn.cursor()
 
     try:
@@ -352,7 +921,7 @@ def log_and_delete_member(recycle_id, db_path="members.db"):
                 dob, email, phone, address, city, state, zip_code, join_date,
                 email2, sponsor, card_internal, card_external, deleted_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, member + (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
+        """, tuple(member) + (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
 
         # 4. Delete the recycle_bin row itself
         c.execute("DELETE FROM recycle_bin WHERE id=?", (recycle_id,))
@@ -366,7 +935,7 @@ def log_and_delete_member(recycle_id, db_path="members.db"):
 
 
 def get_recycle_bin_members(db_path="members.db"):
-    conn = sqlite3.connect(db_path)
+    conn = get_connection(db_path)
     c = conn.cursor()
     c.execute("SELECT id, first, last, membership_type, badge FROM recycle_bin")
     rows = c.fetchall()
@@ -374,53 +943,53 @@ def get_recycle_bin_members(db_path="members.db"):
     return rows
 
 def restore_member_from_recycle_bin(recycle_id, db_path="members.db"):
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+    with transaction(db_path) as conn:
+        c = conn.cursor()
 
-    # First, check recycle_bin for basic info
-    c.execute("SELECT badge, membership_type, first, last FROM recycle_bin WHERE id=?", (recycle_id,))
-    recycle_row = c.fetchone()
-    if not recycle_row:
-        conn.close()
-        raise ValueError(f"Recycle bin entry {recycle_id} not found")
-    badge, membership_type, first, last = recycle_row
+        # First, check recycle_bin for basic info
+        c.execute("SELECT badge, membership_type, first, last FROM recycle_bin WHERE id=?", (recycle_id,))
+        recycle_row = c.fetchone()
+        if not recycle_row:
+            raise ValueError(f"Recycle bin entry {recycle_id} not found")
+        badge, membership_type, first, last = recycle_row
 
-    # Next, try to get full info from deleted_members (if available)
-    c.execute("SELECT * FROM deleted_members WHERE badge_number=?", (badge,))
-    deleted_row = c.fetchone()
+        # Next, try to get full info from deleted_members (if available)
+        c.execute("SELECT * FROM deleted_members WHERE badge_number=?", (badge,))
+        deleted_row = c.fetchone()
 
-    if deleted_row:
-        # Deleted_members schema:
-        # (id, badge_number, membership_type, first_name, last_name, dob, email, phone, address,
-        #  city, state, zip_code, join_date, email2, sponsor, card_internal, card_external, deleted_at)
+        if deleted_row:
+            # Deleted_members schema:
+            # (id, badge_number, membership_type, first_name, last_name, dob, email, phone, address,
+            #  city, state, zip_code, join_date, email2, sponsor, card_internal, card_external, deleted_at)
 
-        (_, badge_number, mtype, fname, lname, dob, email, phone, address,
-         city, state, zip_code, join_date, email2, sponsor,
-         card_internal, card_external, _) = deleted_row
+            (_, badge_number, mtype, fname, lname, dob, email, phone, address,
+             city, state, zip_code, join_date, email2, sponsor,
+             card_internal, card_external, _) = deleted_row
 
-        # Restore full member
-        c.execute("""
-            INSERT INTO members (
-                badge_number, membership_type, first_name, last_name,
-                dob, email, phone, address, city, state, zip, join_date,
-                email2, sponsor, card_internal, card_external, deleted
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-        """, (
-            badge_number, mtype, fname, lname, dob, email, phone, address,
-            city, state, zip_code, join_date, email2, sponsor, card_internal, card_external
-        ))
+            # Restore full member
+            c.execute("""
+                INSERT INTO members (
+                    badge_number, membership_type, first_name, last_name,
+                    dob, email, phone, address, city, state, zip, join_date,
+                    email2, sponsor, card_internal, card_external, deleted
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+            """, (
+                badge_number, mtype, fname, lname, dob, email, phone, address,
+                city, state, zip_code, join_date, email2, sponsor, card_internal, card_external
+            ))
 
-    else:
-        # Fallback: restore minimal data
-        c.execute("""
-            INSERT INTO members (badge_number, membership_type, first_name, last_name, deleted)
-            VALUES (?, ?, ?, ?, 0)
-        """, (badge, membership_type, first, last))
+        else:
+            # Fallback: restore minimal data
+            c.execute("""
+                INSERT INTO members (badge_number, membership_type, first_name, last_name, deleted)
+                VALUES (?, ?, ?, ?, 0)
+            """, (badge, membership_type, first, last))
 
-    # Remove from recycle_bin
-    c.execute("DELETE FROM recycle_bin WHERE id=?", (recycle_id,))
-    conn.commit()
-    conn.close()
+        restored_id = c.lastrowid
+
+        # Remove from recycle_bin
+        c.execute("DELETE FROM recycle_bin WHERE id=?", (recycle_id,))
+    _notify_member_change(MEMBER_RESTORED, restored_id)
 
 def restore_member(member_id):
     conn = get_connection()
@@ -428,6 +997,7 @@ def restore_member(member_id):
     c.execute("UPDATE members SET deleted=0 WHERE id=?", (member_id,))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_RESTORED, member_id)
 
 def restore_member_by_id(member_id):
     conn = get_connection()
@@ -435,34 +1005,14 @@ def restore_member_by_id(member_id):
     cursor.execute("UPDATE members SET deleted=0 WHERE id=?", (member_id,))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_RESTORED, member_id)
 
 def get_member_by_id(member_id):
-    conn = sqlite3.connect("members.db")
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-
-    cur.execute("""
-        SELECT id, badge_number, membership_type, first_name, last_name, dob,
-            email, phone, address, city, state, zip, join_date, email2,
-            sponsor, card_internal, card_external, deleted, phone2, waiver,
-            middle_name, nickname, suffix
-        FROM members
-        WHERE id = ?
-    """, (member_id,))
-
-
-    row = cur.fetchone()
-    conn.close()
-    return row
+    return _cached_member("id", member_id)
 
 
 def get_member_by_badge(badge):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("SELECT * FROM members WHERE badge_number=?", (badge,))
-    row = c.fetchone()
-    conn.close()
-    return row
+    return _cached_member("badge", badge)
 
 def get_all_members():
     conn = get_connection()
@@ -480,6 +1030,284 @@ def get_deleted_members():
     conn.close()
     return rows
 
+# ------------------ Member Search ----------------- #
+def _search_terms(query):
+    """Split a free-text query into lowercase alphanumeric terms."""
+    return re.findall(r"[0-9a-z]+", str(query or "").lower())
+
+
+def _has_member_fts(conn):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='members_fts'"
+    ).fetchone() is not None
+
+
+def search_members(query, membership_type=None, limit=None):
+    """
+    Ranked full-text search over active members.
+
+    Every term in query must prefix-match one of the searchable columns
+    ("jo smi" finds John Smith). Results are ordered best match first
+    (FTS5 bm25). An empty query returns all members in id order.
+    """
+    conn = get_connection()
+    terms = _search_terms(query)
+    params = []
+
+    if not terms:
+        sql = "SELECT m.* FROM members m WHERE m.deleted = 0"
+        order = " ORDER BY m.id"
+    elif _has_member_fts(conn):
+        sql = """
+            SELECT m.* FROM members_fts f
+            JOIN members m ON m.id = f.rowid
+            WHERE members_fts MATCH ? AND m.deleted = 0
+        """
+        params.append(" ".join(f'"{term}"*' for term in terms))
+        order = " ORDER BY f.rank, m.id"
+    else:
+        sql = "SELECT m.* FROM members m WHERE m.deleted = 0"
+        for term in terms:
+            sql += " AND (" + " OR ".join(
+                f"lower(COALESCE(m.{col}, '')) LIKE ?" for col in MEMBER_FTS_COLUMNS
+            ) + ")"
+            params.extend([f"%{term}%"] * len(MEMBER_FTS_COLUMNS))
+        order = " ORDER BY m.last_name, m.first_name"
+
+    if membership_type and membership_type != "All":
+        sql += " AND m.membership_type = ?"
+        params.append(membership_type)
+    sql += order
+    if limit:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return rows
+
+# ------------------ Member Export ----------------- #
+# members columns written by the "Export Current Tab" CSV, in file order.
+EXPORT_COLUMNS = (
+    "badge_number", "membership_type", "first_name", "last_name", "dob",
+    "email", "email2", "phone", "address", "city", "state", "zip",
+    "join_date", "sponsor", "card_internal", "card_external",
+)
+
+
+def iter_member_export_rows(member_ids=None, membership_type=None, chunk_size=500):
+    """
+    Yield one tuple of EXPORT_COLUMNS per member, fetched chunk_size rows at
+    a time from a single query on the shared connection.
+
+    With member_ids the rows come back in that order (ids not found, or
+    soft-deleted, are skipped). Otherwise every active member is exported,
+    optionally limited to one membership_type, in id order.
+    """
+    columns = ", ".join(f"m.{col}" for col in EXPORT_COLUMNS)
+    if member_ids is not None:
+        # json_each() turns the id list into a table whose key is the list
+        # position, so one join returns the rows in the caller's order.
+        sql = f"""
+            SELECT {columns}
+            FROM json_each(?) j
+            JOIN members m ON m.id = j.value
+            WHERE m.deleted = 0
+        """
+        params = [json.dumps([int(i) for i in member_ids])]
+        if membership_type and membership_type != "All":
+            sql += " AND m.membership_type = ?"
+            params.append(membership_type)
+        sql += " ORDER BY j.key"
+    else:
+        sql = f"SELECT {columns} FROM members m WHERE m.deleted = 0"
+        params = []
+        if membership_type and membership_type != "All":
+            sql += " AND m.membership_type = ?"
+            params.append(membership_type)
+        sql += " ORDER BY m.id"
+
+    conn = get_connection()
+    cursor = conn.execute(sql, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for row in rows:
+                yield tuple(row)
+    finally:
+        cursor.close()
+
+# ------------------ Member Import ----------------- #
+# members columns filled by a bulk import, in the order add_member() takes.
+IMPORT_COLUMNS = (
+    "badge_number", "membership_type", "first_name", "last_name", "dob",
+    "email", "phone", "address", "city", "state", "zip",
+    "join_date", "email2", "sponsor", "card_internal", "card_external",
+)
+DUPLICATE_MODES = ("skip", "update", "fail")
+
+
+class DuplicateBadgeError(ValueError):
+    """Raised by import_member_chunk() in 'fail' mode when a badge exists."""
+
+    def __init__(self, line, badge):
+        super().__init__(f"Line {line}: badge {badge} already exists")
+        self.line = line
+        self.badge = badge
+
+
+def _badge_ids(conn, badges):
+    """Map each existing badge in badges to its member id (one query)."""
+    rows = conn.execute(
+        "SELECT badge_number, id FROM members WHERE badge_number IN (SELECT value FROM json_each(?))",
+        (json.dumps(list(badges)),),
+    ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def import_member_chunk(conn, records, on_duplicate="skip"):
+    """
+    Insert (or, in 'update' mode, overwrite) one chunk of member records on
+    conn, inside the caller's transaction.
+
+    records is a list of (line_number, values) pairs, values being a tuple in
+    IMPORT_COLUMNS order. Existing badges are resolved with one query; a badge
+    repeated inside the import counts as existing after its first row.
+    Returns (inserted, updated, skipped, errors), errors being (line, message)
+    pairs for rows SQLite refused. In 'fail' mode a duplicate raises
+    DuplicateBadgeError so the caller can roll back. If any member was
+    written, one MEMBERS_IMPORTED notification follows the commit.
+    """
+    if on_duplicate not in DUPLICATE_MODES:
+        raise ValueError(f"on_duplicate must be one of {DUPLICATE_MODES}")
+
+    existing = _badge_ids(conn, {values[0] for _, values in records})
+    inserts, updates = [], []
+    pending_badges = {}
+    skipped = 0
+    for line, values in records:
+        badge = values[0]
+        if badge in existing or badge in pending_badges:
+            if on_duplicate == "fail":
+                raise DuplicateBadgeError(line, badge)
+            if on_duplicate == "skip":
+                skipped += 1
+                continue
+            if badge in existing:
+                updates.append((line, values[1:] + (existing[badge],)))
+            else:
+                # Repeated within this chunk: the later row wins.
+                inserts[pending_badges[badge]] = (line, values)
+            continue
+        pending_badges[badge] = len(inserts)
+        inserts.append((line, values))
+
+    placeholders = ", ".join("?" * len(IMPORT_COLUMNS))
+    insert_sql = f"INSERT INTO members ({', '.join(IMPORT_COLUMNS)}) VALUES ({placeholders})"
+    update_sql = "UPDATE members SET " + ", ".join(
+        f"{col}=?" for col in IMPORT_COLUMNS[1:]
+    ) + " WHERE id=?"
+
+    errors = []
+    inserted = _executemany_rows(conn, insert_sql, inserts, errors)
+    updated = _executemany_rows(conn, update_sql, updates, errors)
+    if inserted or updated:
+        _notify_member_change(MEMBERS_IMPORTED, None)
+    return inserted, updated, skipped, errors
+
+
+def _executemany_rows(conn, sql, rows, errors):
+    """
+    executemany() the rows; if SQLite rejects the batch, redo it row by row
+    under a savepoint so each bad row is reported and the rest still land.
+    """
+    if not rows:
+        return 0
+    conn.execute("SAVEPOINT import_batch")
+    try:
+        conn.executemany(sql, [params for _, params in rows])
+        conn.execute("RELEASE import_batch")
+        return len(rows)
+    except sqlite3.Error:
+        conn.execute("ROLLBACK TO import_batch")
+        conn.execute("RELEASE import_batch")
+
+    done = 0
+    for line, params in rows:
+        try:
+            conn.execute(sql, params)
+            done += 1
+        except sqlite3.Error as e:
+            errors.append((line, str(e)))
+    return done
+
+# ------------------ Mail Merge ----------------- #
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _normalize_email(address):
+    """Trim an address and lowercase its domain ('' if there is nothing)."""
+    address = (address or "").strip()
+    if "@" in address:
+        local, _, domain = address.rpartition("@")
+        address = f"{local}@{domain.lower()}"
+    return address
+
+
+def get_mail_merge_emails(member_ids=None, membership_type=None, domain=None, valid_only=False):
+    """
+    Primary then secondary email of each member, in one query.
+
+    Addresses are trimmed and their domains lowercased, blanks dropped and
+    duplicates (compared case-insensitively) kept only the first time they
+    appear. member_ids limits and orders the members as in
+    iter_member_export_rows(). domain keeps only addresses at that domain or
+    its subdomains; valid_only drops anything not shaped like user@host.tld.
+    """
+    if member_ids is not None:
+        sql = """
+            SELECT m.email, m.email2
+            FROM json_each(?) j
+            JOIN members m ON m.id = j.value
+            WHERE m.deleted = 0
+        """
+        params = [json.dumps([int(i) for i in member_ids])]
+        order = " ORDER BY j.key"
+    else:
+        sql = "SELECT m.email, m.email2 FROM members m WHERE m.deleted = 0"
+        params = []
+        order = " ORDER BY m.id"
+    if membership_type and membership_type != "All":
+        sql += " AND m.membership_type = ?"
+        params.append(membership_type)
+
+    conn = get_connection()
+    rows = conn.execute(sql + order, params).fetchall()
+    conn.close()
+
+    domain = (domain or "").strip().lstrip("@").lower()
+    emails = []
+    seen = set()
+    for row in rows:
+        for address in (row[0], row[1]):
+            address = _normalize_email(address)
+            if not address:
+                continue
+            if valid_only and not _EMAIL_RE.match(address):
+                continue
+            if domain:
+                host = address.rpartition("@")[2]
+                if host != domain and not host.endswith("." + domain):
+                    continue
+            key = address.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            emails.append(address)
+    return emails
+
 # ------------------ Dues ----------------- #
 def add_dues_payment(member_id, amount, payment_date, method=None, notes=None, year=None):
     if not year:
@@ -530,11 +1358,18 @@ def get_dues_report(member_id=None, year=None, month=None):
     conn = get_connection()
     c = conn.cursor()
 
-    query = """
+    month_index = list(calendar.month_name).index(month) if month and month != "All" else None
+
+    # A date filter already drops members without matching dues, so the join
+    # is effectively inner. SQLite never reorders a CROSS JOIN, which keeps
+    # members as the outer loop and turns each member's dues into an index
+    # search on (member_id, payment_date).
+    join = "CROSS JOIN" if (year or month_index) else "LEFT JOIN"
+    query = f"""
         SELECT m.id, m.badge_number, m.membership_type, m.first_name, m.last_name,
                d.amount as amount_due, d.payment_date, d.amount as amount_paid, d.method
         FROM members m
-        LEFT JOIN dues d ON m.id = d.member_id
+        {join} dues d ON m.id = d.member_id
         WHERE m.deleted = 0
     """
     params = []
@@ -543,12 +1378,14 @@ def get_dues_report(member_id=None, year=None, month=None):
         query += " AND m.id = ?"
         params.append(member_id)
 
-    if year:
-        query += " AND strftime('%Y', d.payment_date) = ?"
-        params.append(str(year))
-
-    if month and month != "All":
-        month_index = list(calendar.month_name).index(month)
+    if year and month_index:
+        query += " AND d.payment_date >= ? AND d.payment_date < ?"
+        params.extend(_month_range(year, month_index))
+    elif year:
+        query += " AND d.payment_date >= ? AND d.payment_date < ?"
+        params.extend(_year_range(year))
+    elif month_index:
+        # Same month in every year can't be expressed as a single range
         query += " AND strftime('%m', d.payment_date) = ?"
         params.append(f"{month_index:02d}")
 
@@ -564,6 +1401,54 @@ def get_dues_report(member_id=None, year=None, month=None):
     conn.close()
     return rows
 
+def get_dues_summary(year):
+    """
+    Return one dues summary row per active member for the given dues year,
+    computed in a single query.
+
+    Each row has: id, badge_number, first_name, last_name, membership_type,
+    amount_due (from the dues_<type> setting), total_paid, last_payment_date,
+    method (of the most recent payment) and balance_due (never below zero).
+    """
+    query = """
+        WITH year_dues AS (
+            SELECT d.member_id, d.payment_date, d.method,
+                   CAST(COALESCE(d.amount, 0) AS REAL) AS amount,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY d.member_id
+                       ORDER BY COALESCE(d.payment_date, '') DESC, d.id ASC
+                   ) AS rn
+            FROM members m
+            CROSS JOIN dues d ON d.member_id = m.id AND d.year = ?
+            WHERE m.deleted = 0
+        ),
+        paid AS (
+            SELECT member_id,
+                   SUM(amount) AS total_paid,
+                   MAX(CASE WHEN rn = 1 AND payment_date <> '' THEN payment_date END) AS last_payment_date,
+                   MAX(CASE WHEN rn = 1 AND payment_date <> '' THEN method END) AS method
+            FROM year_dues
+            GROUP BY member_id
+        )
+        SELECT m.id, m.badge_number, m.first_name, m.last_name, m.membership_type,
+               COALESCE(CAST(s.value AS REAL), 0) AS amount_due,
+               COALESCE(p.total_paid, 0.0) AS total_paid,
+               COALESCE(p.last_payment_date, '') AS last_payment_date,
+               COALESCE(p.method, '') AS method,
+               MAX(COALESCE(CAST(s.value AS REAL), 0) - COALESCE(p.total_paid, 0), 0.0) AS balance_due
+        FROM members m
+        LEFT JOIN settings s ON s.key = 'dues_' || lower(m.membership_type)
+        LEFT JOIN paid p ON p.member_id = m.id
+        WHERE m.deleted = 0
+        ORDER BY m.id
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(query, (str(year),))
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
 def update_dues_payment(payment_id, amount=None, payment_date=None, method=None, notes=None, year=None):
     conn = get_connection()
     c = conn.cursor()
@@ -610,9 +1495,9 @@ def get_work_hours_by_member(member_id, year=None):
     if year:
         cur.execute("""
             SELECT * FROM work_hours
-            WHERE member_id = ? AND strftime('%Y', date) = ?
+            WHERE member_id = ? AND date >= ? AND date < ?
             ORDER BY date ASC
-        """, (member_id, str(year)))
+        """, (member_id, *_year_range(year)))
     else:
         cur.execute("""
             SELECT * FROM work_hours
@@ -635,7 +1520,7 @@ def get_work_hours_by_id(entry_id):
 # Database function to fetch work types
 def get_work_types():
     conn = get_connection()
-    query = "SELECT DISTINCT work_type FROM work_hours"  # Assuming work_type is the field name
+    query = "SELECT DISTINCT activity FROM work_hours"
     cursor = conn.cursor()
     cursor.execute(query)
     work_types = [row[0] for row in cursor.fetchall()]
@@ -676,8 +1561,7 @@ def add_meeting_attendance(member_id, meeting_date, status, notes=None):
 
 
 def get_attendance_summary(year=None, month=None):
-    import sqlite3
-    conn = sqlite3.connect("members.db")
+    conn = get_connection()
     c = conn.cursor()
 
     query = """
@@ -690,10 +1574,13 @@ def get_attendance_summary(year=None, month=None):
     """
     params = []
 
-    if year:
-        query += " AND strftime('%Y', mt.date) = ?"
-        params.append(str(year))
-    if month:
+    if year and month:
+        query += " AND mt.date >= ? AND mt.date < ?"
+        params.extend(_month_range(year, month))
+    elif year:
+        query += " AND mt.date >= ? AND mt.date < ?"
+        params.extend(_year_range(year))
+    elif month:
         query += " AND strftime('%m', mt.date) = ?"
         params.append(f"{int(month):02d}")
 
@@ -749,12 +1636,12 @@ def get_member_attendance_status_all_months(member_id, year):
         SELECT status 
         FROM meeting_attendance
         WHERE member_id = ?
-          AND strftime('%Y', meeting_date) = ?
+          AND meeting_date >= ? AND meeting_date < ?
         ORDER BY meeting_date
     """
     with closing(get_connection()) as conn, conn:
         cur = conn.cursor()
-        cur.execute(query, (member_id, str(year)))
+        cur.execute(query, (member_id, *_year_range(year)))
         rows = cur.fetchall()
         return [row[0] for row in rows] if rows else ["No records"]
 
@@ -773,13 +1660,12 @@ def get_member_attendance_status_by_month(member_id, year, month_name):
         SELECT status
         FROM meeting_attendance
         WHERE member_id = ?
-          AND strftime('%Y', meeting_date) = ?
-          AND strftime('%m', meeting_date) = ?
+          AND meeting_date >= ? AND meeting_date < ?
         ORDER BY meeting_date
     """
     with closing(get_connection()) as conn, conn:
         cur = conn.cursor()
-        cur.execute(query, (member_id, str(year), month_number))
+        cur.execute(query, (member_id, *_month_range(year, month_number)))
         rows = cur.fetchall()
         return [row[0] for row in rows] if rows else ["No records"]
     
@@ -791,9 +1677,9 @@ def count_member_attendance(member_id, year):
             SELECT COUNT(*)
             FROM meeting_attendance
             WHERE member_id = ?
-              AND strftime('%Y', meeting_date) = ?
+              AND meeting_date >= ? AND meeting_date < ?
               AND status IN ('Attended','Exempted')
-        """, (member_id, str(year)))
+        """, (member_id, *_year_range(year)))
         result = cursor.fetchone()
         return result[0] if result else 0
     finally:
@@ -810,11 +1696,11 @@ def count_member_attendance_year(member_id, year):
     SELECT COUNT(*) 
     FROM meeting_attendance
     WHERE member_id = ?
-      AND strftime('%Y', meeting_date) = ?
+      AND meeting_date >= ? AND meeting_date < ?
       AND status IN ('attended', 'exempted')
     """
     with closing(get_connection()) as conn, conn, closing(conn.cursor()) as cur:
-        cur.execute(query, (member_id, str(year)))
+        cur.execute(query, (member_id, *_year_range(year)))
         result = cur.fetchone()
         return result[0] if result else 0
 
@@ -831,11 +1717,10 @@ def get_member_attendance_status(member_id, year, month):
     SELECT status
     FROM meeting_attendance
     WHERE member_id = ?
-      AND strftime('%Y', meeting_date) = ?
-      AND strftime('%m', meeting_date) = ?
+      AND meeting_date >= ? AND meeting_date < ?
     """
     with closing(get_connection()) as conn, conn, closing(conn.cursor()) as cur:
-        cur.execute(query, (member_id, str(year), f"{int(month):02d}"))
+        cur.execute(query, (member_id, *_month_range(year, month)))
         rows = cur.fetchall()
         if not rows:
             return None
@@ -851,15 +1736,60 @@ def get_member_status_for_month(member_id, year, month):
             SELECT status
             FROM meeting_attendance
             WHERE member_id = ?
-              AND strftime('%Y', meeting_date) = ?
-              AND strftime('%m', meeting_date) = ?
+              AND meeting_date >= ? AND meeting_date < ?
             LIMIT 1
-        """, (member_id, str(year), f"{month:02d}"))
+        """, (member_id, *_month_range(year, month)))
         result = cursor.fetchone()
         return result[0] if result else None
     finally:
         conn.close()
 
+def get_attendance_matrix(year):
+    """
+    Return the member x month attendance matrix for a year in one query.
+
+    Returns a list of dicts (one per active member, in member order) with keys
+    id, badge_number, first_name, last_name, total and months. `total` is the
+    number of meetings attended or exempted in the year (same rule as
+    count_member_attendance); `months` maps month number (1-12) to
+    {"count": attended/exempted that month, "status": first status recorded
+    that month} for the months that have any record.
+    """
+    query = """
+        SELECT m.id, m.badge_number, m.first_name, m.last_name,
+               a.meeting_date, a.status
+        FROM members m
+        LEFT JOIN meeting_attendance a
+               ON a.member_id = m.id
+              AND a.meeting_date >= ? AND a.meeting_date < ?
+        WHERE m.deleted = 0
+        ORDER BY m.id, a.meeting_date, a.id
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(query, _year_range(year))
+
+    matrix = []
+    current = None
+    for member_id, badge, first, last, meeting_date, status in c:
+        if current is None or current["id"] != member_id:
+            current = {"id": member_id, "badge_number": badge, "first_name": first,
+                       "last_name": last, "total": 0, "months": {}}
+            matrix.append(current)
+        if meeting_date is None:
+            continue
+        try:
+            month = int(meeting_date[5:7])
+        except (TypeError, ValueError):
+            continue
+        counted = status in ("Attended", "Exempted")
+        entry = current["months"].setdefault(month, {"count": 0, "status": status})
+        if counted:
+            entry["count"] += 1
+            current["total"] += 1
+    conn.close()
+    return matrix
+
 def update_meeting_attendance(entry_id, meeting_date=None, status=None, notes=None):
     conn = get_connection()
     c = conn.cursor()
@@ -908,7 +1838,7 @@ def get_work_hours_report(member_id=None, start_date=None, end_date=None, work_t
         join_filters.append("w.date <= ?")
         params.append(end_date)
     if work_type:
-        join_filters.append("w.work_type = ?")
+        join_filters.append("w.activity = ?")
         params.append(work_type)
 
     if join_filters:
@@ -937,8 +1867,8 @@ def get_member_work_hours_for_year(member_id, year):
         SELECT COALESCE(SUM(hours), 0)
         FROM work_hours
         WHERE member_id = ?
-          AND strftime('%Y', date) = ?
-    """, (member_id, str(year)))
+          AND date >= ? AND date < ?
+    """, (member_id, *_year_range(year)))
     total = cur.fetchone()[0]
     conn.close()
     return total
@@ -954,9 +1884,8 @@ def get_member_work_hours_for_month(member_id, year, month):
         SELECT COALESCE(SUM(hours), 0)
         FROM work_hours
         WHERE member_id = ?
-          AND strftime('%Y', date) = ?
-          AND strftime('%m', date) = ?
-    """, (member_id, str(year), f"{month:02d}"))
+          AND date >= ? AND date < ?
+    """, (member_id, *_month_range(year, month)))
     total = cur.fetchone()[0]
     conn.close()
     return total
@@ -975,7 +1904,7 @@ def _fetch_deleted_member(member_id, conn):
 
 # --- Show in Recycle Bin UI (your TreeView uses this) ---
 def get_deleted_members():
-    conn = get_conn()
+    conn = get_connection()
     c = conn.cursor()
     c.execute("""
         SELECT id, badge_number, membership_type, first_name, last_name,
@@ -991,7 +1920,7 @@ def get_deleted_members():
 
 # --- Soft delete: mark deleted=1 and (optionally) drop a simple crumb in recycle_bin ---
 def soft_delete_member_by_id(member_id):
-    with get_conn() as conn:
+    with transaction() as conn:
         c = conn.cursor()
         # Grab minimal info to mirror into recycle_bin (optional but helpful)
         c.execute("SELECT first_name, last_name, membership_type, badge_number FROM members WHERE id=?", (member_id,))
@@ -1018,10 +1947,11 @@ def soft_delete_member_by_id(member_id):
             c.execute("INSERT INTO deletion_log (member_id, action) VALUES (?, 'soft_delete')", (member_id,))
         except Exception:
             pass
+    _notify_member_change(MEMBER_DELETED, member_id)
 
 # --- Restore from Recycle Bin (members.id) ---
 def restore_member_by_id(member_id):
-    with get_conn() as conn:
+    with transaction() as conn:
         c = conn.cursor()
 
         # Member must exist and be soft-deleted
@@ -1050,10 +1980,11 @@ def restore_member_by_id(member_id):
             c.execute("INSERT INTO deletion_log (member_id, action) VALUES (?, 'restore')", (member_id,))
         except Exception:
             pass
+    _notify_member_change(MEMBER_RESTORED, member_id)
 
 # --- Permanently delete (members.id) and LOG FULL ROW into deleted_members ---
 def permanently_delete_member_by_id(member_id):
-    with get_conn() as conn:
+    with transaction() as conn:
         c = conn.cursor()
 
         # Must be in recycle bin (deleted=1)
@@ -1099,10 +2030,10 @@ def permanently_delete_member_by_id(member_id):
             c.execute("INSERT INTO deletion_log (member_id, action) VALUES (?, 'permanent_delete')", (member_id,))
         except Exception:
             pass
+    _notify_member_change(MEMBER_DELETED, member_id)
 
 def get_waiver_report():
     conn = get_connection()
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
     query = """
@@ -1191,8 +2122,7 @@ def get_member_committees(member_id):
         return {col: "" for col in committee_columns}
 
 def update_member_basic(member_id, first_name, middle_name, last_name, suffix, nickname, dob):
-    conn = sqlite3.connect("members.db")
-    conn.row_factory = sqlite3.Row
+    conn = get_connection()
     cur = conn.cursor()
 
     cur.execute("""
@@ -1208,6 +2138,7 @@ def update_member_basic(member_id, first_name, middle_name, last_name, suffix, n
 
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_UPDATED, member_id)
 
 
 def update_member_contact(member_id, email, email2, phone, phone2, address, city, state, zip):
@@ -1220,28 +2151,26 @@ def update_member_contact(member_id, email, email2, phone, phone2, address, city
     """, (email, email2, phone, phone2, address, city, state, zip, member_id))
     conn.commit()
     conn.close()
+    _notify_member_change(MEMBER_UPDATED, member_id)
 
 # ------------------ Committees DB Functions ------------------
 def update_member_committees(member_id, committees_dict):
     """Insert or update a member's committees and notes in the committees table."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    # Ensure row exists
-    cursor.execute("SELECT 1 FROM committees WHERE member_id = ?", (member_id,))
-    if cursor.fetchone() is None:
-        # Insert default row
-        cursor.execute("INSERT INTO committees (member_id) VALUES (?)", (member_id,))
-
-    # Update committees + notes
-    set_clause = ", ".join([f"{col} = ?" for col in committees_dict.keys()])
-    values = list(committees_dict.values())
-    values.append(member_id)
-    query = f"UPDATE committees SET {set_clause} WHERE member_id = ?"
-    cursor.execute(query, values)
-
-    conn.commit()
-    cursor.close()
+    with transaction() as conn:
+        cursor = conn.cursor()
+
+        # Ensure row exists
+        cursor.execute("SELECT 1 FROM committees WHERE member_id = ?", (member_id,))
+        if cursor.fetchone() is None:
+            # Insert default row
+            cursor.execute("INSERT INTO committees (member_id) VALUES (?)", (member_id,))
+
+        # Update committees + notes
+        set_clause = ", ".join([f"{col} = ?" for col in committees_dict.keys()])
+        values = list(committees_dict.values())
+        values.append(member_id)
+        query = f"UPDATE committees SET {set_clause} WHERE member_id = ?"
+        cursor.execute(query, values)
 
 def get_all_committees():
     """Return all committee column names from committees table (excluding id/member_id/notes)."""
@@ -1270,7 +2199,6 @@ def get_members_by_committee(committee_name):
     Returns a list of dicts with keys: id, badge_number, first_name, last_name, notes.
     """
     conn = get_connection()
-    conn.row_factory = sqlite3.Row
     cur = conn.cursor()
 
     committee_column = committee_name.lower().replace(" ", "_")
@@ -1292,7 +2220,6 @@ def get_members_by_committee(committee_name):
 def get_member_committees(member_id):
     """Return a dictionary of all committee flags + notes for a member."""
     conn = get_connection()
-    conn.row_factory = sqlite3.Row
     cur = conn.cursor()
     cur.execute("SELECT * FROM committees WHERE member_id = ?", (member_id,))
     row = cur.fetchone()
@@ -1301,7 +2228,7 @@ def get_member_committees(member_id):
     return dict(row) if row else {}
 
 def get_executive_committee_members():
-    conn = sqlite3.connect("members.db")
+    conn = get_connection()
     cursor = conn.cursor()
 
     # Select only executive positions (adjust the list of positions as needed)
@@ -1339,24 +2266,15 @@ def get_executive_committee_members():
 
 def get_member_id_from_badge(badge):
     """Return member_id corresponding to the badge number."""
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT id FROM members WHERE badge_number = ?", (badge,))
-    row = cur.fetchone()
-    conn.close()
+    row = _cached_member("badge", badge)
     if row:
-        return row[0]
+        return row["id"]
     return None
 
 
 # Get member by card_internal
-def get_member_by_card_internal(card_internal):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("SELECT * FROM members WHERE card_internal=?", (card_internal,))
-    row = c.fetchone()
-    conn.close()
-    return row
+def get_member_by_card_internal(card_internal, db_path=None):
+    return _cached_member("card", card_internal, db_path)
 
 def get_meeting_attendance(member_id, year=None, meeting_date=None):
     """
@@ -1381,9 +2299,9 @@ def get_meeting_attendance(member_id, year=None, meeting_date=None):
         elif year:
             cur.execute("""
                 SELECT * FROM meeting_attendance
-                WHERE member_id = ? AND strftime('%Y', meeting_date) = ?
+                WHERE member_id = ? AND meeting_date >= ? AND meeting_date < ?
                 ORDER BY meeting_date ASC
-            """, (member_id, str(year)))
+            """, (member_id, *_year_range(year)))
             return cur.fetchall()
 
         else:
@@ -1405,3 +2323,123 @@ def add_meeting_attendance(member_id, meeting_date, status="Present", notes=None
               (member_id, meeting_date, status, notes))
     conn.commit()
     conn.close()
+
+# --- Bulk attendance import (import_meeting_data.py) ---
+def get_card_member_ids(db_path=None):
+    """(card_internal, member_id) for every active member with a card."""
+    conn = get_connection(db_path)
+    rows = conn.execute("""
+        SELECT TRIM(card_internal) AS card_internal, id AS member_id
+        FROM members
+        WHERE deleted = 0 AND TRIM(COALESCE(card_internal, '')) <> ''
+    """).fetchall()
+    conn.close()
+    return rows
+
+def get_attendance_member_ids(meeting_date, db_path=None):
+    """Ids of members who already have attendance recorded for meeting_date."""
+    conn = get_connection(db_path)
+    rows = conn.execute(
+        "SELECT DISTINCT member_id FROM meeting_attendance WHERE meeting_date = ?",
+        (meeting_date,),
+    ).fetchall()
+    conn.close()
+    return {row[0] for row in rows}
+
+def add_meeting_attendance_many(records, conn=None):
+    """
+    Insert (member_id, meeting_date, status, notes) tuples with one
+    executemany. Pass conn to join an open transaction(); otherwise the
+    insert commits on its own.
+    """
+    sql = "INSERT INTO meeting_attendance (member_id, meeting_date, status, notes) VALUES (?, ?, ?, ?)"
+    if conn is not None:
+        conn.executemany(sql, records)
+        return
+    with transaction() as conn:
+        conn.executemany(sql, records)
+
+
+# ------------------ Query Plan Checks ----------------- #
+# Tables that reports filter by member and date; a full SCAN of any of them
+# means a query has lost its index (e.g. a strftime() predicate crept back in).
+INDEXED_REPORT_TABLES = ("dues", "meeting_attendance", "work_hours")
+
+_TABLE_REF_RE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+_PLAN_SCAN_RE = re.compile(r"^SCAN (\w+)( USING (?:COVERING )?INDEX\b)?")
+_NOT_ALIASES = {"WHERE", "ON", "USING", "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "CROSS",
+                "NATURAL", "GROUP", "ORDER", "HAVING", "LIMIT", "WINDOW", "UNION"}
+
+def explain_query_plan(sql, params=()):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("EXPLAIN QUERY PLAN " + sql, params)
+    return [row[3] for row in cur.fetchall()]
+
+def _table_aliases(sql):
+    """Map every table name and alias in sql's FROM/JOIN clauses to the tables it names."""
+    aliases = {}
+    for table, alias in _TABLE_REF_RE.findall(sql):
+        aliases.setdefault(table, set()).add(table)
+        if alias and alias.upper() not in _NOT_ALIASES:
+            aliases.setdefault(alias, set()).add(table)
+    return aliases
+
+def full_table_scans(sql, params=()):
+    """
+    Names of the tables sql reads with a full table scan: plan rows that
+    SCAN a table rather than SEARCH it, without USING (COVERING) INDEX.
+    Plan rows name tables by alias; they are resolved back to table names.
+    """
+    aliases = _table_aliases(sql)
+    tables = set()
+    for line in explain_query_plan(sql, params):
+        match = _PLAN_SCAN_RE.match(line)
+        if match and not match.group(2):
+            tables.update(aliases.get(match.group(1), {match.group(1)}))
+    return tables
+
+def check_report_query_plans(year=None):
+    """
+    Run every report query once, capture the SQL it issues, and EXPLAIN each
+    statement. Returns {sql: [table names]} for the statements that fully
+    scan one of INDEXED_REPORT_TABLES instead of using an index; an empty
+    dict means every report query is index-backed.
+    """
+    year = year or datetime.now().year
+    member_id = 0
+    report_calls = [
+        lambda: get_dues_summary(year),
+        lambda: get_attendance_matrix(year),
+        lambda: get_dues_report(year=year),
+        lambda: get_dues_report(year=year, month="January"),
+        lambda: get_dues_by_member(member_id, year=year),
+        lambda: get_work_hours_by_member(member_id, year=year),
+        lambda: get_work_hours_report(start_date=f"{year}-01-01", end_date=f"{year}-12-31"),
+        lambda: get_member_work_hours_for_year(member_id, year),
+        lambda: get_member_work_hours_for_month(member_id, year, 1),
+        lambda: get_meeting_attendance(member_id, year=year),
+        lambda: get_meeting_attendance(member_id, meeting_date=f"{year}-01-01"),
+        lambda: count_member_attendance(member_id, year),
+        lambda: get_member_status_for_month(member_id, year, 1),
+        lambda: get_member_attendance_status(member_id, year, 1),
+    ]
+
+    statements = []
+    conn = get_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        for call in report_calls:
+            call()
+    finally:
+        conn.set_trace_callback(None)
+
+    failures = {}
+    for sql in statements:
+        if not sql.lstrip().upper().startswith(("SELECT", "WITH")):
+            continue
+        scanned = full_table_scans(sql) & set(INDEXED_REPORT_TABLES)
+        if scanned:
+            failures[sql] = sorted(scanned)
+    return failures
@@ -1,15 +1,27 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, font
+from abc import ABC, abstractmethod
+from tkinter import ttk, messagebox, filedialog, font, simpledialog
 import tkinter.font as tkFont
 import os, sys,tempfile, webbrowser, platform, subprocess
+import shutil
 import database
+import image_cache
+import import_member_data
+import import_meeting_data
+import report_data
+import report_renderer
+from member_search import MemberSearchIndex
+import sorting
+from virtual_tree import VirtualTreeview
 from datetime import datetime
 import csv
 import calendar
+import queue
+import threading
 #import pyperclip
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from PIL import Image, ImageTk
+import startup_timing
+# reportlab and PIL are imported where they are used, so neither loads
+# before the main window is on screen.
 
 
 DATE_FMT = "%m/%d/%Y"
@@ -52,6 +64,9 @@ def center_window(window, width=None, height=None, parent=None):
 
 
 class MemberApp:
+    LOGO_FILE = "Club_logo_smaller-removebg-preview.png"
+    LOGO_SIZE = 300
+
     TREE_COLUMNS = (
         "Badge", "Last Name", "First Name", "Membership Type",
         "Email Address", "Email Address 2", "Phone Number"
@@ -84,22 +99,23 @@ class MemberApp:
 
       
 
-        # ---- Window icon for titlebar (all platforms) ----
-        png_icon_path = os.path.join(self.base_dir, "Club_logo_smaller-removebg-preview.png")
-        if os.path.exists(png_icon_path):
-            try:
-                img = Image.open(png_icon_path)
-                img = img.resize((32, 32), Image.Resampling.LANCZOS)
-                self.tk_icon = ImageTk.PhotoImage(img)
-                self.root.iconphoto(True, self.tk_icon)  # Sets window icon (not taskbar)
-            except Exception as e:
-                print(f"Failed to set window icon: {e}")
-
+        # The window icon and tab watermarks are decoded after the first paint
+        # (see _finish_startup); resized copies are kept on disk between runs
+        self.images = image_cache.ImageCache(self.base_dir, disk_cache_dir=image_cache.DEFAULT_DISK_CACHE)
+        self._logo_canvases = []
+        self._startup_done = False
 
         self.recycle_bin_refresh_fn = None
         self.member_types = ["All", "Probationary", "Associate", "Active", "Life",
                              "Prospective", "Wait List", "Former"]
         self.trees = {}
+        self.search_index = MemberSearchIndex()
+        self._search_after_id = None
+        self._search_matches = None
+        # Tabs are filled from self._members when first shown; a data change
+        # refreshes the visible tab and only marks the others dirty.
+        self._members = {}
+        self._dirty_tabs = set(self.member_types)
 
 
         # ----- Menubar -----
@@ -138,7 +154,7 @@ class MemberApp:
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side="left", padx=5)
         search_entry.bind("<KeyRelease>", self._on_search)
-        ttk.Button(search_frame, text="Clear", command=lambda: [self.search_var.set(""), self.load_data()]).pack(side="left", padx=5)
+        ttk.Button(search_frame, text="Clear", command=self._clear_search).pack(side="left", padx=5)
 
         # ----- Notebook -----
         style = ttk.Style()
@@ -147,7 +163,13 @@ class MemberApp:
         self.notebook.pack(fill="both", expand=True)
 
         self._build_member_tabs()
-        self.load_data()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # Members are loaded once the window has painted, so it appears
+        # straight away; the <Expose> binding is removed after the first one
+        self.root.bind("<Expose>", self._on_first_paint, add="+")
+        self.root.after(500, self._finish_startup)
+        # Adds, edits, deletes and restores patch the affected rows directly
+        database.add_member_listener(self._on_member_changed)
 
         # Right-click menu
         self.row_menu = tk.Menu(self.root, tearoff=0)
@@ -171,6 +193,46 @@ class MemberApp:
 
         resize_tabs()
         self.notebook.bind("<Configure>", resize_tabs)
+        startup_timing.mark("window built")
+
+    # ---------- Startup ----------
+    def _on_first_paint(self, event=None):
+        self.root.unbind("<Expose>")
+        startup_timing.mark("first paint")
+        self.root.after_idle(self._finish_startup)
+
+    def _finish_startup(self):
+        if self._startup_done:
+            return
+        self._startup_done = True
+        self.load_data()
+        startup_timing.mark("first data load")
+        self._load_images()
+        startup_timing.mark("images loaded")
+        startup_timing.report(self.root)
+
+    def _load_images(self):
+        """Set the window icon and draw the logo watermark behind each tab's tree."""
+        # ---- Window icon for titlebar (all platforms) ----
+        if os.path.exists(os.path.join(self.base_dir, self.LOGO_FILE)):
+            try:
+                self.tk_icon = self.images.photo(self.LOGO_FILE, (32, 32), master=self.root)
+                self.root.iconphoto(True, self.tk_icon)  # Sets window icon (not taskbar)
+            except Exception as e:
+                print(f"Failed to set window icon: {e}")
+
+        # One decoded, resized logo shared by every tab's canvas
+        self.logo_tk = self.images.photo(self.LOGO_FILE, (self.LOGO_SIZE, self.LOGO_SIZE), master=self.root)
+        for canvas in self._logo_canvases:
+            canvas.create_image(0, 0, image=self.logo_tk, anchor="nw", tags="logo")
+            self._center_logo(canvas)
+
+    def _center_logo(self, canvas):
+        canvas.coords(
+            "logo",
+            (canvas.winfo_width() // 2 - self.LOGO_SIZE // 2,
+            canvas.winfo_height() // 2 - self.LOGO_SIZE // 2)
+        )
 
     # ---------- Tabs ----------
     def _build_member_tabs(self):
@@ -191,28 +253,14 @@ class MemberApp:
         canvas = tk.Canvas(container, bg="white")
         canvas.grid(row=0, column=0, sticky="nsew")
 
-        # Load and resize logo
-        logo_path = os.path.join(self.base_dir, "Club_logo_smaller-removebg-preview.png")  # adjust path/extension
-        logo_image = Image.open(logo_path)
-
-        # Pillow 10+ safe resampling
-        try:
-            resample = Image.Resampling.LANCZOS
-        except AttributeError:
-            resample = Image.ANTIALIAS
-
-        logo_image = logo_image.resize((300, 300), resample)
-        self.logo_tk = ImageTk.PhotoImage(logo_image)
-
-        # Draw logo centered
-        canvas.create_image(0, 0, image=self.logo_tk, anchor="nw", tags="logo")
+        self._logo_canvases.append(canvas)
 
-        # Treeview on top of canvas
-        tree = ttk.Treeview(container, columns=columns, show="headings", selectmode="extended")
+        # Treeview on top of canvas (rows are paged in as they scroll into view)
+        tree = VirtualTreeview(container, columns=columns, show="headings", selectmode="extended",
+                               column_kinds={"Badge": sorting.BADGE})
         tree.place(relx=0, rely=0, relwidth=1, relheight=1)  # overlay full container
 
         # Setup columns and headings
-        self._sort_column_states = {}
         for col in columns:
             tree.heading(col, text=col, command=lambda c=col, t=tree: self._sort_tree_column(t, c, False))
             tree.column(col, width=120, anchor="w")
@@ -227,14 +275,7 @@ class MemberApp:
         tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
 
         # Keep logo centered on resize
-        def resize_watermark(event):
-            canvas.coords(
-                "logo",
-                (canvas.winfo_width() // 2 - logo_image.width // 2,
-                canvas.winfo_height() // 2 - logo_image.height // 2)
-            )
-
-        container.bind("<Configure>", resize_watermark)
+        container.bind("<Configure>", lambda event: self._center_logo(canvas))
 
         return tree
 
@@ -242,39 +283,23 @@ class MemberApp:
 
     def _sort_tree_column(self, tree, col, reverse):
         """Sort tree contents by column and update header arrows."""
-        try:
-            # Get all rows and the values in the given column
-            data = [(tree.set(k, col), k) for k in tree.get_children("")]
-            
-            # Try converting values to numbers if possible, otherwise lowercase string
-            def try_convert(val):
-                try:
-                    return float(val)
-                except ValueError:
-                    return val.lower()
-            data.sort(key=lambda t: try_convert(t[0]), reverse=reverse)
-
-            # Rearrange items in sorted order
-            for index, (val, k) in enumerate(data):
-                tree.move(k, "", index)
+        # Sorts the whole row model, including rows hidden by the search
+        # filter or not yet paged into the tree
+        tree.sort_column(col, reverse=reverse)
 
-            # Reset all headings to plain text
-            for c in tree["columns"]:
-                tree.heading(c, text=c, command=lambda c=c, t=tree: self._sort_tree_column(t, c, False))
+        # Reset all headings to plain text
+        for c in tree["columns"]:
+            tree.heading(c, text=c, command=lambda c=c, t=tree: self._sort_tree_column(t, c, False))
 
-            # Add arrow to the sorted column
-            arrow = " ▲" if not reverse else " ▼"
-            tree.heading(col, text=col + arrow,
-                         command=lambda: self._sort_tree_column(tree, col, not reverse))
-
-        except Exception as e:
-            pass
-            #messagebox.showerror("Sort Error", f"Failed to sort column {col}: {e}")
+        # Add arrow to the sorted column
+        arrow = " ▲" if not reverse else " ▼"
+        tree.heading(col, text=col + arrow,
+                     command=lambda: self._sort_tree_column(tree, col, not reverse))
 
 
     # ---------- Member Management ----------
     def add_member(self):
-        form = NewMemberForm(self.root, on_save_callback=self.load_data)
+        form = NewMemberForm(self.root)
         self.root.wait_window(form.top)
 
     def edit_selected(self):
@@ -301,7 +326,6 @@ class MemberApp:
             for sel in selected:
                 member_id = sel
                 database.soft_delete_member_by_id(member_id)
-            self.load_data()
             if self.recycle_bin_refresh_fn:
                 self.recycle_bin_refresh_fn()
 
@@ -318,7 +342,6 @@ class MemberApp:
         if confirm:
             for member_id in selected:
                 database.soft_delete_member_by_id(member_id)
-            self.load_data()
             if self.recycle_bin_refresh_fn:
                 self.recycle_bin_refresh_fn()
 
@@ -327,7 +350,6 @@ class MemberApp:
         return MemberForm(
             self.root,
             member_id,
-            on_save_callback=lambda mid: self.load_data(),  # wrap in lambda
             select_tab=select_tab
         )
 
@@ -580,6 +602,8 @@ class MemberApp:
             )
             if path:
                 try:
+                    from reportlab.lib.pagesizes import letter
+                    from reportlab.pdfgen import canvas
                     c = canvas.Canvas(path, pagesize=letter)
                     width, height = letter
                     c.setFont("Courier", 10)
@@ -652,6 +676,8 @@ class MemberApp:
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
                     path = tmp.name
 
+                from reportlab.lib.pagesizes import letter
+                from reportlab.pdfgen import canvas
                 c = canvas.Canvas(path, pagesize=letter)
                 width, height = letter
                 c.setFont("Courier", 10)
@@ -683,22 +709,13 @@ class MemberApp:
     def _export_emails_for_mail_merge(self):
         current_tab = self.notebook.tab(self.notebook.select(), "text")
         tree = self.trees[current_tab]
-        items = tree.get_children()
+        items = tree.visible_ids()
         if not items:
             messagebox.showwarning("Mail Merge Export", "No members to export in this tab.")
             return
 
         try:
-            emails = []
-            for iid in items:
-                member = database.get_member_by_id(iid)
-                if member:
-                    primary = member[6] or ""
-                    secondary = member[13] or ""
-                    if primary.strip():
-                        emails.append(primary.strip())
-                    if secondary.strip():
-                        emails.append(secondary.strip())
+            emails = database.get_mail_merge_emails(items)
 
             if not emails:
                 messagebox.showinfo("Mail Merge Export", "No email addresses found for this tab.")
@@ -744,20 +761,75 @@ class MemberApp:
                 
     # ---------- Load Members ----------
     def load_data(self):
-        for tree in self.trees.values():
-            tree.delete(*tree.get_children())
         try:
             members = database.get_all_members()
         except Exception as e:
             messagebox.showerror("Database Error", f"Failed to load members: {e}")
             return
 
-        for m in members:
-            row_values = [m[1], m[4], m[3], m[2], m[6], m[13], m[7]]
-            self.trees["All"].insert("", "end", iid=str(m[0]), values=row_values)
-            mt_tree = self.trees.get(m[2])
-            if mt_tree:
-                mt_tree.insert("", "end", iid=str(m[0]), values=row_values)
+        self._members = {str(m[0]): m for m in members}
+        self.search_index.build(members)
+        self._search_matches = self.search_index.search(self.search_var.get())
+        self._dirty_tabs = set(self.trees)
+        self._populate_tab(self._current_tab())
+
+    def _current_tab(self):
+        return self.notebook.tab(self.notebook.select(), "text")
+
+    def _populate_tab(self, mtype):
+        """Fill one tab's tree from the loaded members if it is out of date."""
+        if mtype not in self._dirty_tabs:
+            return
+        tree = self.trees[mtype]
+        tree.load(
+            (iid, self._tree_values(m))
+            for iid, m in self._members.items()
+            if mtype == "All" or m[2] == mtype
+        )
+        self._apply_search_filter(tree)
+        self._dirty_tabs.discard(mtype)
+
+    @staticmethod
+    def _tree_values(m):
+        return [m[1], m[4], m[3], m[2], m[6], m[13], m[7]]
+
+    def _on_member_changed(self, action, member_id):
+        """Patch one member's rows in the populated tabs after a write."""
+        if action == database.MEMBERS_IMPORTED:
+            self.load_data()
+            return
+        iid = str(member_id)
+        member = None
+        if action != database.MEMBER_DELETED:
+            member = database.get_member_by_id(member_id)
+            if member is not None and member["deleted"]:
+                member = None
+
+        if member is None:
+            self._members.pop(iid, None)
+            self.search_index.remove(iid)
+        else:
+            self._members[iid] = member
+            self.search_index.update(member)
+
+        query = self.search_var.get()
+        matches = member is not None and self.search_index.matches(iid, query)
+        if self._search_matches is not None:
+            if matches:
+                self._search_matches.add(iid)
+            else:
+                self._search_matches.discard(iid)
+
+        for mtype, tree in self.trees.items():
+            if mtype in self._dirty_tabs:
+                continue  # rebuilt from self._members when next shown
+            if member is not None and (mtype == "All" or member[2] == mtype):
+                tree.set_row(iid, self._tree_values(member), matches_filter=matches)
+            else:
+                tree.remove_row(iid)
+
+    def _on_tab_changed(self, event=None):
+        self._populate_tab(self._current_tab())
 
     # ---------- Double click ----------
     def _on_tree_double_click(self, event):
@@ -772,65 +844,30 @@ class MemberApp:
     def _print_members(self):
         current_tab = self.notebook.tab(self.notebook.select(), "text")
         tree = self.trees[current_tab]
-        items = tree.get_children()
+        items = tree.visible_ids()
         if not items:
             messagebox.showwarning("Print", "No members to print in this view.")
             return
 
-        org_name = "Dug Hill Rod & Gun Club"
-        report_name = f"Member List - {current_tab}\n"
-        generation_dt = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-        generated_text = f"Generated: {generation_dt}"
-
         # remove Email2 / Email Address 2
         print_columns = [c for c in self.TREE_COLUMNS if c.lower() not in ("email2", "email address 2")]
         headers = [tree.heading(c)["text"] for c in print_columns]
+        indexes = [self.TREE_COLUMNS.index(col) for col in print_columns]
 
-        col_widths = [len(h) for h in headers]
-        for idx, col in enumerate(print_columns):
+        def print_rows():
             for item in items:
-                value = str(tree.item(item, "values")[self.TREE_COLUMNS.index(col)])
-                if len(value) > col_widths[idx]:
-                    col_widths[idx] = len(value)
-
-        # build rows with proper justification
-        rows = []
-        for item in items:
-            values = tree.item(item, "values")
-            row = []
-            for idx, col in enumerate(print_columns):
-                value = str(values[self.TREE_COLUMNS.index(col)])
-                if col == "Badge":
-                    row.append(value.ljust(col_widths[idx]))
-                elif "phone" in col.lower():
-                    row.append(value.rjust(col_widths[idx]))
-                else:
-                    row.append(value.ljust(col_widths[idx]))
-            rows.append("  ".join(row))
-
-        # pagination
-        lines_per_page = 40
-        total_pages = (len(rows) - 1) // lines_per_page + 1
-        pages = [rows[i:i + lines_per_page] for i in range(0, len(rows), lines_per_page)]
-
-        header_line = "  ".join(
-            [h.center(col_widths[idx]) if print_columns[idx] == "Badge" else h.ljust(col_widths[idx])
-            for idx, h in enumerate(headers)]
-        )
-        total_members_text = f"Total Members: {len(items)}".center(len(header_line))
-
-        preview_text = ""
-        for current_page, page_lines in enumerate(pages, start=1):
-            preview_text += f"{org_name.center(len(header_line))}\n"
-            preview_text += f"{report_name.center(len(header_line))}\n"
-            preview_text += header_line + "\n"
-            preview_text += "-" * len(header_line) + "\n"
-            preview_text += "\n".join(page_lines) + "\n\n"
-            preview_text += ("=" * len(header_line)) + "\n"
-            preview_text += total_members_text + "\n"
-            preview_text += f"{generated_text.center(len(header_line))}\n"
-            preview_text += f"Page {current_page} of {total_pages}".center(len(header_line)) + "\n"
-            preview_text += ("=" * len(header_line)) + "\n\n"
+                values = tree.row_values(item)
+                yield [values[i] for i in indexes]
+
+        report = report_renderer.ReportTable(
+            f"Member List - {current_tab}",
+            headers,
+            print_rows,
+            align={idx: "RIGHT" for idx, col in enumerate(print_columns) if "phone" in col.lower()},
+            footer_lines=[f"Total Members: {len(items)}"],
+        ).snapshot()
+        render_key = ("Member List", current_tab)
+        RENDER_QUEUE.render(report, render_key)
 
         # Preview window
         preview = tk.Toplevel(self.root)
@@ -838,18 +875,14 @@ class MemberApp:
         preview.transient()
         preview.focus_set()
 
-        preview.update_idletasks()
-
-        text_width = max(len(line) for line in preview_text.splitlines()) if preview_text else 85
-        text_height = min(len(preview_text.splitlines()), 50)
-        win_width = min(1200, text_width * 8) + 50
-        win_height = min(900, text_height * 18) + 100
-        center_window(preview, width=win_width, height=win_height, parent=self.root)
-
         text_frame = ttk.Frame(preview)
         text_frame.pack(fill="both", expand=True)
         text = tk.Text(text_frame, wrap="none", font=("Courier New", 10))
-        text.insert("1.0", preview_text)
+        text_width = line_count = 0
+        for line in report_renderer.iter_preview_lines(report):
+            text.insert("end", line + "\n")
+            text_width = max(text_width, len(line))
+            line_count += 1
         text.configure(state="disabled")
         text.pack(fill="both", expand=True, side="left")
         yscroll = ttk.Scrollbar(text_frame, orient="vertical", command=text.yview)
@@ -859,41 +892,19 @@ class MemberApp:
         xscroll.pack(side="bottom", fill="x")
         text.configure(xscrollcommand=xscroll.set)
 
+        win_width = min(1200, text_width * 8) + 50
+        win_height = min(900, min(line_count, 50) * 18) + 100
+        center_window(preview, width=win_width, height=win_height, parent=self.root)
+
         btn_frame = ttk.Frame(preview)
         btn_frame.pack(fill="x", pady=5)
 
-        # PDF export helper
-        def export_to_pdf(filepath):
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
-            c = canvas.Canvas(filepath, pagesize=letter)
-            width, height = letter
-            c.setFont("Courier", 10)
-            y = height - 50
-            for line in preview_text.splitlines():
-                c.drawString(50, y, line)
-                y -= 12
-                if y < 50:
-                    c.showPage()
-                    c.setFont("Courier", 10)
-                    y = height - 50
-            c.save()
-
-        # Print opens temporary PDF
+        # Print opens the rendered PDF
         def print_text():
-            import tempfile, os
-            try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                    pdf_path = tmp.name
-                export_to_pdf(pdf_path)
-                os.startfile(pdf_path)
-            except Exception as e:
-                messagebox.showerror("Print Error", f"Failed to open PDF: {e}")
+            render_report_pdf(self.root, report, render_key, os.startfile, "Print Error")
 
         # Save as PDF with auto filename
         def save_as_pdf():
-            from tkinter import filedialog
-            import os
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             default_name = f"Member_List-{current_tab}-{timestamp}.pdf"
             filepath = filedialog.asksaveasfilename(
@@ -902,13 +913,15 @@ class MemberApp:
                 filetypes=[("PDF files", "*.pdf")],
                 title="Save Member List as PDF"
             )
-            if filepath:
-                try:
-                    export_to_pdf(filepath)
-                    os.startfile(filepath)
-                    messagebox.showinfo("Save PDF", f"PDF saved successfully:\n{filepath}")
-                except Exception as e:
-                    messagebox.showerror("Save Error", f"Failed to save PDF: {e}")
+            if not filepath:
+                return
+
+            def saved(pdf_path):
+                shutil.copyfile(pdf_path, filepath)
+                os.startfile(filepath)
+                messagebox.showinfo("Save PDF", f"PDF saved successfully:\n{filepath}")
+
+            render_report_pdf(self.root, report, render_key, saved, "Save Error")
 
         # Save CSV raw
         def save_as_csv():
@@ -928,7 +941,7 @@ class MemberApp:
                         writer = csv.writer(f)
                         writer.writerow(headers)
                         for item in items:
-                            values = tree.item(item, "values")
+                            values = tree.row_values(item)
                             row = [values[self.TREE_COLUMNS.index(col)] for col in print_columns]
                             writer.writerow(row)
                     messagebox.showinfo("Save CSV", f"CSV saved successfully:\n{filepath}")
@@ -943,20 +956,30 @@ class MemberApp:
 
 
     # ---------- Search ----------
+    # Keystrokes are debounced; the search itself runs against the in-memory
+    # index and only detaches/reattaches rows that are already in the trees.
+    SEARCH_DELAY_MS = 150
+
     def _on_search(self, event=None):
-        search_text = self.search_var.get().lower()
-        current_tab = self.notebook.tab(self.notebook.select(), "text")
-        tree = self.trees[current_tab]
-        tree.delete(*tree.get_children())
-        try:
-            members = database.get_all_members()
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Failed to load members: {e}")
-            return
-        for m in members:
-            row_values = [m[1], m[4], m[3], m[2], m[6], m[13], m[7]]
-            if any(search_text in str(val).lower() for val in row_values):
-                tree.insert("", "end", iid=str(m[0]), values=row_values)
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(self.SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
+        self._search_matches = self.search_index.search(self.search_var.get())
+        # Dirty tabs pick up the filter when they are next populated.
+        for mtype, tree in self.trees.items():
+            if mtype not in self._dirty_tabs:
+                self._apply_search_filter(tree)
+
+    def _apply_search_filter(self, tree):
+        """Show the rows of tree that match the current search, in row order."""
+        tree.set_filter(self._search_matches)
+
+    def _clear_search(self):
+        self.search_var.set("")
+        self._run_search()
 
     # ---------- Settings ----------
     def open_settings(self):
@@ -981,7 +1004,7 @@ class MemberApp:
 
         try:
             tree = self.trees[current_tab]
-            items = tree.get_children()
+            items = tree.visible_ids()
             if not items:
                 messagebox.showwarning("Export", "No members to export in this tab.")
                 return
@@ -989,18 +1012,8 @@ class MemberApp:
             with open(path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 writer.writerow(self.FULL_COLUMNS)
-
-                for iid in items:
-                    # Fetch full member data from database for each displayed row
-                    member = database.get_member_by_id(iid)
-                    if member:
-                        row_values = [
-                            member[1], member[2], member[3], member[4], member[5],
-                            member[6], member[13], member[7], member[8], member[9],
-                            member[10], member[11], member[12], member[14], member[15],
-                            member[16]
-                        ]
-                        writer.writerow(row_values)
+                # Full member rows for the displayed ids, streamed in one query
+                writer.writerows(database.iter_member_export_rows(items))
 
             #messagebox.showinfo("Export Complete",
             #d                    f"Exported {len(items)} members from '{current_tab}' to:\n{path}")
@@ -1016,48 +1029,34 @@ class MemberApp:
         if not file_path:
             return
 
-        imported_count = 0
-        skipped_count = 0
+        # Yes = overwrite members whose badge already exists, No = skip them
+        update_existing = messagebox.askyesnocancel(
+            "Import Members",
+            "Update existing members that have the same badge number?\n\n"
+            "Yes: overwrite them with the CSV values\nNo: skip them"
+        )
+        if update_existing is None:
+            return
 
         try:
-            with open(file_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    badge = row.get("Badge", "").strip()
-                    if not badge:
-                        continue  # skip rows without badge
-                    existing_member = database.get_member_by_badge(badge)
-                    if existing_member:
-                        skipped_count += 1
-                        continue
-
-                    # Map CSV columns to database order
-                    data = (
-                        badge,
-                        row.get("Membership Type", "").strip(),
-                        row.get("First Name", "").strip(),
-                        row.get("Last Name", "").strip(),
-                        row.get("Date of Birth", "").strip(),
-                        row.get("Email Address", "").strip(),
-                        row.get("Phone Number", "").strip(),
-                        row.get("Address", "").strip(),
-                        row.get("City", "").strip(),
-                        row.get("State", "").strip(),
-                        row.get("Zip Code", "").strip(),
-                        row.get("Join Date", "").strip(),
-                        row.get("Email Address 2", "").strip(),
-                        row.get("Sponsor", "").strip(),
-                        row.get("Card/Fob Internal Number", "").strip(),
-                        row.get("Card/Fob External Number", "").strip()
-                    )
-                    database.add_member(data)
-                    imported_count += 1
-
-            messagebox.showinfo(
-                "Import Complete",
-                f"Imported {imported_count} new members.\nSkipped {skipped_count} duplicates."
+            # A bulk import is announced once (MEMBERS_IMPORTED), which
+            # reloads the roster rather than patching it row by row
+            summary = import_member_data.import_members_from_csv(
+                file_path, on_duplicate="update" if update_existing else "skip"
             )
-            self.load_data()
+
+            message = (
+                f"Imported {summary['inserted']} new members.\n"
+                f"Updated {summary['updated']} existing members.\n"
+                f"Skipped {summary['skipped']} duplicates."
+            )
+            if summary["errors"]:
+                shown = "\n".join(f"Line {line}: {msg}" for line, msg in summary["errors"][:10])
+                more = len(summary["errors"]) - 10
+                if more > 0:
+                    shown += f"\n... and {more} more"
+                message += f"\n\n{summary['failed']} rows not imported:\n{shown}"
+            messagebox.showinfo("Import Complete", message)
 
         except Exception as e:
             messagebox.showerror("Import Error", f"Failed to import members:\n{e}")
@@ -1065,10 +1064,37 @@ class MemberApp:
             # ---------- Stubs ----------
             
     def _show_recycle_bin(self):
-        RecycleBinWindow(self.root, refresh_main_fn=self.load_data)
+        RecycleBinWindow(self.root)
     
     def _add_meeting_records_from_excel(self):
-        pass
+        file_path = filedialog.askopenfilename(
+            title="Import Meeting Data",
+            filetypes=[("Attendance Files", "*.xlsx *.xls *.csv"),
+                       ("Excel Files", "*.xlsx *.xls"), ("Scanner CSV", "*.csv")]
+        )
+        if not file_path:
+            return
+
+        is_csv = file_path.lower().endswith(".csv")
+        today = datetime.now().strftime("%Y-%m-%d")
+        prompt = "Meeting date (YYYY-MM-DD):"
+        if is_csv:
+            prompt += "\nLeave blank to use each swipe's timestamp."
+        meeting_date = simpledialog.askstring(
+            "Import Meeting Data", prompt,
+            initialvalue="" if is_csv else today, parent=self.root
+        )
+        if meeting_date is None:
+            return
+        meeting_date = meeting_date.strip() or (None if is_csv else today)
+        if meeting_date:
+            try:
+                datetime.strptime(meeting_date, "%Y-%m-%d")
+            except ValueError:
+                messagebox.showerror("Import Meeting Data", "Please enter the date as YYYY-MM-DD.")
+                return
+
+        MeetingImportWindow(self.root, file_path, meeting_date)
 
 
 class NewMemberForm:
@@ -1302,6 +1328,179 @@ class RecycleBinWindow:
             self.row_menu.unpost()
 
 
+class MeetingImportWindow(tk.Toplevel):
+    """
+    Runs a meeting-data import on a worker thread with a progress bar.
+
+    The worker never touches Tk: it posts progress and the result to a queue
+    that the window drains with after(), so the main window stays responsive
+    however large the sheet is.
+    """
+    POLL_MS = 100
+
+    def __init__(self, parent, file_path, meeting_date):
+        super().__init__(parent)
+        self.title("Import Meeting Data")
+        center_window(self, 420, 150, parent)
+        self.transient(parent)
+        self.resizable(False, False)
+
+        self.file_path = file_path
+        self.meeting_date = meeting_date
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+
+        tk.Label(self, text=f"Importing {os.path.basename(file_path)}").pack(pady=(15, 5))
+        self.progress = ttk.Progressbar(self, length=360, mode="determinate")
+        self.progress.pack(pady=5)
+        self.status_var = tk.StringVar(value="Reading file...")
+        tk.Label(self, textvariable=self.status_var).pack()
+        self.cancel_button = ttk.Button(self, text="Cancel", command=self._cancel)
+        self.cancel_button.pack(pady=10)
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        threading.Thread(target=self._run_import, daemon=True).start()
+        self.after(self.POLL_MS, self._poll)
+
+    # ---------- Worker thread ----------
+    def _run_import(self):
+        try:
+            result = import_meeting_data.import_meeting_file(
+                self.file_path,
+                meeting_date=self.meeting_date,
+                status=STATUS_OPTIONS[0],
+                progress=lambda done, total: self.messages.put(("progress", done, total)),
+                cancel=self.cancel_event,
+            )
+            self.messages.put(("done", result))
+        except import_meeting_data.ImportCancelled:
+            self.messages.put(("cancelled",))
+        except Exception as e:
+            self.messages.put(("error", str(e)))
+
+    # ---------- Main thread ----------
+    def _poll(self):
+        try:
+            while True:
+                message = self.messages.get_nowait()
+                kind = message[0]
+                if kind == "progress":
+                    _, done, total = message
+                    self.progress["maximum"] = max(total, 1)
+                    self.progress["value"] = min(done, total)
+                    self.status_var.set(f"{min(done, total)} of {total} rows")
+                else:
+                    self._finish(message)
+                    return
+        except queue.Empty:
+            pass
+        self.after(self.POLL_MS, self._poll)
+
+    def _cancel(self):
+        self.cancel_event.set()
+        self.status_var.set("Cancelling...")
+        self.cancel_button.config(state="disabled")
+
+    def _finish(self, message):
+        kind = message[0]
+        self.destroy()
+        if kind == "cancelled":
+            messagebox.showinfo("Import Meeting Data", "Import cancelled. No attendance was recorded.")
+        elif kind == "error":
+            messagebox.showerror("Import Meeting Data", f"Failed to import meeting data:\n{message[1]}")
+        else:
+            result = message[1]
+            cards = [row["card"] for row in result["unmatched"]]
+            text = (
+                f"Added {result['added']} attendance records.\n"
+                f"Skipped {result['skipped']} already recorded.\n"
+                f"Unmatched cards: {len(cards)}"
+            )
+            if cards:
+                text += "\n" + ", ".join(cards[:15]) + (" ..." if len(cards) > 15 else "")
+            if result.get("errors"):
+                text += f"\nUnreadable rows: {len(result['errors'])}"
+            messagebox.showinfo("Import Meeting Data", text)
+
+
+# ---------- PDF rendering ----------
+# Every Print / Save as PDF button renders through one background queue. The
+# last PDF for each report and filter is kept, so a repeat Print is instant.
+RENDER_QUEUE = report_renderer.RenderQueue()
+
+
+def render_report_pdf(parent, report, key, on_done, title="Print Report"):
+    """
+    Render a report snapshot to PDF off the Tk thread, then call
+    on_done(pdf_path) on the Tk thread. Shows a progress window if the PDF
+    is not already rendered.
+    """
+    job = RENDER_QUEUE.render(report, key)
+    if job.done.is_set():
+        _finish_render(job, on_done, title)
+    else:
+        PdfRenderWindow(parent, job, on_done, title)
+
+
+def _finish_render(job, on_done, title):
+    if isinstance(job.error, report_renderer.RenderCancelled):
+        return
+    if job.error is not None:
+        messagebox.showerror(title, f"Failed to create PDF: {job.error}")
+        return
+    try:
+        on_done(job.path)
+    except Exception as e:
+        messagebox.showerror(title, f"Failed to open PDF: {e}")
+
+
+class PdfRenderWindow(tk.Toplevel):
+    """
+    Progress for a RenderJob; polls it with after() and then finishes it.
+    Cancel (or closing the window) cancels the job and drops its callback.
+    """
+    POLL_MS = 100
+
+    def __init__(self, parent, job, on_done, title):
+        super().__init__(parent)
+        self.title(title)
+        center_window(self, 320, 140, parent.winfo_toplevel())
+        self.transient(parent.winfo_toplevel())
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        self.job = job
+        self.on_done = on_done
+        self.job_title = title
+
+        tk.Label(self, text="Creating PDF...").pack(pady=(15, 5))
+        self.progress = ttk.Progressbar(self, length=260, mode="determinate")
+        self.progress.pack(pady=5)
+        self.status_var = tk.StringVar(value="")
+        tk.Label(self, textvariable=self.status_var).pack()
+        tk.Button(self, text="Cancel", command=self._cancel).pack(pady=(5, 0))
+
+        self._after_id = self.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        job = self.job
+        if job.done.is_set():
+            self.destroy()
+            _finish_render(job, self.on_done, self.job_title)
+            return
+        if job.total_pages:
+            self.progress["maximum"] = job.total_pages
+            self.progress["value"] = job.pages_done
+            self.status_var.set(f"Page {job.pages_done} of {job.total_pages}")
+        self._after_id = self.after(self.POLL_MS, self._poll)
+
+    def _cancel(self):
+        self.after_cancel(self._after_id)
+        self.job.cancel()
+        self.on_done = None
+        self.destroy()
+
+
 class SettingsWindow(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent)
@@ -1369,11 +1568,13 @@ class SettingsWindow(tk.Toplevel):
 
     def save_settings(self):
         try:
-            database.set_setting("dues_probationary", int(self.prob_var.get()))
-            database.set_setting("dues_associate", int(self.assoc_var.get()))
-            database.set_setting("dues_active", int(self.active_var.get()))
-            database.set_setting("dues_life", 0)  # Life dues fixed/disabled
-            database.set_setting("default_year", int(self.year_var.get()))
+            database.set_settings({
+                "dues_probationary": int(self.prob_var.get()),
+                "dues_associate": int(self.assoc_var.get()),
+                "dues_active": int(self.active_var.get()),
+                "dues_life": 0,  # Life dues fixed/disabled
+                "default_year": int(self.year_var.get()),
+            })
             messagebox.showinfo("Saved", "Settings have been updated.")
             self.destroy()
         except ValueError:
@@ -2472,21 +2673,24 @@ class ReportsWindow(tk.Toplevel):
         
     
 # ---------------- BaseReport ---------------- #
-class BaseReport(tk.Frame):
+class BaseReport(tk.Frame, ABC):
+    """
+    A filterable report. Subclasses describe their columns and fetch typed
+    rows; each filter change builds one report_data.ReportDataset that the
+    tree, CSV export, print preview and PDF all render from.
+    """
+    PREVIEW_WIDTH = 725
+
     def __init__(self, parent, member_id=None, include_month=True):
         super().__init__(parent)
         self.member_id = member_id
         self.include_month = include_month
         self.tree = None
+        self.tree_frame = None
+        self.dataset = None
+        self._sort = None  # (column key, reverse) of the last heading click
 
-        try:
-            default_year = database.get_setting("default_year")
-            if default_year is None:
-                default_year = datetime.now().year
-        except Exception:
-            default_year = datetime.now().year
-
-        self.year_var = tk.IntVar(value=int(default_year))
+        self.year_var = tk.IntVar(value=database.get_default_year())
         self.month_var = tk.StringVar(value="All")
         self.exclude_names_var = tk.BooleanVar(value=False)
 
@@ -2525,11 +2729,79 @@ class BaseReport(tk.Frame):
         filename = "".join(c for c in filename if c not in r'\/:*?"<>|')
         return filename
 
-    def export_csv(self):
+    # ---------- Data ----------
+    @abstractmethod
+    def _report_columns(self):
+        """report_data.ReportColumn list for the current filters."""
+
+    @abstractmethod
+    def _fetch_rows(self):
+        """Typed row tuples for the current filters, in column order."""
+
+    def _filters(self):
+        return {"year": self.year_var.get(), "month": self.month_var.get()}
+
+    def build_dataset(self):
+        return report_data.ReportDataset(self._report_columns(), self._fetch_rows(), self._filters())
+
+    def populate_report(self):
         if self.tree is None:
             return
-        items = self.tree.get_children()
-        if not items:
+        self.dataset = self.build_dataset()
+        if self._sort is not None and self._sort[0] in self.dataset.keys:
+            self.dataset.sort(*self._sort)
+        self.tree.delete(*self.tree.get_children())
+        for row_id, values in self.dataset.display_rows():
+            self.tree.insert("", "end", iid=row_id, values=values)
+        self._update_headings()
+
+    # ---------- Tree ----------
+    def _create_tree(self):
+        if self.tree_frame is not None:
+            self.tree_frame.destroy()
+        self.tree_frame = tk.Frame(self)
+        self.tree_frame.pack(fill="both", expand=True, pady=5)
+
+        columns = self._report_columns()
+        self.columns = tuple(col.key for col in columns)
+        self._sort = None
+        self.tree = ttk.Treeview(self.tree_frame, columns=self.columns, show="headings")
+        vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
+        hsb = ttk.Scrollbar(self.tree_frame, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+        self.tree_frame.grid_rowconfigure(0, weight=1)
+        self.tree_frame.grid_columnconfigure(0, weight=1)
+
+        for col in columns:
+            self.tree.heading(col.key, text=col.heading, command=lambda c=col.key: self._sort_column(c))
+            self.tree.column(col.key, width=col.width, anchor=report_data.TREE_ANCHORS[col.align], stretch=True)
+        self.tree.bind("<Double-1>", self._on_row_double_click)
+
+    def _sort_column(self, col):
+        """Sort by col (reversing on a repeat click) and reorder the tree in one call."""
+        if self.dataset is None:
+            return
+        reverse = self._sort is not None and self._sort == (col, False)
+        self._sort = (col, reverse)
+        self.dataset.sort(col, reverse)
+        self.tree.set_children("", *self.dataset.order)
+        self._update_headings()
+
+    def _update_headings(self):
+        for col in self.dataset.columns:
+            text = col.heading
+            if self._sort is not None and self._sort[0] == col.key:
+                text += " ▼" if self._sort[1] else " ▲"
+            self.tree.heading(col.key, text=text)
+
+    # ---------- Export ----------
+    def export_csv(self):
+        if self.dataset is None:
+            return
+        if not len(self.dataset):
             messagebox.showwarning("Export CSV", "No data to export.")
             return
         default_name = self._get_default_filename(".csv")
@@ -2542,115 +2814,49 @@ class BaseReport(tk.Frame):
             return
         try:
             with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([c.replace("_", " ").title() for c in self.columns])
-                for item in items:
-                    writer.writerow(self.tree.item(item, "values"))
+                self.dataset.write_csv(csv.writer(f))
             messagebox.showinfo("Export CSV", f"CSV exported successfully to {path}")
         except Exception as e:
             messagebox.showerror("Export CSV", f"Failed to export CSV: {e}")
 
+    # ---------- Printing ----------
+    def _print_title(self):
+        return self.__class__.__name__.replace("Report", " Report")
+
+    def _print_subtitles(self):
+        return []
+
+    def _report_table(self):
+        return self.dataset.report_table(
+            self._print_title(),
+            self._print_subtitles(),
+            mask_column=1 if self.exclude_names_var.get() else None,
+        )
+
     def print_report(self):
-        if self.tree is None:
+        if self.dataset is None:
             return
-        items = self.tree.get_children()
-        if not items:
+        if not len(self.dataset):
             messagebox.showinfo("Print Report", "No data to print.")
             return
 
-        report_name = self.__class__.__name__.replace("Report", " Report")
-        generation_dt = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-        headers = [c.replace("_", " ").title() for c in self.columns]
-
-        col_widths = [len(h) for h in headers]
-        for idx, col in enumerate(self.columns):
-            for item in items:
-                val = str(self.tree.item(item, "values")[idx])
-                if len(val) > col_widths[idx]:
-                    col_widths[idx] = len(val)
-        col_widths = [w + 2 for w in col_widths]
-
-        def format_val(col, val, width):
-            val = "" if val is None else str(val)
-            if col in ("badge", "badge_number", "roles", "terms"):
-                return f"{val:^{width}}"
-            else:
-                return f"{val:<{width}}"
-
-        def format_row(values):
-            return " ".join(format_val(c, v, w) for c, v, w in zip(self.columns, values, col_widths))
-
-        lines_per_page = 40
-        pages, current_lines = [], []
-
-        def add_header():
-            total_width = sum(col_widths) + (len(col_widths) - 1)
-            current_lines.append("Dug Hill Rod & Gun Club".center(total_width))
-            current_lines.append(report_name.center(total_width))
-            current_lines.append("=" * total_width)
-            current_lines.append(format_row(headers))
-            current_lines.append("-" * total_width)
-
-        add_header()
-        row_count = 0
-        for item in items:
-            row = list(self.tree.item(item, "values"))
-            if self.exclude_names_var.get() and len(row) > 1:
-                row[1] = "*****"
-            current_lines.append(format_row(row))
-            row_count += 1
-            if row_count >= lines_per_page - 6:
-                pages.append(current_lines)
-                current_lines = []
-                row_count = 0
-                add_header()
-        if current_lines:
-            pages.append(current_lines)
-
-        total_pages = len(pages)
-        for i, page_lines in enumerate(pages, start=1):
-            footer_width = sum(col_widths) + (len(col_widths) - 1)
-            page_lines.append("=" * footer_width)
-            page_lines.append(f"Generated: {generation_dt}".center(footer_width))
-            page_lines.append(f"Page {i} of {total_pages}".center(footer_width))
-            page_lines.append("End of Report".center(footer_width))
-
-        full_text = "\n\n".join("\n".join(p) for p in pages)
-
-        def generate_pdf(path, full_text):
-            from reportlab.lib.pagesizes import letter
-            from reportlab.pdfgen import canvas
-
-            c = canvas.Canvas(path, pagesize=letter)
-            c.setFont("Courier", 10)
-            width, height = letter
-            margin = 50
-            usable_width = width - (2 * margin)
-            char_width = c.stringWidth("M", "Courier", 10)
-            max_chars = int(usable_width // char_width)
-            y = height - margin
-            line_height = 12
-            for line in full_text.split("\n"):
-                padded = line.ljust(max_chars)
-                c.drawString(margin, y, padded)
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    c.setFont("Courier", 10)
-                    y = height - margin
-            c.save()
+        report = self._report_table().snapshot()
+        render_key = (self.__class__.__name__, report.title, tuple(report.subtitles), report.mask_column)
+        # Start on the PDF while the preview is read, so Print is usually instant
+        RENDER_QUEUE.render(report, render_key)
 
-        parent_window = self.winfo_toplevel()
         print_window = tk.Toplevel(self)
-        print_window.title(f"{report_name} - Print Preview")
-        print_window.transient(parent_window)
+        print_window.title(f"{report.title} - Print Preview")
+        center_window(print_window, width=self.PREVIEW_WIDTH, height=600, parent=self.winfo_toplevel())
+        print_window.transient(self.winfo_toplevel())
         print_window.focus_set()
 
         frame = tk.Frame(print_window)
         frame.pack(fill="both", expand=True)
 
         text = tk.Text(frame, wrap="none", font=("Courier", 10))
-        text.insert("1.0", full_text)
+        for line in report_renderer.iter_preview_lines(report):
+            text.insert("end", line + "\n")
         text.config(state="disabled")
         text.grid(row=0, column=0, sticky="nsew")
 
@@ -2675,13 +2881,15 @@ class BaseReport(tk.Frame):
             )
             if not path:
                 return
-            generate_pdf(path, full_text)
-            messagebox.showinfo("Save as PDF", f"PDF saved to {path}")
+
+            def saved(pdf_path):
+                shutil.copyfile(pdf_path, path)
+                messagebox.showinfo("Save as PDF", f"PDF saved to {path}")
+
+            render_report_pdf(self, report, render_key, saved, "Save as PDF")
 
         def print_to_pdf():
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            generate_pdf(tmp.name, full_text)
-            webbrowser.open_new(tmp.name)
+            render_report_pdf(self, report, render_key, webbrowser.open_new, "Print Report")
 
         tk.Button(btn_frame, text="Print", command=print_to_pdf).pack(side="left", padx=5)
         tk.Button(btn_frame, text="Save as PDF", command=save_as_pdf).pack(side="left", padx=5)
@@ -2692,11 +2900,7 @@ class BaseReport(tk.Frame):
         item_id = self.tree.identify_row(event.y)
         if not item_id:
             return
-        values = self.tree.item(item_id, "values")
-        if not values:
-            return
-
-        badge_or_member_id = values[0]
+        badge_or_member_id = self.dataset.row(item_id)[0]
         member_id = database.get_member_id_from_badge(badge_or_member_id)
         if member_id is None:
             return
@@ -2711,327 +2915,62 @@ class BaseReport(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Could not open member form: {e}")
 
-    def populate_report(self):
-        raise NotImplementedError
-
 
 # ---------------- DuesReport ---------------- #
 class DuesReport(BaseReport):
+    PREVIEW_WIDTH = 800
+
     def __init__(self, parent, member_id=None):
-        self.columns = ("badge", "name", "membership_type", "amount_due", "balance_due",
-                        "year", "last_payment_date", "amount_paid", "method")
-        self.column_widths = (80, 150, 105, 90, 90, 60, 120, 90, 90)
         super().__init__(parent, member_id, include_month=False)
         self._create_tree()
         self.populate_report()
-        self.tree.bind("<Double-1>", self._on_row_double_click)
-
-
-    def _create_tree(self):
-        frame = tk.Frame(self)
-        frame.pack(fill="both", expand=True, pady=5)
-        self.tree = ttk.Treeview(frame, columns=self.columns, show="headings")
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-
-        # Which columns should be centered?
-        center_cols = {"badge", "year", "last_payment_date", "method"}
-
-        for col, width in zip(self.columns, self.column_widths):
-            self.tree.heading(col, text=col.replace("_", " ").title(),
-                              command=lambda c=col: self._sort_column(c, False))
-            if col in center_cols:
-                anchor = "center"
-            elif col in ("amount_due", "balance_due", "amount_paid"):
-                anchor = "e"
-            else:
-                anchor = "w"
-            self.tree.column(col, width=width, anchor=anchor, stretch=True)
-
-    def _sort_column(self, col, reverse):
-            """Sort treeview column and show arrow."""
-            data = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-            # Numeric sort if possible
-            try:
-                data = [(float(v), k) for v, k in data]
-            except ValueError:
-                pass
-
-            data.sort(reverse=reverse)
-            for idx, (_, k) in enumerate(data):
-                self.tree.move(k, "", idx)
-
-            # Update all headings to add arrow to sorted column
-            for c in self.columns:
-                header_text = c.replace("_", " ").title()
-                if c == "badge":
-                    header_text = "Badge"
-                if c == col:
-                    arrow = " ▲" if not reverse else " ▼"
-                    self.tree.heading(c, text=header_text + arrow,
-                                    command=lambda c=c: self._sort_column(c, not reverse))
-                else:
-                    self.tree.heading(c, text=header_text,
-                                    command=lambda c=c: self._sort_column(c, False))
 
+    def _report_columns(self):
+        return [
+            report_data.ReportColumn("badge", "Badge", report_data.BADGE, "CENTER", 80),
+            report_data.ReportColumn("name", width=150),
+            report_data.ReportColumn("membership_type", width=105),
+            report_data.ReportColumn("amount_due", kind=report_data.MONEY, align="RIGHT", width=90, total=True),
+            report_data.ReportColumn("balance_due", kind=report_data.MONEY, align="RIGHT", width=90, total=True),
+            report_data.ReportColumn("year", kind=report_data.INT, align="CENTER", width=60),
+            report_data.ReportColumn("last_payment_date", kind=report_data.DATE, align="CENTER", width=120),
+            report_data.ReportColumn("amount_paid", kind=report_data.MONEY, align="RIGHT", width=90, total=True),
+            report_data.ReportColumn("method", align="CENTER", width=90),
+        ]
 
-    def populate_report(self):
-        self.tree.delete(*self.tree.get_children())
+    def _fetch_rows(self):
         year = self.year_var.get()
-        members = database.get_all_members()
-        for m in members:
-            badge = m[1]
-            name = f"{m[3]} {m[4]}"
-            membership_type = m[2]
-            amount_due = 0
-            setting_key = f"dues_{membership_type.lower()}" if membership_type else ""
-            try:
-                amount_due = float(database.get_setting(setting_key) or 0)
-            except:
-                pass
-            dues = database.get_dues_by_member(m[0])
-            total_paid, last_payment_date, method = 0, "", ""
-            for d in dues:
-                try:
-                    amt = float(d[4])
-                except:
-                    amt = 0
-                pay_year = int(d[3]) if len(d) > 3 else year
-                if pay_year != year:
-                    continue
-                total_paid += amt
-                date = d[2] if len(d) > 2 else ""
-                if date and (not last_payment_date or date > last_payment_date):
-                    last_payment_date = date
-                    method = d[5] if len(d) > 5 else ""
-            if last_payment_date:
-                try:
-                    last_payment_date = datetime.strptime(last_payment_date, "%Y-%m-%d").strftime("%m-%d-%Y")
-                except:
-                    pass
-            balance_due = max(amount_due - total_paid, 0)
-            self.tree.insert("", "end", values=(badge, name, membership_type,
-                                                f"{amount_due:.2f}", f"{balance_due:.2f}",
-                                                year, last_payment_date, f"{total_paid:.2f}", method))
-
-    def print_report(self):
-        """Print preview of dues report."""
-        if self.tree is None:
-            return
-        items = self.tree.get_children()
-        if not items:
-            messagebox.showinfo("Print Report", "No data to print.")
-            return
-
-        org_name = "Dug Hill Rod & Gun Club"
-        report_name = f"Dues Report - Year {self.year_var.get()}"
-        generation_dt = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-
-        rows = [self.tree.item(item, "values") for item in items]
-        page_width = 100  # wider for financial data
-        num_cols = len(self.columns)
-
-        # Widths
-        raw_widths = [max(len(str(row[idx])) for row in rows) if rows else 5 for idx in range(num_cols)]
-        raw_widths = [max(raw_widths[i], len(self.columns[i])) for i in range(num_cols)]
-        total_raw = sum(raw_widths)
-        col_widths = [max(5, int(w / total_raw * page_width)) for w in raw_widths]
-        diff = page_width - sum(col_widths)
-        if diff != 0:
-            col_widths[-1] += diff
-
-        center_cols = {"badge", "year", "last_payment_date", "method"}
-        right_cols = {"amount_due", "balance_due", "amount_paid"}
-
-        def format_row(values):
-            out = []
-            for v, w, col in zip(values, col_widths, self.columns):
-                v = str(v)
-                if col in center_cols:
-                    out.append(v.center(w))
-                elif col in right_cols:
-                    out.append(v.rjust(w))
-                else:
-                    out.append(v.ljust(w))
-            return " ".join(out)
-
-        # Paging
-        lines_per_page = 35
-        pages, current_lines = [], []
-
-        def add_header():
-            total_width = page_width
-            current_lines.append(org_name.center(total_width))
-            
-            # Split title and timeframe
-            report_title = "Dues Report"
-            timeframe = f"Year: {self.year_var.get()}"
-            
-            current_lines.append(report_title.center(total_width))
-            current_lines.append(timeframe.center(total_width))  # new line for timeframe
-            current_lines.append("=" * total_width)
-            current_lines.append(format_row([c.replace("_", " ").title() for c in self.columns]))
-            current_lines.append("-" * total_width)
-
-
-        add_header()
-        row_count = 0
-        for row in rows:
-            row_vals = list(row)
-            if self.exclude_names_var.get() and len(row_vals) > 1:
-                row_vals[1] = "*****"
-            current_lines.append(format_row(row_vals))
-            row_count += 1
-            if row_count >= lines_per_page - 6:
-                pages.append(current_lines)
-                current_lines = []
-                row_count = 0
-                add_header()
-        if current_lines:
-            pages.append(current_lines)
-
-        total_pages = len(pages)
-        for i, page_lines in enumerate(pages, start=1):
-            page_lines.append("=" * page_width)
-            page_lines.append(f"Generated: {generation_dt}".center(page_width))
-            page_lines.append(f"Page {i} of {total_pages}".center(page_width))
-            page_lines.append("End of Report".center(page_width))
-
-        full_text = "\n\n".join("\n".join(p) for p in pages)
-
-        # --- Print Preview Window ---
-        print_window = tk.Toplevel(self)
-        print_window.title(f"{report_name} - Print Preview")
-        center_window(print_window, width=800, height=600, parent=self.winfo_toplevel())
-        print_window.transient()
-        print_window.focus_set()
-        frame = tk.Frame(print_window)
-        frame.pack(fill="both", expand=True)
-
-        text = tk.Text(frame, wrap="none", font=("Courier", 10))
-        text.insert("1.0", full_text)
-        text.config(state="disabled")
-        text.grid(row=0, column=0, sticky="nsew")
-
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=text.yview)
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=text.xview)
-        hsb.grid(row=1, column=0, sticky="ew")
-        text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-
-        frame.rowconfigure(0, weight=1)
-        frame.columnconfigure(0, weight=1)
-
-        # --- Buttons ---
-        btn_frame = tk.Frame(print_window)
-        btn_frame.pack(fill="x", pady=5)
-
-        def generate_pdf(path, full_text):
-            c = canvas.Canvas(path, pagesize=letter)
-            c.setFont("Courier", 10)
-            width, height = letter
-            margin = 50
-            usable_width = width - 2 * margin
-            char_width = c.stringWidth("M", "Courier", 10)
-            max_chars = int(usable_width // char_width)
-            y = height - margin
-            line_height = 12
-            for line in full_text.split("\n"):
-                padded = line.ljust(max_chars)
-                c.drawString(margin, y, padded)
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    c.setFont("Courier", 10)
-                    y = height - margin
-            c.save()
-
-        def save_as_pdf():
-            path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF Files","*.pdf")])
-            if path:
-                generate_pdf(path, full_text)
-                messagebox.showinfo("Save as PDF", f"PDF saved to {path}")
+        # One grouped query for the whole year instead of a settings lookup
+        # and a dues query per member
+        for m in database.get_dues_summary(year):
+            last_payment_date = m["last_payment_date"]
+            yield (m["badge_number"], f"{m['first_name']} {m['last_name']}", m["membership_type"],
+                   m["amount_due"], m["balance_due"], year,
+                   report_data.parse_date(last_payment_date) or last_payment_date,
+                   m["total_paid"], m["method"] or "")
 
-        def print_to_pdf():
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            generate_pdf(tmp.name, full_text)
-            webbrowser.open_new(tmp.name)
-
-        def export_csv():
-            self.export_csv()
+    def _print_title(self):
+        return "Dues Report"
 
-        tk.Button(btn_frame, text="Print", command=print_to_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Save as PDF", command=save_as_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Export CSV", command=export_csv).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Cancel", command=print_window.destroy).pack(side="right", padx=5)
+    def _print_subtitles(self):
+        return [f"Year: {self.year_var.get()}"]
 
 
 # ---------------- WorkHoursReport ---------------- #
 class Work_HoursReport(BaseReport):
     def __init__(self, parent, member_id=None):
-        self.columns = ("badge", "name", "work_hours")
-        self.column_widths = (80, 260, 120)
         super().__init__(parent, member_id)
         self._create_tree()
         self.populate_report()
-        self.tree.bind("<Double-1>", self._on_row_double_click)
 
+    def _report_columns(self):
+        return [
+            report_data.ReportColumn("badge", "Badge", report_data.BADGE, "CENTER", 80),
+            report_data.ReportColumn("name", width=260),
+            report_data.ReportColumn("work_hours", kind=report_data.NUMBER, align="CENTER", width=120, total=True),
+        ]
 
-    def _create_tree(self):
-        frame = tk.Frame(self)
-        frame.pack(fill="both", expand=True, pady=5)
-        self.tree = ttk.Treeview(frame, columns=self.columns, show="headings")
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-
-        for col, width in zip(self.columns, self.column_widths):
-            self.tree.heading(
-                col,
-                text=col.replace("_", " ").title(),
-                command=lambda c=col: self._sort_column(c, False)  # sortable
-            )
-            anchor = "center" if col in ("work_hours", "badge") else "w"
-            self.tree.column(col, width=width, anchor=anchor, stretch=True)
-
-    def _sort_column(self, col, reverse):
-            """Sort treeview data by column and add arrow to sorted column."""
-            data = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-            try:
-                data.sort(key=lambda t: float(t[0]) if t[0] != "" else 0, reverse=reverse)
-            except ValueError:
-                data.sort(key=lambda t: t[0], reverse=reverse)
-
-            for index, (_, k) in enumerate(data):
-                self.tree.move(k, "", index)
-
-            # Update headings to show arrow only on the sorted column
-            for c in self.columns:
-                header_text = c.replace("_", " ").title()
-                if c == "badge":
-                    header_text = "Badge"
-                if c == col:
-                    arrow = " ▲" if not reverse else " ▼"
-                    self.tree.heading(c, text=header_text + arrow,
-                                    command=lambda c=c: self._sort_column(c, not reverse))
-                else:
-                    self.tree.heading(c, text=header_text,
-                                    command=lambda c=c: self._sort_column(c, False))
-
-
-    def populate_report(self):
-        self.tree.delete(*self.tree.get_children())
+    def _fetch_rows(self):
         year = self.year_var.get()
         month_name = self.month_var.get()
         if month_name == "All":
@@ -3043,613 +2982,92 @@ class Work_HoursReport(BaseReport):
             end = f"{year}-{month_idx:02d}-{last_day}"
         rows = database.get_work_hours_report(self.member_id, start, end)
         for badge, first, last, total_hours in rows:
-            name = f"{last}, {first}"
-            self.tree.insert("", "end", values=(badge or "", name, total_hours or 0))
+            yield (badge or "", f"{last}, {first}", total_hours or 0)
 
-    def print_report(self):
-        """Print preview of work hours report with timeframe under report name."""
-        if self.tree is None:
-            return
-        items = self.tree.get_children()
-        if not items:
-            messagebox.showinfo("Print Report", "No data to print.")
-            return
+    def _print_title(self):
+        return "Work Hours Report"
 
-        org_name = "Dug Hill Rod & Gun Club"
-        report_name = "Work Hours Report"
-        # new timeframe line
+    def _print_subtitles(self):
         if self.month_var.get() == "All":
-            timeframe = f"Year: {self.year_var.get()}"
-        else:
-            timeframe = f"{self.month_var.get()} {self.year_var.get()}"
-        generation_dt = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-
-        rows = [self.tree.item(item, "values") for item in items]
-        page_width = 85
-        num_cols = len(self.columns)
-        raw_widths = [max(len(str(row[idx])) for row in rows) if rows else 5 for idx in range(num_cols)]
-        raw_widths = [max(raw_widths[i], len(self.columns[i])) for i in range(num_cols)]
-        total_raw = sum(raw_widths)
-        col_widths = [max(3, int(w / total_raw * page_width)) for w in raw_widths]
-        diff = page_width - sum(col_widths)
-        if diff != 0:
-            col_widths[-1] += diff
-
-        def format_row(values):
-            formatted = []
-            for v, w, col in zip(values, col_widths, self.columns):
-                v = str(v)
-                # center badge column
-                if col == "badge":
-                    formatted.append(v.center(w))
-                else:
-                    formatted.append(v.ljust(w))
-            return " ".join(formatted)
-
-        lines_per_page = 40
-        pages, current_lines = [], []
-
-        def add_header():
-            total_width = page_width
-            current_lines.append(org_name.center(total_width))
-            current_lines.append(report_name.center(total_width))
-            current_lines.append(timeframe.center(total_width))  # new timeframe line
-            current_lines.append("=" * total_width)
-            current_lines.append(format_row([c.replace("_", " ").title() for c in self.columns]))
-            current_lines.append("-" * total_width)
-
-        add_header()
-        row_count = 0
-        for row in rows:
-            row_vals = list(row)
-            if self.exclude_names_var.get() and len(row_vals) > 1:
-                row_vals[1] = "*****"
-            current_lines.append(format_row(row_vals))
-            row_count += 1
-            if row_count >= lines_per_page - 6:
-                pages.append(current_lines)
-                current_lines = []
-                row_count = 0
-                add_header()
-        if current_lines:
-            pages.append(current_lines)
-
-        total_pages = len(pages)
-        for i, page_lines in enumerate(pages, start=1):
-            page_lines.append("=" * page_width)
-            page_lines.append(f"Generated: {generation_dt}".center(page_width))
-            page_lines.append(f"Page {i} of {total_pages}".center(page_width))
-            page_lines.append("End of Report".center(page_width))
-
-        full_text = "\n\n".join("\n".join(p) for p in pages)
-
-        # PDF helper
-        def generate_pdf(path, full_text):
-            c = canvas.Canvas(path, pagesize=letter)
-            c.setFont("Courier", 10)
-            width, height = letter
-            margin = 50
-            usable_width = width - 2 * margin
-            char_width = c.stringWidth("M", "Courier", 10)
-            max_chars = int(usable_width // char_width)
-            y = height - margin
-            line_height = 12
-            for line in full_text.split("\n"):
-                padded = line.ljust(max_chars)
-                c.drawString(margin, y, padded)
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    c.setFont("Courier", 10)
-                    y = height - margin
-            c.save()
-
-        # --- Print Preview ---
-        print_window = tk.Toplevel(self)
-        print_window.title(f"{report_name} - Print Preview")
-        center_window(print_window, width=725, height=600, parent=self.winfo_toplevel())
-        print_window.transient()
-        print_window.focus_set()
-        frame = tk.Frame(print_window)
-        frame.pack(fill="both", expand=True)
-
-        text = tk.Text(frame, wrap="none", font=("Courier", 10))
-        text.insert("1.0", full_text)
-        text.config(state="disabled")
-        text.grid(row=0, column=0, sticky="nsew")
-
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=text.yview)
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=text.xview)
-        hsb.grid(row=1, column=0, sticky="ew")
-        text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-
-        frame.rowconfigure(0, weight=1)
-        frame.columnconfigure(0, weight=1)
-
-        # --- Buttons ---
-        btn_frame = tk.Frame(print_window)
-        btn_frame.pack(fill="x", pady=5)
-
-        def save_as_pdf():
-            path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF Files", "*.pdf")])
-            if path:
-                generate_pdf(path, full_text)
-                messagebox.showinfo("Save as PDF", f"PDF saved to {path}")
-
-        def print_to_pdf():
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            generate_pdf(tmp.name, full_text)
-            webbrowser.open_new(tmp.name)
-
-        def export_csv():
-            self.export_csv()
-
-        tk.Button(btn_frame, text="Print", command=print_to_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Save as PDF", command=save_as_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Export CSV", command=export_csv).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Cancel", command=print_window.destroy).pack(side="right", padx=5)
+            return [f"Year: {self.year_var.get()}"]
+        return [f"{self.month_var.get()} {self.year_var.get()}"]
 
 
 # ---------------- AttendanceReport ---------------- #
 class AttendanceReport(BaseReport):
     def __init__(self, parent, member_id=None):
-        self.columns = ("badge", "name", "status")
-        self.column_widths = (80, 260, 120)
-        self.sort_states = {}  # Track column sort states
+        self._matrix = None  # cached get_attendance_matrix() result
+        self._matrix_key = None  # (year, database.data_stamp()) it was fetched for
         super().__init__(parent, member_id)
         self._create_tree()
         self.populate_report()
-        self.tree.bind("<Double-1>", self._on_row_double_click)
-
-    def _create_tree(self):
-        frame = tk.Frame(self)
-        frame.pack(fill="both", expand=True, pady=5)
-        self.tree = ttk.Treeview(frame, columns=self.columns, show="headings")
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-
-        for col, width in zip(self.columns, self.column_widths):
-            header_text = "Badge" if col == "badge" else col.replace("_", " ").title()
-            self.tree.heading(col, text=header_text,
-                              command=lambda c=col: self.sort_by_column(c))
-            anchor = "center" if col in ("status", "badge") else "w"
-            self.tree.column(col, width=width, anchor=anchor, stretch=True)
-
-    def sort_by_column(self, col):
-        """Sort treeview contents and show arrow on the sorted column."""
-        items = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-        # Detect numeric vs text sort
-        try:
-            items = [(float(v), k) for v, k in items]
-        except ValueError:
-            pass
-
-        reverse = self.sort_states.get(col, False)
-        self.sort_states[col] = not reverse
-        items.sort(reverse=reverse)
-
-        for index, (val, k) in enumerate(items):
-            self.tree.move(k, "", index)
-
-        # Update headings with arrow
-        for c in self.columns:
-            base = "Badge" if c == "badge" else c.replace("_", " ").title()
-            if c == col:
-                arrow = " ▲" if not reverse else " ▼"
-                self.tree.heading(c, text=base + arrow,
-                                  command=lambda c=c: self.sort_by_column(c))
-            else:
-                self.tree.heading(c, text=base, command=lambda c=c: self.sort_by_column(c))
-
-    # ... keep populate_report() and print_report() as-is ...
 
+    def _report_columns(self):
+        # The status column holds meeting counts for a yearly report
+        if self.month_var.get() == "All":
+            status = report_data.ReportColumn("status", "Number of Meetings", report_data.INT, "CENTER", 120)
+        else:
+            status = report_data.ReportColumn("status", "Status", align="CENTER", width=120)
+        return [
+            report_data.ReportColumn("badge", "Badge", report_data.BADGE, "CENTER", 80),
+            report_data.ReportColumn("name", width=260),
+            status,
+        ]
 
-    def populate_report(self):
-        self.tree.delete(*self.tree.get_children())
+    def _fetch_rows(self):
         year = self.year_var.get()
         month_name = self.month_var.get()
 
-        # Change column header based on report type
-        if month_name == "All":
-            self.tree.heading("status", text="Number of Meetings", command=lambda: self.sort_by_column("status"))
-        else:
-            self.tree.heading("status", text="Status", command=lambda: self.sort_by_column("status"))
-
-        members = database.get_all_members()
-        for m in members:
-            badge = m[1]
-            name = f"{m[3]} {m[4]}"
-
-            if month_name == "All":
-                total = database.count_member_attendance(m[0], year)
-                self.tree.insert("", "end", values=(badge, name, total))
-            else:
-                month_idx = list(calendar.month_name).index(month_name)
-                status = database.get_member_status_for_month(m[0], year, month_idx)
-
-                if status not in ("Attended", "Exempt", "Exemption Granted"):
-                    continue  # Skip irrelevant statuses
-
-                self.tree.insert("", "end", values=(badge, name, status))
-
-    def print_report(self):
-        """Print preview of attendance report with month/year in header."""
-        if self.tree is None:
-            return
-        items = self.tree.get_children()
-        if not items:
-            messagebox.showinfo("Print Report", "No data to print.")
-            return
-
-        org_name = "Dug Hill Rod & Gun Club"
-        report_name = "Meeting Attendance Report"
+        # The whole year is fetched in one query; switching months only
+        # re-renders from the cached matrix, until the database changes
+        key = (year, database.data_stamp())
+        if self._matrix is None or self._matrix_key != key:
+            self._matrix = database.get_attendance_matrix(year)
+            self._matrix_key = key
+
+        month_idx = list(calendar.month_name).index(month_name) if month_name != "All" else None
+        for m in self._matrix:
+            name = f"{m['first_name']} {m['last_name']}"
+            if month_idx is None:
+                yield (m["badge_number"], name, m["total"])
+                continue
+            status = m["months"].get(month_idx, {}).get("status")
+            if status not in ("Attended", "Exempt", "Exemption Granted"):
+                continue  # Skip irrelevant statuses
+            yield (m["badge_number"], name, status)
+
+    def _print_title(self):
+        return "Meeting Attendance Report"
+
+    def _print_subtitles(self):
         month_name = self.month_var.get()
-        month_display = month_name if month_name != "All" else "Yearly"
-        generation_dt = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-
-        # Gather rows
-        rows = [self.tree.item(item, "values") for item in items]
-        headers = [self.tree.heading(c)["text"] for c in self.columns]
-
-        page_width = 85
-        num_cols = len(self.columns)
-
-        raw_widths = [max(len(str(row[idx])) for row in rows) if rows else 5 for idx in range(num_cols)]
-        raw_widths = [max(raw_widths[i], len(headers[i])) for i in range(num_cols)]
-        total_raw = sum(raw_widths)
-        col_widths = [max(3, int(w / total_raw * page_width)) for w in raw_widths]
-        diff = page_width - sum(col_widths)
-        if diff != 0:
-            col_widths[-1] += diff
-
-        def format_row(values):
-            formatted = []
-            for (v, w, col) in zip(values, col_widths, self.columns):
-                # Center badge always
-                if col == "badge":
-                    formatted.append(str(v).center(w))
-                # Center status if it's a yearly report
-                elif col == "status" and self.month_var.get() == "All":
-                    formatted.append(str(v).center(w))
-                else:
-                    formatted.append(str(v).ljust(w))
-            return " ".join(formatted)
-
-
-        lines_per_page = 40
-        pages, current_lines = [], []
-
-        def add_header():
-            total_width = page_width
-            current_lines.append(org_name.center(total_width))
-            current_lines.append(report_name.center(total_width))
-            year_display = str(self.year_var.get())
-            if month_name != "All":
-                current_lines.append(f"Month: {month_name}    Year: {year_display}".center(total_width))
-            else:
-                current_lines.append(f"Year: {year_display}".center(total_width))
-            current_lines.append("=" * total_width)
-            current_lines.append(format_row(headers))
-            current_lines.append("-" * total_width)
-
-        add_header()
-        row_count = 0
-        for row in rows:
-            row_vals = list(row)
-            if self.exclude_names_var.get() and len(row_vals) > 1:
-                row_vals[1] = "*****"
-            current_lines.append(format_row(row_vals))
-            row_count += 1
-            if row_count >= lines_per_page - 6:
-                pages.append(current_lines)
-                current_lines = []
-                row_count = 0
-                add_header()
-        if current_lines:
-            pages.append(current_lines)
-
-        total_pages = len(pages)
-        for i, page_lines in enumerate(pages, start=1):
-            page_lines.append("=" * page_width)
-            page_lines.append(f"Generated: {generation_dt}".center(page_width))
-            page_lines.append(f"Page {i} of {total_pages}".center(page_width))
-            page_lines.append("End of Report".center(page_width))
-
-        full_text = "\n\n".join("\n".join(p) for p in pages)
-
-        # PDF generator
-        def generate_pdf(path, full_text):
-            c = canvas.Canvas(path, pagesize=letter)
-            c.setFont("Courier", 10)
-            width, height = letter
-            margin = 50
-            usable_width = width - 2 * margin
-            char_width = c.stringWidth("M", "Courier", 10)
-            max_chars = int(usable_width // char_width)
-            y = height - margin
-            line_height = 12
-            for line in full_text.split("\n"):
-                padded = line.ljust(max_chars)
-                c.drawString(margin, y, padded)
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    c.setFont("Courier", 10)
-                    y = height - margin
-            c.save()
-
-        # Print Preview Window
-        print_window = tk.Toplevel(self)
-        print_window.title(f"{report_name} - Print Preview")
-        center_window(print_window, width=725, height=600, parent=self.winfo_toplevel())
-        print_window.transient()
-        print_window.focus_set()
-        frame = tk.Frame(print_window)
-        frame.pack(fill="both", expand=True)
-
-        text = tk.Text(frame, wrap="none", font=("Courier", 10))
-        text.insert("1.0", full_text)
-        text.config(state="disabled")
-        text.grid(row=0, column=0, sticky="nsew")
-
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=text.yview)
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=text.xview)
-        hsb.grid(row=1, column=0, sticky="ew")
-        text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        frame.rowconfigure(0, weight=1)
-        frame.columnconfigure(0, weight=1)
-
-        # Buttons
-        btn_frame = tk.Frame(print_window)
-        btn_frame.pack(fill="x", pady=5)
-
-        def save_as_pdf():
-            path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF Files", "*.pdf")])
-            if path:
-                generate_pdf(path, full_text)
-                messagebox.showinfo("Save as PDF", f"PDF saved to {path}")
-
-        def print_to_pdf():
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            generate_pdf(tmp.name, full_text)
-            webbrowser.open_new(tmp.name)
-
-        def export_csv():
-            self.export_csv()
-
-        tk.Button(btn_frame, text="Print", command=print_to_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Save as PDF", command=save_as_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Export CSV", command=export_csv).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Cancel", command=print_window.destroy).pack(side="right", padx=5)
+        if month_name != "All":
+            return [f"Month: {month_name}    Year: {self.year_var.get()}"]
+        return [f"Year: {self.year_var.get()}"]
 
 
 # ---------------- WaiverReport ---------------- #
 class WaiverReport(BaseReport):
     def __init__(self, parent, member_id=None):
-        self.columns = ["badge", "name", "waiver"]
-        self.column_widths = [80, 200, 100]
         super().__init__(parent, member_id, include_month=False)
         self._create_tree()
         self.populate_report()
-        self.tree.bind("<Double-1>", self._on_row_double_click)
 
+    def _report_columns(self):
+        return [
+            report_data.ReportColumn("badge", "Badge", report_data.BADGE, "CENTER", 80),
+            report_data.ReportColumn("name", width=200),
+            report_data.ReportColumn("waiver", width=100),
+        ]
 
-    def _create_tree(self):
-        frame = tk.Frame(self)
-        frame.pack(fill="both", expand=True, pady=5)
-        self.tree = ttk.Treeview(frame, columns=self.columns, show="headings")
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-
-        # Track sort order per column
-        self._sort_orders = {col: False for col in self.columns}
-
-        for col, width in zip(self.columns, self.column_widths):
-            self.tree.heading(col, text=col.replace("_", " ").title(),
-                            command=lambda c=col: self._sort_by(c))
-            anchor = "center" if col == "badge" else "w"
-            self.tree.column(col, width=width, anchor=anchor, stretch=True)
-
-    def _sort_by(self, col):
-        """Sort treeview by given column and display arrow for sort direction."""
-        data = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-
-        # Determine sort type
-        try:
-            data = [(float(d[0]), d[1]) for d in data]
-        except ValueError:
-            data = [(d[0].lower(), d[1]) for d in data]
-
-        # Toggle sort order
-        reverse = self._sort_orders.get(col, False)
-        data.sort(reverse=reverse)
-        self._sort_orders[col] = not reverse
-
-        # Rearrange items in the tree
-        for index, (_, k) in enumerate(data):
-            self.tree.move(k, "", index)
-
-        # Update column headers to show arrows
-        for c in self.tree["columns"]:
-            base = c.replace("_", " ").title()
-            if c == col:
-                arrow = " ▲" if not reverse else " ▼"
-                self.tree.heading(c, text=base + arrow, command=lambda c=c: self._sort_by(c))
-            else:
-                self.tree.heading(c, text=base, command=lambda c=c: self._sort_by(c))
-
-
-
-    def populate_report(self):
-        self.tree.delete(*self.tree.get_children())
-        rows = database.get_waiver_report()
-        for m in rows:
-            self.tree.insert("", "end", values=(m["badge_number"], m["name"], m["waiver"]))
-
-    def print_report(self):
-        """Print preview of waiver report."""
-        if self.tree is None:
-            return
-        items = self.tree.get_children()
-        if not items:
-            messagebox.showinfo("Print Report", "No data to print.")
-            return
-
-        org_name = "Dug Hill Rod & Gun Club"
-        report_name = "Waiver Report"
-        generation_dt = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-
-        # Gather rows from the tree
-        rows = [self.tree.item(item, "values") for item in items]
-
-        # Format column headers nicely
-        headers = [c.replace("_", " ").title() for c in self.columns]
-
-        # Determine page width (characters)
-        page_width = 85
-        num_cols = len(self.columns)
-
-        # Compute column widths proportionally
-        raw_widths = [max(len(str(row[idx])) for row in rows) if rows else 5 for idx in range(num_cols)]
-        raw_widths = [max(raw_widths[i], len(headers[i])) for i in range(num_cols)]
-        total_raw = sum(raw_widths)
-        col_widths = [max(3, int(w / total_raw * page_width)) for w in raw_widths]
-        diff = page_width - sum(col_widths)
-        if diff != 0:
-            col_widths[-1] += diff
-
-        def format_row(values):
-            formatted = []
-            for v, w, col in zip(values, col_widths, self.columns):
-                if col == "badge":
-                    formatted.append(str(v).center(w))  # center badge
-                else:
-                    formatted.append(str(v).ljust(w))
-            return " ".join(formatted)
-
-
-        lines_per_page = 40
-        pages, current_lines = [], []
-
-        def add_header():
-            total_width = page_width
-            current_lines.append(org_name.center(total_width))
-            current_lines.append(report_name.center(total_width))
-            current_lines.append("=" * total_width)
-            current_lines.append(format_row(headers))
-            current_lines.append("-" * total_width)
-
-        add_header()
-        row_count = 0
-        for row in rows:
-            row_vals = list(row)
-            if self.exclude_names_var.get() and len(row_vals) > 1:
-                row_vals[1] = "*****"
-            current_lines.append(format_row(row_vals))
-            row_count += 1
-            if row_count >= lines_per_page - 6:
-                pages.append(current_lines)
-                current_lines = []
-                row_count = 0
-                add_header()
-        if current_lines:
-            pages.append(current_lines)
-
-        total_pages = len(pages)
-        for i, page_lines in enumerate(pages, start=1):
-            page_lines.append("=" * page_width)
-            page_lines.append(f"Generated: {generation_dt}".center(page_width))
-            page_lines.append(f"Page {i} of {total_pages}".center(page_width))
-            page_lines.append("End of Report".center(page_width))
-
-        full_text = "\n\n".join("\n".join(p) for p in pages)
-
-        # PDF generation helper
-        def generate_pdf(path, full_text):
-            c = canvas.Canvas(path, pagesize=letter)
-            c.setFont("Courier", 10)
-            width, height = letter
-            margin = 50
-            usable_width = width - 2 * margin
-            char_width = c.stringWidth("M", "Courier", 10)
-            max_chars = int(usable_width // char_width)
-            y = height - margin
-            line_height = 12
-            for line in full_text.split("\n"):
-                padded = line.ljust(max_chars)
-                c.drawString(margin, y, padded)
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    c.setFont("Courier", 10)
-                    y = height - margin
-            c.save()
-
-        # --- Print Preview Window ---
-        print_window = tk.Toplevel(self)
-        print_window.title(f"{report_name} - Print Preview")
-        center_window(print_window, width=725, height=600, parent=self.winfo_toplevel())
-        print_window.transient()
-        print_window.focus_set()
-        frame = tk.Frame(print_window)
-        frame.pack(fill="both", expand=True)
-
-        text = tk.Text(frame, wrap="none", font=("Courier", 10))
-        text.insert("1.0", full_text)
-        text.config(state="disabled")
-        text.grid(row=0, column=0, sticky="nsew")
-
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=text.yview)
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=text.xview)
-        hsb.grid(row=1, column=0, sticky="ew")
-        text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        frame.rowconfigure(0, weight=1)
-        frame.columnconfigure(0, weight=1)
-
-        # --- Buttons ---
-        btn_frame = tk.Frame(print_window)
-        btn_frame.pack(fill="x", pady=5)
-
-        def save_as_pdf():
-            path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF Files","*.pdf")])
-            if path:
-                generate_pdf(path, full_text)
-                messagebox.showinfo("Save as PDF", f"PDF saved to {path}")
-
-        def print_to_pdf():
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            generate_pdf(tmp.name, full_text)
-            webbrowser.open_new(tmp.name)
-
-        def export_csv():
-            self.export_csv()
-
-        tk.Button(btn_frame, text="Print", command=print_to_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Save as PDF", command=save_as_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Export CSV", command=export_csv).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Cancel", command=print_window.destroy).pack(side="right", padx=5)
+    def _fetch_rows(self):
+        for m in database.get_waiver_report():
+            yield (m["badge_number"], m["name"], m["waiver"])
 
 
 # ---------------- CommitteesReport ---------------- #
 class CommitteesReport(BaseReport):
     def __init__(self, parent, member_id=None):
-        self.columns = ("badge_number", "name", "notes")
-        self.column_widths = (80, 250, 300)
         super().__init__(parent, member_id, include_month=False)
 
         self._setup_committee_filter()
@@ -3669,233 +3087,44 @@ class CommitteesReport(BaseReport):
         cb.bind("<<ComboboxSelected>>", lambda e: self._on_committee_change())
 
     def _on_committee_change(self):
-        selected = self.committee_var.get()
-        if selected == "Executive Committee":
-            self.columns = ("badge_number", "name", "role", "term")  # notes removed
-            self.column_widths = (80, 200, 150, 100)
-        else:
-            self.columns = ("badge_number", "name", "notes")
-            self.column_widths = (80, 250, 300)
-
-        if hasattr(self, "tree_frame") and self.tree_frame:
-            self.tree_frame.destroy()
+        # The executive committee has different columns, so the tree is rebuilt
         self._create_tree()
         self.populate_report()
 
+    def _report_columns(self):
+        badge = report_data.ReportColumn("badge_number", "Badge", report_data.BADGE, "CENTER", 80)
+        if self.committee_var.get() == "Executive Committee":
+            return [
+                badge,
+                report_data.ReportColumn("name", width=200),
+                report_data.ReportColumn("role", width=150),
+                report_data.ReportColumn("term", width=100),
+            ]
+        return [
+            badge,
+            report_data.ReportColumn("name", width=250),
+            report_data.ReportColumn("notes", width=300),
+        ]
 
-    def _create_tree(self):
-        self.tree_frame = tk.Frame(self)
-        self.tree_frame.pack(fill="both", expand=True, pady=5)
-
-        self.tree = ttk.Treeview(self.tree_frame, columns=self.columns, show="headings")
-        vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
-        hsb = ttk.Scrollbar(self.tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
-        self.tree_frame.grid_rowconfigure(0, weight=1)
-        self.tree_frame.grid_columnconfigure(0, weight=1)
-        self.tree.bind("<Double-1>", self._on_row_double_click)
-
-        for col, width in zip(self.columns, self.column_widths):
-            header_text = "Badge" if col == "badge_number" else col.replace("_", " ").title()
-            self.tree.heading(col, text=header_text, command=lambda c=col: self._sort_tree(c, False))
-            if col == "role":
-                anchor = "w"
-            elif col == "badge_number":
-                anchor = "center"
-            else:
-                anchor = "w"
-            self.tree.column(col, width=width, anchor=anchor, stretch=True)
-
-    def _sort_tree(self, col, reverse):
-        # Gather the data
-        data_list = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-        try:
-            data_list.sort(key=lambda t: float(t[0]), reverse=reverse)
-        except ValueError:
-            data_list.sort(key=lambda t: t[0].lower() if isinstance(t[0], str) else t[0], reverse=reverse)
-        
-        # Reorder the items
-        for index, (val, k) in enumerate(data_list):
-            self.tree.move(k, "", index)
-
-        # Update headers to show arrow only on the sorted column
-        for c in self.columns:
-            header_text = "Badge" if c == "badge_number" else c.replace("_", " ").title()
-            if c == col:
-                arrow = " ▲" if not reverse else " ▼"
-                self.tree.heading(c, text=header_text + arrow,
-                                command=lambda c=c: self._sort_tree(c, not reverse))
-            else:
-                self.tree.heading(c, text=header_text,
-                                command=lambda c=c: self._sort_tree(c, False))
-
-
-    def populate_report(self):
-        if self.tree is None:
-            return
-        self.tree.delete(*self.tree.get_children())
+    def _filters(self):
+        return {"committee": self.committee_var.get()}
 
-        selected_committee = getattr(self, "committee_var", tk.StringVar()).get()
+    def _fetch_rows(self):
+        selected_committee = self.committee_var.get()
         if not selected_committee:
             return
 
         if selected_committee == "Executive Committee":
-            rows = database.get_executive_committee_members()
-            for row in rows:
-                badge = row.get("badge_number", "")
+            for row in database.get_executive_committee_members():
                 name = f"{row.get('first_name','')} {row.get('last_name','')}".strip()
-                role = row.get("roles", "")
-                term = row.get("terms", "")
-                notes = row.get("notes") or ""  # leave blank if no notes
-                self.tree.insert("", "end", values=(badge, name, role, term, notes))
+                yield (row.get("badge_number", ""), name, row.get("roles", ""), row.get("terms", ""))
         else:
-            rows = database.get_members_by_committee(selected_committee)
-            for row in rows:
-                badge_number = row.get("badge_number", "")
+            for row in database.get_members_by_committee(selected_committee):
                 name = f"{row.get('first_name', '')} {row.get('last_name', '')}".strip()
-                notes = row.get("notes") or ""
-                self.tree.insert("", "end", values=(badge_number, name, notes))
-
-    def print_report(self):
-        if self.tree is None:
-            return
-        items = self.tree.get_children()
-        if not items:
-            messagebox.showinfo("Print Report", "No data to print.")
-            return
-
-        org_name = "Dug Hill Rod & Gun Club"
-        report_name = "Committee: " + self.committee_var.get() + " Roster"
-        generation_dt = datetime.now().strftime("%m-%d-%Y %H:%M:%S")
-
-        headers = [("Badge" if c == "badge_number" else c.replace("_", " ").title()) for c in self.columns]
-        rows = [self.tree.item(item, "values") for item in items]
-
-        page_width = 85
-        num_cols = len(self.columns)
-        raw_widths = [max(len(str(row[idx])) for row in rows) if rows else 5 for idx in range(num_cols)]
-        raw_widths = [max(raw_widths[i], len(headers[i])) for i in range(num_cols)]
-        total_raw = sum(raw_widths)
-        col_widths = [max(3, int(w / total_raw * page_width)) for w in raw_widths]
-        diff = page_width - sum(col_widths)
-        if diff != 0:
-            col_widths[-1] += diff
-
-        def format_row(values):
-            formatted = []
-            for i in range(len(col_widths)):
-                v = values[i] if i < len(values) else ""
-                col_name = self.columns[i] if i < len(self.columns) else ""
-                if col_name == "badge_number":
-                    formatted.append(str(v).center(col_widths[i]))
-                elif col_name == "role":
-                    formatted.append(str(v).ljust(col_widths[i]))
-                else:
-                    formatted.append(str(v).ljust(col_widths[i]))
-            return " ".join(formatted)
-
-
-        lines_per_page = 40
-        pages, current_lines = [], []
-
-        def add_header():
-            total_width = page_width
-            current_lines.append(org_name.center(total_width))
-            current_lines.append(report_name.center(total_width))
-            current_lines.append("=" * total_width)
-            current_lines.append(format_row(headers))
-            current_lines.append("-" * total_width)
-
-        add_header()
-        row_count = 0
-        for row in rows:
-            row_vals = list(row)
-            if self.exclude_names_var.get() and len(row_vals) > 1:
-                row_vals[1] = "*****"
-            current_lines.append(format_row(row_vals))
-            row_count += 1
-            if row_count >= lines_per_page - 6:
-                pages.append(current_lines)
-                current_lines = []
-                row_count = 0
-                add_header()
-        if current_lines:
-            pages.append(current_lines)
-
-        total_pages = len(pages)
-        for i, page_lines in enumerate(pages, start=1):
-            page_lines.append("=" * page_width)
-            page_lines.append(f"Generated: {generation_dt}".center(page_width))
-            page_lines.append(f"Page {i} of {total_pages}".center(page_width))
-            page_lines.append("End of Report".center(page_width))
-
-        full_text = "\n\n".join("\n".join(p) for p in pages)
-
-        def generate_pdf(path, full_text):
-            c = canvas.Canvas(path, pagesize=letter)
-            c.setFont("Courier", 10)
-            width, height = letter
-            margin = 50
-            usable_width = width - 2 * margin
-            char_width = c.stringWidth("M", "Courier", 10)
-            max_chars = int(usable_width // char_width)
-            y = height - margin
-            line_height = 12
-            for line in full_text.split("\n"):
-                padded = line.ljust(max_chars)
-                c.drawString(margin, y, padded)
-                y -= line_height
-                if y < margin:
-                    c.showPage()
-                    c.setFont("Courier", 10)
-                    y = height - margin
-            c.save()
+                yield (row.get("badge_number", ""), name, row.get("notes") or "")
 
-        print_window = tk.Toplevel(self)
-        print_window.title(f"{report_name} - Print Preview")
-        center_window(print_window, width=725, height=600, parent=self.winfo_toplevel())
-        print_window.transient()
-        print_window.focus_set()
-        frame = tk.Frame(print_window)
-        frame.pack(fill="both", expand=True)
-
-        text = tk.Text(frame, wrap="none", font=("Courier", 10))
-        text.insert("1.0", full_text)
-        text.config(state="disabled")
-        text.grid(row=0, column=0, sticky="nsew")
-
-        vsb = ttk.Scrollbar(frame, orient="vertical", command=text.yview)
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb = ttk.Scrollbar(frame, orient="horizontal", command=text.xview)
-        hsb.grid(row=1, column=0, sticky="ew")
-        text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        frame.rowconfigure(0, weight=1)
-        frame.columnconfigure(0, weight=1)
-
-        btn_frame = tk.Frame(print_window)
-        btn_frame.pack(fill="x", pady=5)
-
-        def save_as_pdf():
-            path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF Files", "*.pdf")])
-            if path:
-                generate_pdf(path, full_text)
-                messagebox.showinfo("Save as PDF", f"PDF saved to {path}")
-
-        def print_to_pdf():
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            generate_pdf(tmp.name, full_text)
-            webbrowser.open_new(tmp.name)
-
-        def export_csv():
-            self.export_csv()
-
-        tk.Button(btn_frame, text="Print", command=print_to_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Save as PDF", command=save_as_pdf).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Export CSV", command=export_csv).pack(side="left", padx=5)
-        tk.Button(btn_frame, text="Cancel", command=print_window.destroy).pack(side="right", padx=5)
+    def _print_title(self):
+        return "Committee: " + self.committee_var.get() + " Roster"
 
 
 if __name__ == "__main__":
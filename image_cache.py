@@ -0,0 +1,95 @@
+"""
+Image asset cache.
+
+Each image file is decoded at most once per process, each size is resized
+once, and the resulting PhotoImage is shared by every widget that shows it.
+Optionally, resized variants are also written to a small on-disk cache,
+keyed by the source file's mtime. On the next start they are loaded
+straight into Tk, without PIL and without decoding the full-size original.
+"""
+import os
+import tkinter as tk
+
+DEFAULT_DISK_CACHE = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "DH_Member_DB", "images",
+)
+
+
+class ImageCache:
+    def __init__(self, base_dir, disk_cache_dir=None):
+        self.base_dir = base_dir
+        self.disk_cache_dir = disk_cache_dir
+        self._sources = {}  # (path, mtime_ns) -> decoded PIL image
+        self._photos = {}   # (name, size) -> PhotoImage
+
+    def _path(self, name):
+        return os.path.join(self.base_dir, name)
+
+    def _variant_path(self, name, size, mtime_ns):
+        stem = os.path.splitext(os.path.basename(name))[0]
+        return os.path.join(self.disk_cache_dir, f"{stem}-{size[0]}x{size[1]}-{mtime_ns}.png")
+
+    def source(self, name):
+        """The decoded full-size image (PIL), read from disk once per mtime."""
+        from PIL import Image
+
+        path = self._path(name)
+        key = (path, os.stat(path).st_mtime_ns)
+        image = self._sources.get(key)
+        if image is None:
+            with Image.open(path) as f:
+                image = f.copy()  # decodes and releases the file
+            self._sources[key] = image
+        return image
+
+    def resized(self, name, size):
+        """The image scaled to size (width, height), as a PIL image."""
+        from PIL import Image
+
+        try:
+            resample = Image.Resampling.LANCZOS
+        except AttributeError:  # Pillow < 9.1
+            resample = Image.ANTIALIAS
+        return self.source(name).resize(size, resample)
+
+    def photo(self, name, size, master=None):
+        """A PhotoImage of name at size, shared by every caller."""
+        size = tuple(size)
+        photo = self._photos.get((name, size))
+        if photo is not None:
+            return photo
+
+        variant = None
+        if self.disk_cache_dir:
+            variant = self._variant_path(name, size, os.stat(self._path(name)).st_mtime_ns)
+            if os.path.exists(variant):
+                try:
+                    photo = tk.PhotoImage(master=master, file=variant)
+                except tk.TclError:
+                    photo = None  # unreadable cache file; rebuild it below
+
+        if photo is None:
+            from PIL import ImageTk
+
+            image = self.resized(name, size)
+            photo = ImageTk.PhotoImage(image, master=master)
+            if variant:
+                self._save_variant(image, variant)
+
+        self._photos[(name, size)] = photo
+        return photo
+
+    def _save_variant(self, image, variant):
+        """Write a resized variant, replacing variants of older versions."""
+        try:
+            os.makedirs(self.disk_cache_dir, exist_ok=True)
+            prefix = os.path.basename(variant).rsplit("-", 1)[0] + "-"
+            for old in os.listdir(self.disk_cache_dir):
+                if old.startswith(prefix) and old != os.path.basename(variant):
+                    os.remove(os.path.join(self.disk_cache_dir, old))
+            tmp = variant + ".tmp"
+            image.save(tmp, format="PNG")
+            os.replace(tmp, variant)
+        except OSError:
+            pass  # the disk cache is only an optimization
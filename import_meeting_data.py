@@ -1,53 +1,259 @@
-import pandas as pd
+import csv
+import os
 from datetime import datetime
 import database  # your database module
 
-def add_meeting_records_from_excel(file_path, meeting_date=None, status="Present", notes_column=None):
+CARD_COLUMN = "Card/Fob Internal Number"
+
+# Scanner CSV layout: each field lists the header names it may appear under
+# (matched case-insensitively). Pass columns= to the import to override.
+SCANNER_COLUMNS = {
+    "card": (CARD_COLUMN, "Card", "Card Number", "Card ID", "UID", "card_internal"),
+    "timestamp": ("Timestamp", "Date/Time", "DateTime", "Time", "Scan Time", "Date"),
+    "notes": ("Notes", "Note"),
+}
+
+# Timestamp formats tried after ISO 8601, in order.
+TIMESTAMP_FORMATS = (
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y",
+    "%m-%d-%Y %H:%M:%S",
+    "%m-%d-%Y",
+)
+
+BATCH_SIZE = 500
+
+
+class ImportCancelled(Exception):
+    """Raised when an import's cancel event is set; nothing is written."""
+
+
+def _check_cancel(cancel):
+    if cancel is not None and cancel.is_set():
+        raise ImportCancelled()
+
+
+def _report(progress, done, total):
+    if progress is not None:
+        progress(done, total)
+
+
+def add_meeting_records_from_excel(file_path, meeting_date=None, status="Present", notes_column=None,
+                                   progress=None, cancel=None):
     """
     Reads an Excel file and adds meeting attendance records for matching members.
 
+    The sheet is matched against every member's card in one pandas join,
+    members who already have attendance for the date are anti-joined out,
+    and the rest are inserted with one executemany in a single transaction.
+
     Args:
         file_path (str): Path to the Excel file.
         meeting_date (str | None): Date of the meeting in 'YYYY-MM-DD'. Defaults to today.
         status (str): Attendance status ('Present', 'Absent', etc.)
         notes_column (str | None): Name of the column in Excel to use as notes (optional)
+        progress (callable | None): Called as progress(done, total), first
+            for the sheet read and then for attendance rows written (from
+            the calling thread).
+        cancel (threading.Event | None): When set, the import stops and
+            raises ImportCancelled; the transaction is rolled back.
+
+    Returns:
+        dict: {"added": int, "skipped": int, "unmatched": list}. skipped
+        counts members already recorded for the date (or swiped more than
+        once); unmatched lists {"line", "card"} for each sheet row whose
+        card matched no member, line being the spreadsheet row number.
     """
+    import pandas as pd  # only Excel imports pay for pandas/openpyxl
+
     if meeting_date is None:
         meeting_date = datetime.now().strftime("%Y-%m-%d")
 
-    # Load Excel file
-    df = pd.read_excel(file_path)
+    # Load Excel file (cards as text, so 00123 and 123.0 are not mangled)
+    df = pd.read_excel(file_path, dtype={CARD_COLUMN: str})
+    total = len(df)
+    _report(progress, 0, total)
+    _check_cancel(cancel)
 
-    if "Card/Fob Internal Number" not in df.columns:
+    if CARD_COLUMN not in df.columns:
         raise ValueError("Excel must have a 'Card/Fob Internal Number' column")
 
-    added_count = 0
-    skipped_count = 0
+    df["line"] = df.index + 2  # spreadsheet row; the header is row 1
+    df["card_internal"] = df[CARD_COLUMN].fillna("").astype(str).str.strip()
+    df = df[df["card_internal"] != ""]
 
-    for _, row in df.iterrows():
-        card_number = str(row["Card/Fob Internal Number"]).strip()
-        if not card_number:
-            continue
+    # Card -> member for the whole roster, joined against the sheet at once
+    cards = pd.DataFrame(
+        [tuple(row) for row in database.get_card_member_ids()],
+        columns=["card_internal", "member_id"],
+    ).drop_duplicates("card_internal")
+    matched = df.merge(cards, on="card_internal", how="left", indicator=True)
+    missing = matched[matched["_merge"] == "left_only"]
+    unmatched = [{"line": int(line), "card": card}
+                 for line, card in zip(missing["line"], missing["card_internal"])]
+    matched = matched[matched["_merge"] == "both"].copy()
 
-        member = database.get_member_by_card_internal(card_number)
-        if not member:
-            print(f"No member found with Card/Fob Internal Number: {card_number}")
-            continue
+    if notes_column and notes_column in matched.columns:
+        matched["notes"] = matched[notes_column].map(lambda v: None if pd.isna(v) else str(v).strip())
+    else:
+        matched["notes"] = None
+
+    # One swipe per member, then drop anyone already recorded for the date
+    swipes = len(matched)
+    matched = matched.drop_duplicates("member_id")
+
+    with database.transaction() as conn:
+        already = database.get_attendance_member_ids(meeting_date)
+        new = matched[~matched["member_id"].isin(already)]
+        records = [
+            (int(member_id), meeting_date, status, notes)
+            for member_id, notes in zip(new["member_id"], new["notes"])
+        ]
+        for start in range(0, len(records), BATCH_SIZE):
+            _check_cancel(cancel)
+            database.add_meeting_attendance_many(records[start:start + BATCH_SIZE], conn=conn)
+            _report(progress, min(start + BATCH_SIZE, len(records)), len(records))
+    _report(progress, total, total)
+
+    return {
+        "added": len(records),
+        "skipped": swipes - len(records),
+        "unmatched": unmatched,
+    }
 
-        member_id = member["id"]
 
-        # Check if attendance for this date already exists
-        existing = database.get_meeting_attendance(member_id, meeting_date)
-        if existing:
-            skipped_count += 1
-            print(f"Skipped {member['first_name']} {member['last_name']} – already has attendance for {meeting_date}")
+def import_meeting_file(file_path, **kwargs):
+    """Import attendance from a scanner CSV or an Excel sheet, by extension."""
+    if os.path.splitext(file_path)[1].lower() == ".csv":
+        return add_meeting_records_from_csv(file_path, **kwargs)
+    return add_meeting_records_from_excel(file_path, **kwargs)
+
+
+def parse_scan_timestamp(value):
+    """Parse a scanner timestamp; returns a datetime or None if unreadable."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
             continue
+    return None
+
+
+def _resolve_columns(header, columns=None):
+    """Map each SCANNER_COLUMNS field to the matching header name (or None)."""
+    mapping = dict(SCANNER_COLUMNS)
+    for field, names in (columns or {}).items():
+        mapping[field] = (names,) if isinstance(names, str) else tuple(names)
+    by_lower = {h.strip().lower(): h for h in header or []}
+    resolved = {}
+    for field, names in mapping.items():
+        resolved[field] = next(
+            (by_lower[n.lower()] for n in names if n and n.lower() in by_lower), None
+        )
+    return resolved
+
+
+def add_meeting_records_from_csv(file_path, meeting_date=None, status="Present",
+                                 columns=None, batch_size=BATCH_SIZE, progress=None, cancel=None):
+    """
+    Stream an RFID scanner CSV log into meeting attendance.
+
+    Each swipe's meeting date comes from its timestamp (or from meeting_date,
+    which overrides it for every row). Repeat swipes of a card for the same
+    meeting collapse to the first one, members already recorded for that
+    date are skipped, and new rows are written in batches of batch_size, all
+    in one transaction.
+
+    Args:
+        file_path (str): Path to the scanner CSV (header row required).
+        meeting_date (str | None): 'YYYY-MM-DD' to use for every swipe.
+        status (str): Attendance status to record.
+        columns (dict | None): Overrides for SCANNER_COLUMNS, e.g.
+            {"card": "Tag", "timestamp": "When"}.
+        batch_size (int): Rows per executemany.
+        progress (callable | None): Called as progress(done, total) with
+            CSV rows processed so far (from the calling thread).
+        cancel (threading.Event | None): When set, the import stops and
+            raises ImportCancelled; the transaction is rolled back.
+
+    Returns:
+        dict: {"added", "skipped", "unmatched", "errors"}. unmatched lists
+        {"line", "card"} for each card that matched no member, as the Excel
+        import does; errors is a list of (line_number, message) for
+        unreadable rows.
+    """
+    summary = {"added": 0, "skipped": 0, "unmatched": [], "errors": []}
+    card_members = {row[0]: row[1] for row in database.get_card_member_ids()}
+
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        total = max(sum(1 for _ in f) - 1, 0)
+        f.seek(0)
+        _report(progress, 0, total)
+
+        reader = csv.DictReader(f)
+        fields = _resolve_columns(reader.fieldnames, columns)
+        if not fields["card"]:
+            raise ValueError("Scanner CSV must have a card number column")
+        if not fields["timestamp"] and not meeting_date:
+            raise ValueError("Scanner CSV has no timestamp column; pass meeting_date")
+
+        recorded = {}  # meeting_date -> member ids already having attendance
+        batch = []
+
+        with database.transaction() as conn:
+            for line, row in enumerate(reader, start=2):
+                if line % batch_size == 0:
+                    _check_cancel(cancel)
+                    _report(progress, line - 1, total)
+                card = (row.get(fields["card"]) or "").strip()
+                if not card:
+                    continue
+
+                date = meeting_date
+                if not date:
+                    scanned = parse_scan_timestamp(row.get(fields["timestamp"]))
+                    if scanned is None:
+                        summary["errors"].append(
+                            (line, f"Unreadable timestamp: {row.get(fields['timestamp'])!r}")
+                        )
+                        continue
+                    date = scanned.strftime("%Y-%m-%d")
+
+                member_id = card_members.get(card)
+                if member_id is None:
+                    summary["unmatched"].append({"line": line, "card": card})
+                    continue
+
+                if date not in recorded:
+                    recorded[date] = database.get_attendance_member_ids(date)
+                if member_id in recorded[date]:
+                    summary["skipped"] += 1  # repeat swipe or already recorded
+                    continue
+                recorded[date].add(member_id)
 
-        # Extract notes if column is specified
-        notes = str(row[notes_column]).strip() if notes_column and notes_column in df.columns else None
+                notes = None
+                if fields["notes"]:
+                    notes = (row.get(fields["notes"]) or "").strip() or None
+                batch.append((member_id, date, status, notes))
+                if len(batch) >= batch_size:
+                    database.add_meeting_attendance_many(batch, conn=conn)
+                    summary["added"] += len(batch)
+                    batch = []
 
-        database.add_meeting_attendance(member_id, meeting_date=meeting_date, status=status, notes=notes)
-        added_count += 1
-        print(f"Added attendance for {member['first_name']} {member['last_name']} ({card_number})")
+            if batch:
+                _check_cancel(cancel)
+                database.add_meeting_attendance_many(batch, conn=conn)
+                summary["added"] += len(batch)
 
-    print(f"\nSummary: {added_count} records added, {skipped_count} skipped")
+    _report(progress, total, total)
+    return summary
@@ -0,0 +1,82 @@
+import csv
+from itertools import islice
+import database
+
+# CSV header for each database.IMPORT_COLUMNS entry (the Export Current Tab
+# layout, so an exported file can be imported again).
+CSV_COLUMNS = {
+    "badge_number": "Badge",
+    "membership_type": "Membership Type",
+    "first_name": "First Name",
+    "last_name": "Last Name",
+    "dob": "Date of Birth",
+    "email": "Email Address",
+    "phone": "Phone Number",
+    "address": "Address",
+    "city": "City",
+    "state": "State",
+    "zip": "Zip Code",
+    "join_date": "Join Date",
+    "email2": "Email Address 2",
+    "sponsor": "Sponsor",
+    "card_internal": "Card/Fob Internal Number",
+    "card_external": "Card/Fob External Number",
+}
+
+
+def import_members_from_csv(file_path, on_duplicate="skip", chunk_size=500):
+    """
+    Import members from a CSV file in one transaction.
+
+    Args:
+        file_path (str): Path to the CSV file (header row required).
+        on_duplicate (str): What to do with a badge that already exists:
+            'skip' leaves the member alone, 'update' overwrites it with the
+            CSV values, 'fail' aborts the whole import.
+        chunk_size (int): Rows read and written per batch.
+
+    Returns:
+        dict: {"inserted", "updated", "skipped", "failed", "aborted",
+        "errors"}, errors being a list of (line_number, message). Rows
+        without a badge are reported as errors. When the import is aborted
+        nothing is written; otherwise member listeners get one
+        database.MEMBERS_IMPORTED notification after the commit.
+    """
+    summary = {"inserted": 0, "updated": 0, "skipped": 0, "failed": 0,
+               "aborted": False, "errors": []}
+
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        # Line numbers as shown in a spreadsheet: the header is line 1.
+        numbered = enumerate(reader, start=2)
+        try:
+            with database.transaction() as conn:
+                while True:
+                    chunk = list(islice(numbered, chunk_size))
+                    if not chunk:
+                        break
+                    records = []
+                    for line, row in chunk:
+                        values = tuple(
+                            (row.get(CSV_COLUMNS[col]) or "").strip()
+                            for col in database.IMPORT_COLUMNS
+                        )
+                        if not values[0]:
+                            summary["errors"].append((line, "Missing badge number"))
+                            continue
+                        records.append((line, values))
+
+                    inserted, updated, skipped, errors = database.import_member_chunk(
+                        conn, records, on_duplicate
+                    )
+                    summary["inserted"] += inserted
+                    summary["updated"] += updated
+                    summary["skipped"] += skipped
+                    summary["errors"].extend(errors)
+        except database.DuplicateBadgeError as e:
+            summary.update(inserted=0, updated=0, skipped=0, aborted=True)
+            summary["errors"].append((e.line, str(e)))
+
+    summary["errors"].sort()
+    summary["failed"] = len(summary["errors"])
+    return summary
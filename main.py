@@ -1,8 +1,15 @@
+import startup_timing  # first, so its clock starts with the process
+import sys
 import tkinter as tk
-from gui import MemberApp
 import os
 
 def main():
+    # The GUI module is imported here rather than at the top so that, with
+    # DH_STARTUP_TIMING set, each startup import is timed on its own.
+    startup_timing.timed_import("database")
+    gui = startup_timing.timed_import("gui")
+    startup_timing.mark("imports done")
+
     root = tk.Tk()
 
     # Path to multi-size .ico
@@ -15,8 +22,10 @@ def main():
     except Exception as e:
         print(f"Failed to set .ico icon: {e}")
 
-    app = MemberApp(root)
+    app = gui.MemberApp(root)
     root.mainloop()
+    if startup_timing.EXIT_AFTER_REPORT:
+        sys.exit(startup_timing.exit_status())
 
 if __name__ == "__main__":
     main()
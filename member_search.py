@@ -0,0 +1,126 @@
+import re
+from bisect import bisect_left
+
+# Columns of a members row that the search box matches against.
+SEARCH_FIELDS = ("badge_number", "first_name", "last_name", "membership_type",
+                 "email", "email2", "phone")
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(str(text or "").lower())
+
+
+class MemberSearchIndex:
+    """
+    In-memory prefix index over the member roster.
+
+    Every searchable field is split into tokens (so "john.doe@example.com"
+    yields john, doe, example, com), and a phone number also gets its bare
+    digit string. A member matches a query when every query term is a prefix
+    of one of the member's tokens. Lookups bisect a sorted token list, so a
+    search touches only the tokens that share the typed prefix.
+
+    Results narrow incrementally: when the new query only extends the last
+    one, the previous matches are filtered instead of searching the roster.
+    """
+
+    def __init__(self, members=()):
+        self.build(members)
+
+    def build(self, members):
+        """(Re)index the given member rows; ids are kept as strings (tree iids)."""
+        self._member_tokens = {}
+        self._postings = {}
+        for m in members:
+            self._add(m)
+        self._sorted_tokens = sorted(self._postings)
+        self._last_query = None
+        self._last_result = None
+
+    def _add(self, m):
+        member_id = str(m["id"])
+        tokens = set()
+        for field in SEARCH_FIELDS:
+            tokens.update(tokenize(m[field]))
+        digits = "".join(ch for ch in str(m["phone"] or "") if ch.isdigit())
+        if digits:
+            tokens.add(digits)
+        self._member_tokens[member_id] = tuple(tokens)
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(member_id)
+
+    def update(self, member):
+        """Add or re-index one member row."""
+        self.remove(member["id"])
+        self._add(member)
+        for token in self._member_tokens[str(member["id"])]:
+            i = bisect_left(self._sorted_tokens, token)
+            if i == len(self._sorted_tokens) or self._sorted_tokens[i] != token:
+                self._sorted_tokens.insert(i, token)
+        self._last_query = self._last_result = None
+
+    def remove(self, member_id):
+        """Drop one member from the index (no-op if not indexed)."""
+        member_id = str(member_id)
+        for token in self._member_tokens.pop(member_id, ()):
+            ids = self._postings[token]
+            ids.discard(member_id)
+            if not ids:
+                del self._postings[token]
+                i = bisect_left(self._sorted_tokens, token)
+                del self._sorted_tokens[i]
+        self._last_query = self._last_result = None
+
+    def matches(self, member_id, query):
+        """True if the indexed member matches query (an empty query matches)."""
+        member_id = str(member_id)
+        if member_id not in self._member_tokens:
+            return False
+        return self._matches(member_id, tokenize(query))
+
+    def __len__(self):
+        return len(self._member_tokens)
+
+    def _ids_with_prefix(self, term):
+        ids = set()
+        tokens = self._sorted_tokens
+        i = bisect_left(tokens, term)
+        while i < len(tokens) and tokens[i].startswith(term):
+            ids |= self._postings[tokens[i]]
+            i += 1
+        return ids
+
+    def _matches(self, member_id, terms):
+        tokens = self._member_tokens[member_id]
+        return all(any(t.startswith(term) for t in tokens) for term in terms)
+
+    def search(self, query):
+        """
+        Return the set of member ids matching query, or None for an empty
+        query (meaning "show everyone").
+        """
+        normalized = " ".join(tokenize(query))
+        if not normalized:
+            self._last_query = self._last_result = None
+            return None
+
+        terms = normalized.split()
+        previous = self._last_query
+        if previous is not None and normalized.startswith(previous):
+            # Every term of the old query is still required (or was only
+            # lengthened), so the new matches are a subset of the old ones.
+            result = {mid for mid in self._last_result if self._matches(mid, terms)}
+        else:
+            result = None
+            for term in sorted(set(terms), key=len, reverse=True):
+                ids = self._ids_with_prefix(term)
+                result = ids if result is None else result & ids
+                if not result:
+                    break
+
+        self._last_query = normalized
+        self._last_result = result
+        return result
@@ -0,0 +1,113 @@
+"""
+Report data model.
+
+A ReportDataset is fetched once per filter change and is the one source for
+everything a report shows: the Treeview, CSV export, the print preview and
+the PDF. Values stay typed (numbers, dates) until they are formatted for
+display, so sorting and totals never parse strings back out of Tk.
+"""
+from datetime import date
+import report_renderer
+from sorting import TEXT, BADGE, INT, NUMBER, MONEY, DATE, ColumnSorter, parse_date
+
+TREE_ANCHORS = {"LEFT": "w", "CENTER": "center", "RIGHT": "e"}
+
+
+class ReportColumn:
+    """One report column: key, heading, value kind, alignment and tree width."""
+
+    def __init__(self, key, heading=None, kind=TEXT, align="LEFT", width=100, total=False):
+        self.key = key
+        self.heading = heading or key.replace("_", " ").title()
+        self.kind = kind
+        self.align = align
+        self.width = width
+        self.total = total
+
+    def format(self, value):
+        if value is None or value == "":
+            return ""
+        if self.kind == MONEY:
+            return f"{value:.2f}"
+        if self.kind == NUMBER:
+            return f"{value:g}"
+        if self.kind == DATE and isinstance(value, date):
+            return value.strftime("%m-%d-%Y")
+        return str(value)
+
+
+class ReportDataset:
+    """
+    Typed rows for one set of report filters.
+
+    rows are tuples of values in column order; each gets a stable row id
+    (its fetch position, as a string) used as the Treeview iid. order holds
+    the row ids in display order and is what sort() rearranges.
+    """
+
+    def __init__(self, columns, rows, filters=None):
+        self.columns = list(columns)
+        self.rows = [tuple(row) for row in rows]
+        self.filters = dict(filters or {})
+        self.order = [str(i) for i in range(len(self.rows))]
+        self.sorted_by = None  # (column key, reverse)
+        self._sorter = ColumnSorter({col.key: col.kind for col in self.columns})
+        self.totals = {
+            col.key: sum(row[i] or 0 for row in self.rows)
+            for i, col in enumerate(self.columns) if col.total
+        }
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def keys(self):
+        return tuple(col.key for col in self.columns)
+
+    def headings(self):
+        return [col.heading for col in self.columns]
+
+    def column_index(self, key):
+        return self.keys.index(key)
+
+    def row(self, row_id):
+        return self.rows[int(row_id)]
+
+    def format_row(self, row):
+        return tuple(col.format(value) for col, value in zip(self.columns, row))
+
+    def display_rows(self):
+        """(row id, formatted values) pairs in display order."""
+        for row_id in self.order:
+            yield row_id, self.format_row(self.rows[int(row_id)])
+
+    def sort(self, key, reverse=False):
+        index = self.column_index(key)
+        self.order = self._sorter.order(
+            key, lambda: ((str(i), row[index]) for i, row in enumerate(self.rows)), reverse)
+        self.sorted_by = (key, reverse)
+
+    def total_lines(self):
+        if not self.totals:
+            return []
+        parts = [f"{col.heading}: {col.format(self.totals[col.key])}"
+                 for col in self.columns if col.key in self.totals]
+        return ["Totals - " + "    ".join(parts)]
+
+    # ---------- Outputs ----------
+    def write_csv(self, writer):
+        writer.writerow(self.headings())
+        for _, values in self.display_rows():
+            writer.writerow(values)
+
+    def report_table(self, title, subtitles=(), mask_column=None):
+        """A report_renderer.ReportTable reading this dataset in display order."""
+        return report_renderer.ReportTable(
+            title,
+            self.headings(),
+            lambda: (values for _, values in self.display_rows()),
+            subtitles=subtitles,
+            align={i: col.align for i, col in enumerate(self.columns)},
+            mask_column=mask_column,
+            footer_lines=self.total_lines(),
+        )
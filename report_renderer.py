@@ -0,0 +1,391 @@
+"""
+Table report rendering.
+
+Every printable report is a title, a few subtitle lines and one table. The
+rows come from a callable returning a fresh iterator, and are read twice:
+once to measure column widths and count pages, once to draw. Only one
+page's worth of rows is held at a time, so a report renders in linear time
+with memory bounded by the page size.
+
+RenderQueue renders on a worker thread and keeps the last PDF per report
+key, for the GUI's Print and Save as PDF buttons.
+"""
+import os
+import queue
+import tempfile
+import threading
+from datetime import datetime
+from itertools import islice
+
+# reportlab is imported where it is used, so the GUI does not load it until
+# the first report is previewed or printed.
+
+ORG_NAME = "Dug Hill Rod & Gun Club"
+
+FONT = "Helvetica"
+BOLD_FONT = "Helvetica-Bold"
+FONT_SIZE = 9
+MIN_FONT_SIZE = 6.5
+MARGIN = 36
+CELL_PADDING = 3
+
+# Plain-text preview layout
+PREVIEW_ROWS_PER_PAGE = 34
+PREVIEW_MAX_PAGES = 25
+MASK = "*****"
+
+
+class ReportTable:
+    """
+    What to print: headings, rows and layout hints.
+
+    rows is a callable returning an iterable of row value sequences; it is
+    called once per pass. align maps a column index to "LEFT", "CENTER" or
+    "RIGHT". mask_column, when set, prints that column as *****.
+    footer_lines are printed above the generated/page line on every page.
+    """
+
+    def __init__(self, title, headers, rows, subtitles=(), align=None,
+                 mask_column=None, footer_lines=(), generated=None):
+        self.title = title
+        self.headers = [str(h) for h in headers]
+        self.rows = rows
+        self.subtitles = list(subtitles)
+        self.align = dict(align or {})
+        self.mask_column = mask_column
+        self.footer_lines = list(footer_lines)
+        self.generated = generated or datetime.now().strftime("%m-%d-%Y %H:%M:%S")
+
+    def snapshot(self):
+        """
+        A copy whose rows are read from the source now. Use it to hand a
+        report to another thread when the source is a Tk widget or may change.
+        """
+        rows = [tuple(row) for row in self.rows()]
+        return ReportTable(self.title, self.headers, lambda: rows, self.subtitles, self.align,
+                           self.mask_column, self.footer_lines, self.generated)
+
+    def fingerprint(self):
+        """Hash of everything printed except the generation time."""
+        return hash((self.title, tuple(self.subtitles), tuple(self.headers),
+                     tuple(sorted(self.align.items())), self.mask_column,
+                     tuple(self.footer_lines), tuple(tuple(cells) for cells in self.iter_rows())))
+
+    def iter_rows(self):
+        """Rows as lists of strings, cut to the header width and masked."""
+        ncols = len(self.headers)
+        for row in self.rows():
+            cells = ["" if v is None else str(v) for v in list(row)[:ncols]]
+            cells += [""] * (ncols - len(cells))
+            if self.mask_column is not None and self.mask_column < ncols:
+                cells[self.mask_column] = MASK
+            yield cells
+
+    def measure(self, points=True):
+        """
+        One pass over the rows: (row count, widest text per column in points
+        at FONT_SIZE, widest text per column in characters). With
+        points=False only characters are counted, reportlab is not imported,
+        and the points list is None; the text preview needs no more.
+        """
+        if points:
+            from reportlab.pdfbase.pdfmetrics import stringWidth
+            widths = [stringWidth(h, BOLD_FONT, FONT_SIZE) for h in self.headers]
+        else:
+            widths = None
+        chars = [len(h) for h in self.headers]
+        count = 0
+        for cells in self.iter_rows():
+            count += 1
+            for i, cell in enumerate(cells):
+                if len(cell) > chars[i]:
+                    chars[i] = len(cell)
+                if widths is not None:
+                    width = stringWidth(cell, FONT, FONT_SIZE)
+                    if width > widths[i]:
+                        widths[i] = width
+        return count, widths, chars
+
+
+# ------------------ Layout ----------------- #
+def fit_columns(text_widths, page_sizes=None):
+    """
+    Pick a page size, font size and column widths that fit the table across
+    one page: the first page size that fits at FONT_SIZE, else the first that
+    fits with the font shrunk to no less than MIN_FONT_SIZE, else the last
+    page size at MIN_FONT_SIZE (long cells are clipped). Spare width is
+    shared out in proportion to the columns' text widths.
+
+    Returns (pagesize, font_size, col_widths, clip). page_sizes defaults to
+    letter portrait, then landscape.
+    """
+    if page_sizes is None:
+        from reportlab.lib.pagesizes import letter, landscape
+        page_sizes = (letter, landscape(letter))
+    padding = 2 * CELL_PADDING * len(text_widths)
+    text_total = sum(text_widths) or 1.0
+
+    def layout(pagesize, size):
+        available = pagesize[0] - 2 * MARGIN
+        needed = [w * size / FONT_SIZE + 2 * CELL_PADDING for w in text_widths]
+        spare = available - sum(needed)
+        if spare >= 0:
+            widths = [n + spare * w / text_total for n, w in zip(needed, text_widths)]
+            return pagesize, size, widths, False
+        # Still too wide at the smallest font: scale every column down
+        scale = available / sum(needed)
+        return pagesize, size, [n * scale for n in needed], True
+
+    for pagesize in page_sizes:
+        if text_total + padding <= pagesize[0] - 2 * MARGIN:
+            return layout(pagesize, FONT_SIZE)
+    for pagesize in page_sizes:
+        size = FONT_SIZE * (pagesize[0] - 2 * MARGIN - padding) / text_total
+        if size >= MIN_FONT_SIZE:
+            return layout(pagesize, int(size * 2) / 2.0)
+    return layout(page_sizes[-1], MIN_FONT_SIZE)
+
+
+def _clip(text, width, font, size):
+    """Cut text to fit width, ending in an ellipsis."""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    if stringWidth(text, font, size) <= width:
+        return text
+    while text and stringWidth(text + "...", font, size) > width:
+        text = text[:-1]
+    return text + "..."
+
+
+# ------------------ PDF ----------------- #
+def render_pdf(report, path, progress=None, cancel=None):
+    """
+    Write report to a PDF at path; returns the number of pages.
+    progress, if given, is called as progress(page, total_pages) after
+    each page is drawn. cancel, a threading.Event, is checked between pages;
+    when it is set RenderCancelled is raised and the file is left unfinished.
+    """
+    from reportlab.lib import colors
+    from reportlab.pdfgen import canvas
+    from reportlab.platypus import Table, TableStyle
+
+    count, text_widths, _ = report.measure()
+    pagesize, size, col_widths, clip = fit_columns(text_widths)
+    page_width, page_height = pagesize
+    leading = size * 1.2
+    row_height = leading + 2 * CELL_PADDING
+
+    header_height = 14 + 13 + 12 * len(report.subtitles) + 8
+    footer_height = 12 * (len(report.footer_lines) + 2) + 6
+    body_height = page_height - 2 * MARGIN - header_height - footer_height
+    rows_per_page = max(1, int(body_height // row_height) - 1)  # less the heading row
+    total_pages = max(1, -(-count // rows_per_page))
+
+    style = [
+        ("FONT", (0, 0), (-1, 0), BOLD_FONT, size, leading),
+        ("FONT", (0, 1), (-1, -1), FONT, size, leading),
+        ("TOPPADDING", (0, 0), (-1, -1), CELL_PADDING),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), CELL_PADDING),
+        ("LEFTPADDING", (0, 0), (-1, -1), CELL_PADDING),
+        ("RIGHTPADDING", (0, 0), (-1, -1), CELL_PADDING),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.75, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]
+    for col, align in report.align.items():
+        style.append(("ALIGN", (col, 0), (col, -1), align))
+    stripe = ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f0f0f0")])
+    table_style = TableStyle(style + [stripe])
+
+    def draw_frame(c, page):
+        center = page_width / 2
+        y = page_height - MARGIN - 12
+        c.setFont(BOLD_FONT, 12)
+        c.drawCentredString(center, y, ORG_NAME)
+        y -= 13
+        c.setFont(BOLD_FONT, 11)
+        c.drawCentredString(center, y, report.title)
+        c.setFont(FONT, 10)
+        for line in report.subtitles:
+            y -= 12
+            c.drawCentredString(center, y, line)
+
+        y = MARGIN + footer_height - 6
+        c.setLineWidth(0.75)
+        c.line(MARGIN, y, page_width - MARGIN, y)
+        c.setFont(FONT, 9)
+        lines = list(report.footer_lines)
+        lines.append(f"Generated: {report.generated}    Page {page} of {total_pages}")
+        if page == total_pages:
+            lines.append("End of Report")
+        for line in lines:
+            y -= 12
+            c.drawCentredString(center, y, line)
+
+    c = canvas.Canvas(path, pagesize=pagesize)
+    c.setTitle(report.title)
+    rows = report.iter_rows()
+    table_top = page_height - MARGIN - header_height
+    for page in range(1, total_pages + 1):
+        if cancel is not None and cancel.is_set():
+            raise RenderCancelled()
+        chunk = list(islice(rows, rows_per_page))
+        if clip:
+            chunk = [[_clip(cell, w - 2 * CELL_PADDING, FONT, size)
+                      for cell, w in zip(cells, col_widths)] for cells in chunk]
+        draw_frame(c, page)
+        table = Table([report.headers] + chunk, colWidths=col_widths, style=table_style)
+        _, height = table.wrapOn(c, page_width - 2 * MARGIN, body_height)
+        table.drawOn(c, MARGIN, table_top - height)
+        c.showPage()
+        if progress is not None:
+            progress(page, total_pages)
+    c.save()
+    return total_pages
+
+
+# ------------------ Background Rendering ----------------- #
+class RenderCancelled(Exception):
+    """Raised by render_pdf() when its cancel event is set."""
+
+
+class RenderJob:
+    """
+    One PDF being rendered. The worker fills in pages_done/total_pages as it
+    goes and sets done when finished; path (or error) is valid after that.
+    A cancelled job finishes with a RenderCancelled error.
+    """
+
+    def __init__(self, key, report):
+        self.key = key
+        self.report = report
+        self.fingerprint = None  # computed on the worker
+        self.pages_done = 0
+        self.total_pages = 0
+        self.path = None
+        self.error = None
+        self.done = threading.Event()
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop rendering at the next page boundary (or before it starts)."""
+        self.cancelled.set()
+
+
+class RenderQueue:
+    """
+    Renders reports to temporary PDFs on one worker thread.
+
+    The last PDF rendered for each key is kept; when the next job for that
+    key has unchanged content, the worker hands it the same file instead of
+    rendering again. Content is compared by ReportTable.fingerprint() on the
+    worker, so render() does no per-row work on the calling thread. Reports
+    must be snapshots, since the worker reads their rows off the Tk thread.
+    """
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._latest = {}  # key -> most recent RenderJob
+        self._thread = None
+
+    def render(self, report, key):
+        job = RenderJob(key, report)
+        with self._lock:
+            latest = self._latest.get(key)
+            self._latest[key] = job
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, name="pdf-render", daemon=True)
+                self._thread.start()
+        self._jobs.put((job, latest))
+        return job
+
+    def _work(self):
+        while True:
+            job, replaced = self._jobs.get()
+            if replaced is not None:
+                replaced.done.wait()
+            try:
+                self._run(job, replaced)
+            except Exception as e:
+                job.error = e
+            if replaced is not None:
+                self._discard(replaced)
+            job.report = None  # the rows are no longer needed
+            job.done.set()
+
+    def _run(self, job, replaced):
+        if job.cancelled.is_set():
+            raise RenderCancelled()
+        job.fingerprint = job.report.fingerprint()
+        if replaced is not None and replaced.path and replaced.fingerprint == job.fingerprint:
+            # Unchanged since the last render for this key: reuse its file
+            job.path, replaced.path = replaced.path, None
+            return
+
+        fd, path = tempfile.mkstemp(prefix="report-", suffix=".pdf")
+        os.close(fd)
+
+        def progress(page, total):
+            job.pages_done, job.total_pages = page, total
+
+        try:
+            render_pdf(job.report, path, progress, job.cancelled)
+        except Exception:
+            self._discard_path(path)
+            raise
+        job.path = path
+
+    def _discard(self, job):
+        if job.path:
+            self._discard_path(job.path)
+
+    @staticmethod
+    def _discard_path(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # still open in a viewer
+
+
+# ------------------ Text Preview ----------------- #
+def iter_preview_lines(report, rows_per_page=PREVIEW_ROWS_PER_PAGE, max_pages=PREVIEW_MAX_PAGES):
+    """
+    Yield the report as fixed-width text lines for an on-screen preview,
+    one line at a time. Only the first max_pages pages are produced; a
+    closing note says how many more the PDF has.
+    """
+    count, _, widths = report.measure(points=False)
+    widths = [w + 2 for w in widths]
+    total_width = sum(widths) + len(widths) - 1
+    total_pages = max(1, -(-count // rows_per_page))
+    justify = {"CENTER": str.center, "RIGHT": str.rjust}
+
+    def format_row(cells):
+        return " ".join(
+            justify.get(report.align.get(i), str.ljust)(cell, w)
+            for i, (cell, w) in enumerate(zip(cells, widths))
+        )
+
+    rows = report.iter_rows()
+    for page in range(1, min(total_pages, max_pages) + 1):
+        if page > 1:
+            yield ""
+        yield ORG_NAME.center(total_width)
+        yield report.title.center(total_width)
+        for line in report.subtitles:
+            yield line.center(total_width)
+        yield "=" * total_width
+        yield format_row(report.headers)
+        yield "-" * total_width
+        for cells in islice(rows, rows_per_page):
+            yield format_row(cells)
+        yield "=" * total_width
+        for line in report.footer_lines:
+            yield line.center(total_width)
+        yield f"Generated: {report.generated}".center(total_width)
+        yield f"Page {page} of {total_pages}".center(total_width)
+        if page == total_pages:
+            yield "End of Report".center(total_width)
+    if total_pages > max_pages:
+        yield ""
+        yield (f"... {total_pages - max_pages} more pages. "
+               "Print or Save as PDF for the full report.").center(total_width)
@@ -0,0 +1,274 @@
+"""
+Live RFID swipe ingestion.
+
+Reads card numbers, one per line, from the door reader while a meeting is
+running and records attendance for the matching members:
+
+    python rfid_service.py /dev/ttyUSB0          # serial-style device file
+    python rfid_service.py /tmp/door.fifo        # named pipe
+    python rfid_service.py -                     # stdin
+    python rfid_service.py tcp:8765              # local TCP socket
+    python rfid_service.py unix:/tmp/door.sock   # local Unix socket
+
+Cards are resolved from an in-memory card -> member cache (unknown cards are
+remembered for UNKNOWN_CARD_TTL seconds too), each member is
+recorded once per meeting date, and rows are written in micro-batches on a
+background thread so a burst of swipes never waits on a commit.
+"""
+import argparse
+import os
+import queue
+import socket
+import stat
+import sys
+import threading
+import time
+from datetime import datetime
+import database
+
+RECORDED = "recorded"
+DUPLICATE = "duplicate"
+UNKNOWN = "unknown"
+
+RECONNECT_DELAY = 5  # seconds before reopening a source that failed
+UNKNOWN_CARD_TTL = 30  # seconds an unknown card is answered from memory
+
+
+class SwipeIngestService:
+    """
+    Resolve, dedupe and batch-write card swipes.
+
+    swipe() can be called from any thread (the source readers call it); it
+    only touches in-memory state and a queue. The writer thread drains the
+    queue every flush_interval seconds, or as soon as batch_size rows are
+    waiting, and writes them with one executemany per batch.
+    """
+
+    def __init__(self, meeting_date=None, status="Attended", batch_size=200,
+                 flush_interval=0.5, on_swipe=None, db_path=None):
+        self.meeting_date = meeting_date
+        self.status = status
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_swipe = on_swipe
+        self.db_path = db_path
+
+        self._cards = {}
+        self._unknown = {}   # card -> time.monotonic() until which it stays unknown
+        self._recorded = {}  # meeting_date -> member ids already recorded
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._threads = []
+        self._writer = None
+        self.written = 0
+
+    # ---------- Cache ----------
+    def load_cards(self):
+        """(Re)load the card -> member id cache from the database."""
+        cards = {card: member_id for card, member_id in database.get_card_member_ids(self.db_path)}
+        with self._lock:
+            self._cards = cards
+            self._unknown = {}
+
+    def _member_for_card(self, card):
+        with self._lock:
+            member_id = self._cards.get(card)
+            unknown_until = self._unknown.get(card, 0)
+        if member_id is None and time.monotonic() >= unknown_until:
+            # A card issued since the cache was loaded, or one we don't know
+            member = database.get_member_by_card_internal(card, self.db_path)
+            with self._lock:
+                if member is not None and not member["deleted"]:
+                    member_id = self._cards[card] = member["id"]
+                    self._unknown.pop(card, None)
+                else:
+                    # Repeated swipes of a bad card stay off the database for a while
+                    self._unknown[card] = time.monotonic() + UNKNOWN_CARD_TTL
+        return member_id
+
+    def _recorded_for(self, date):
+        """The set of member ids already recorded for date, loaded once per date."""
+        with self._lock:
+            recorded = self._recorded.get(date)
+        if recorded is None:
+            # Query without the lock so other swipes and the writer don't wait
+            ids = database.get_attendance_member_ids(date, self.db_path)
+            with self._lock:
+                recorded = self._recorded.setdefault(date, ids)
+        return recorded
+
+    # ---------- Swipes ----------
+    def swipe(self, card, when=None):
+        """Handle one card read; returns RECORDED, DUPLICATE or UNKNOWN."""
+        card = (card or "").strip()
+        if not card:
+            return None
+        date = self.meeting_date or (when or datetime.now()).strftime("%Y-%m-%d")
+        member_id = self._member_for_card(card)
+
+        if member_id is None:
+            result = UNKNOWN
+        else:
+            recorded = self._recorded_for(date)
+            with self._lock:
+                if member_id in recorded:
+                    result = DUPLICATE
+                else:
+                    recorded.add(member_id)
+                    result = RECORDED
+            if result == RECORDED:
+                self._queue.put((member_id, date, self.status, None))
+
+        if self.on_swipe:
+            self.on_swipe(card, member_id, result)
+        return result
+
+    # ---------- Writer ----------
+    def _write_loop(self):
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch):
+        try:
+            with database.transaction(self.db_path) as conn:
+                database.add_meeting_attendance_many(batch, conn=conn)
+            self.written += len(batch)
+        except Exception as e:
+            # Let the members swipe again rather than silently losing them
+            with self._lock:
+                for member_id, date, _, _ in batch:
+                    self._recorded.get(date, set()).discard(member_id)
+            print(f"Failed to write {len(batch)} attendance rows: {e}", file=sys.stderr)
+
+    # ---------- Lifecycle ----------
+    def start(self):
+        self.load_cards()
+        self._stop.clear()
+        self._writer = threading.Thread(target=self._write_loop, name="swipe-writer", daemon=True)
+        self._writer.start()
+        return self
+
+    def add_source(self, spec):
+        """Start reading swipes from a source spec (see the module docstring)."""
+        thread = threading.Thread(target=self._read_source, args=(spec,),
+                                  name=f"swipe-source {spec}", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        return thread
+
+    def stop(self, timeout=5):
+        """Stop accepting swipes and flush everything queued so far."""
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join(timeout)
+
+    def is_running(self):
+        """True while any source added with add_source() is still being read."""
+        return any(thread.is_alive() for thread in self._threads)
+
+    def _read_lines(self, stream):
+        for line in stream:
+            if self._stop.is_set():
+                break
+            if isinstance(line, bytes):
+                line = line.decode("utf-8", "replace")
+            try:
+                self.swipe(line)
+            except Exception as e:
+                # One bad lookup must not stop the reader
+                print(f"Failed to handle swipe {line.strip()!r}: {e}", file=sys.stderr)
+
+    def _read_source(self, spec):
+        """Read spec until it is finished or stop() is called, reopening it after errors."""
+        while not self._stop.is_set():
+            try:
+                if self._read_source_once(spec):
+                    return
+            except ValueError as e:
+                print(f"Swipe source {spec}: {e}; not reading it", file=sys.stderr)
+                return
+            except Exception as e:
+                print(f"Swipe source {spec} failed: {e}; retrying in {RECONNECT_DELAY}s",
+                      file=sys.stderr)
+                self._stop.wait(RECONNECT_DELAY)
+
+    def _read_source_once(self, spec):
+        """Read spec once; True if it is finished rather than waiting to be reopened."""
+        if spec == "-":
+            self._read_lines(sys.stdin)
+            return True
+        if spec.startswith("tcp:"):
+            host, _, port = spec[4:].rpartition(":")
+            server = socket.create_server((host or "127.0.0.1", int(port)))
+            self._serve(server)
+            return True
+        if spec.startswith("unix:"):
+            path = spec[5:]
+            if os.path.exists(path):
+                os.unlink(path)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(path)
+            server.listen()
+            self._serve(server)
+            return True
+        # Device files and named pipes are reopened when the writer goes
+        # away; a plain file (a saved log) is read once.
+        with open(spec, "r", encoding="utf-8", errors="replace") as stream:
+            self._read_lines(stream)
+        return stat.S_ISREG(os.stat(spec).st_mode)
+
+    def _serve(self, server):
+        server.settimeout(0.5)
+        with server:
+            while not self._stop.is_set():
+                try:
+                    client, _ = server.accept()
+                except socket.timeout:
+                    continue
+                threading.Thread(target=self._read_client, args=(client,), daemon=True).start()
+
+    def _read_client(self, client):
+        try:
+            with client, client.makefile("rb") as stream:
+                self._read_lines(stream)
+        except OSError as e:
+            print(f"Swipe client disconnected: {e}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record meeting attendance from live RFID swipes.")
+    parser.add_argument("sources", nargs="+", help="device/pipe path, '-', tcp:[HOST:]PORT or unix:PATH")
+    parser.add_argument("--date", help="meeting date (YYYY-MM-DD); default is the date of each swipe")
+    parser.add_argument("--status", default="Attended", help="attendance status to record")
+    args = parser.parse_args(argv)
+
+    def report(card, member_id, result):
+        print(f"{datetime.now():%H:%M:%S}  {card}  {result}" + (f" (member {member_id})" if member_id else ""))
+
+    service = SwipeIngestService(meeting_date=args.date, status=args.status, on_swipe=report).start()
+    for spec in args.sources:
+        service.add_source(spec)
+    try:
+        while service.is_running():
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        print(f"Recorded {service.written} attendance rows.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Column sorting for the member and report trees.
+
+Sort keys are computed once per row and column, typed by column kind
+(badges as ints, dates as ordinals, numbers as numbers, text case-folded),
+and the ascending order for each column is cached until the rows change.
+Reversing a sort reads the cached order backwards. Blank values stay at the
+bottom either way.
+"""
+from datetime import date, datetime
+
+# Column kinds
+TEXT = "text"
+BADGE = "badge"
+INT = "int"
+NUMBER = "number"
+MONEY = "money"
+DATE = "date"
+
+DATE_FORMATS = ("%Y-%m-%d", "%m-%d-%Y", "%m/%d/%Y")
+
+
+def parse_date(value):
+    """A date from a date, datetime or date string; None otherwise."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(str(value), fmt).date()
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def sort_key(kind, value):
+    """
+    Typed sort key for one value, or None for a blank. Values of the wrong
+    type for the kind (a badge with letters, an unreadable date) sort after
+    the well-typed ones, as text.
+    """
+    if value is None:
+        return None
+    if kind in (INT, NUMBER, MONEY) and isinstance(value, (int, float)):
+        return (0, value)
+    text = str(value).strip()
+    if not text:
+        return None
+    if kind == BADGE:
+        if text.isdigit():
+            return (0, int(text))
+    elif kind == DATE:
+        parsed = parse_date(value)
+        if parsed is not None:
+            return (0, parsed.toordinal())
+    elif kind in (INT, NUMBER, MONEY):
+        try:
+            return (0, float(text))
+        except ValueError:
+            pass
+    return (1, text.casefold())
+
+
+class ColumnSorter:
+    """
+    Cached sort orders for one row model.
+
+    kinds maps a column to its kind (TEXT by default). order() computes a
+    column's keys and ascending order on first use; after that, sorting the
+    column either way is O(n). Call invalidate() whenever rows change.
+    """
+
+    def __init__(self, kinds=None):
+        self.kinds = dict(kinds or {})
+        self._orders = {}  # column -> (ids with values ascending, ids with blanks)
+
+    def invalidate(self):
+        self._orders.clear()
+
+    def order(self, column, values, reverse=False):
+        """
+        Row ids sorted by column. values is a callable returning (row id,
+        value) pairs for every row; it is only called on a cache miss.
+        """
+        cached = self._orders.get(column)
+        if cached is None:
+            kind = self.kinds.get(column, TEXT)
+            keyed, blanks = [], []
+            for row_id, value in values():
+                key = sort_key(kind, value)
+                if key is None:
+                    blanks.append(row_id)
+                else:
+                    keyed.append((key, row_id))
+            keyed.sort(key=lambda pair: pair[0])
+            cached = ([row_id for _, row_id in keyed], blanks)
+            self._orders[column] = cached
+        ascending, blanks = cached
+        return (ascending[::-1] if reverse else ascending) + blanks
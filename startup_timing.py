@@ -0,0 +1,77 @@
+"""
+Opt-in cold-start timing.
+
+    DH_STARTUP_TIMING=1 python main.py
+
+prints how long each startup module import took and when the window was
+built, first painted and first filled with members, measured from process
+start. To enforce a budget, for example in a script:
+
+    DH_STARTUP_TIMING=1 DH_STARTUP_BUDGET_MS=1500 DH_STARTUP_EXIT=1 python main.py
+
+DH_STARTUP_BUDGET_MS flags a first data load slower than the budget, and
+DH_STARTUP_EXIT closes the program once the report is printed, with exit
+status 1 if the budget was exceeded.
+"""
+import importlib
+import os
+import sys
+import time
+
+ENABLED = os.environ.get("DH_STARTUP_TIMING", "") not in ("", "0")
+BUDGET_MS = float(os.environ.get("DH_STARTUP_BUDGET_MS") or 0)
+EXIT_AFTER_REPORT = os.environ.get("DH_STARTUP_EXIT", "") not in ("", "0")
+
+_start = time.perf_counter()
+_imports = []  # (module name, ms)
+_marks = []    # (event, ms since start)
+_reported = False
+_over_budget = False
+
+
+def timed_import(name):
+    """Import a module, recording how long it took when timing is on."""
+    if not ENABLED or name in sys.modules:
+        return importlib.import_module(name)
+    began = time.perf_counter()
+    module = importlib.import_module(name)
+    _imports.append((name, (time.perf_counter() - began) * 1000))
+    return module
+
+
+def mark(event):
+    """Record a startup milestone (no-op unless timing is on)."""
+    if ENABLED:
+        _marks.append((event, (time.perf_counter() - _start) * 1000))
+
+
+def elapsed(event):
+    return next((ms for name, ms in _marks if name == event), None)
+
+
+def report(root=None):
+    """Print the timings once; with DH_STARTUP_EXIT, also quit root."""
+    global _reported, _over_budget
+    if not ENABLED or _reported:
+        return
+    _reported = True
+
+    lines = ["Startup timing (ms):"]
+    for name, ms in _imports:
+        lines.append(f"  import {name:<24}{ms:9.1f}")
+    for event, ms in _marks:
+        lines.append(f"  {event:<31}{ms:9.1f}")
+    loaded = elapsed("first data load")
+    if BUDGET_MS and loaded is not None:
+        _over_budget = loaded > BUDGET_MS
+        verdict = "OVER BUDGET" if _over_budget else "within budget"
+        lines.append(f"  budget {BUDGET_MS:.0f} ms: {verdict}")
+    print("\n".join(lines), file=sys.stderr)
+
+    if EXIT_AFTER_REPORT and root is not None:
+        root.after_idle(root.destroy)
+
+
+def exit_status():
+    """1 if the last report was over budget, else 0."""
+    return 1 if _over_budget else 0
@@ -0,0 +1,155 @@
+"""
+Checks for database.py, run against a fresh database in a temporary folder:
+
+    python -m pytest test_database.py
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import database
+
+
+class ReportQueryPlanTest(unittest.TestCase):
+    YEAR = 2025
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._db_name = database.DB_NAME
+        database.DB_NAME = os.path.join(self._tmp.name, "members.db")
+
+    def tearDown(self):
+        database.close_all_connections()
+        database.DB_NAME = self._db_name
+        self._tmp.cleanup()
+
+    def plans(self, call):
+        """EXPLAIN QUERY PLAN lines for every SELECT that call() issues."""
+        statements = []
+        conn = database.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            conn.set_trace_callback(None)
+        return [line
+                for sql in statements if sql.lstrip().upper().startswith(("SELECT", "WITH"))
+                for line in database.explain_query_plan(sql)]
+
+    def assertUsesIndex(self, call, index):
+        plans = self.plans(call)
+        self.assertTrue(any(f"USING INDEX {index} " in line for line in plans), plans)
+
+    def test_dues_queries_use_indexes(self):
+        self.assertUsesIndex(lambda: database.get_dues_summary(self.YEAR), "idx_dues_member_year")
+        self.assertUsesIndex(lambda: database.get_dues_report(year=self.YEAR),
+                             "idx_dues_member_payment_date")
+
+    def test_attendance_queries_use_indexes(self):
+        self.assertUsesIndex(lambda: database.get_attendance_matrix(self.YEAR),
+                             "idx_meeting_attendance_member_date")
+        self.assertUsesIndex(lambda: database.count_member_attendance(1, self.YEAR),
+                             "idx_meeting_attendance_member_date")
+
+    def test_work_hours_queries_use_indexes(self):
+        self.assertUsesIndex(
+            lambda: database.get_work_hours_report(start_date=f"{self.YEAR}-01-01",
+                                                   end_date=f"{self.YEAR}-12-31"),
+            "idx_work_hours_member_date")
+        self.assertUsesIndex(lambda: database.get_member_work_hours_for_year(1, self.YEAR),
+                             "idx_work_hours_member_date")
+
+    def test_no_report_query_scans_an_indexed_table(self):
+        self.assertEqual(database.check_report_query_plans(self.YEAR), {})
+
+    def test_full_table_scans_resolves_aliases(self):
+        scans = database.full_table_scans
+        self.assertEqual(scans("SELECT m.id FROM members m"), {"members"})
+        self.assertEqual(scans("SELECT a.* FROM meeting_attendance a WHERE a.status = 'Present'"),
+                         {"meeting_attendance"})
+        self.assertEqual(scans("SELECT * FROM work_hours AS f WHERE f.hours > 1"), {"work_hours"})
+        self.assertEqual(scans("SELECT * FROM dues d WHERE d.member_id = 1"), set())
+
+
+class MemberSearchTest(unittest.TestCase):
+    MEMBERS = [
+        # badge, type, first, last, email
+        ("101", "Regular", "John", "Smith", "jsmith@example.com"),
+        ("102", "Life", "Johanna", "Smithers", "jo@example.com"),
+        ("103", "Regular", "Mary", "Jones", "mary@example.com"),
+        ("104", "Regular", "Jon", "Smithson", ""),
+    ]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._db_name = database.DB_NAME
+        database.DB_NAME = os.path.join(self._tmp.name, "members.db")
+        self.ids = {}
+        for badge, mtype, first, last, email in self.MEMBERS:
+            self.ids[badge] = database.add_member(
+                (badge, mtype, first, last, "", email, "", "", "", "", "", "", "", "", "", ""))
+
+    def tearDown(self):
+        database.close_all_connections()
+        database.DB_NAME = self._db_name
+        self._tmp.cleanup()
+
+    def badges(self, *args, **kwargs):
+        return [row["badge_number"] for row in database.search_members(*args, **kwargs)]
+
+    def drop_fts(self):
+        with database.transaction() as conn:
+            for trigger in ("members_fts_ai", "members_fts_ad", "members_fts_au"):
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("DROP TABLE members_fts")
+
+    def test_fts_terms_prefix_match(self):
+        self.assertTrue(database._has_member_fts(database.get_connection()))
+        self.assertEqual(sorted(self.badges("jo smi")), ["101", "102", "104"])
+        self.assertEqual(self.badges("mary@"), ["103"])
+        self.assertEqual(self.badges("nobody"), [])
+
+    def test_fts_sees_updates_and_skips_deleted(self):
+        database.update_member(self.ids["103"], ("103", "Regular", "Mary", "Smith", "", "", "", "",
+                                                 "", "", "", "", "", "", "", ""))
+        self.assertIn("103", self.badges("smith"))
+        database.soft_delete_member_by_id(self.ids["101"])
+        self.assertNotIn("101", self.badges("smith"))
+
+    def test_empty_query_returns_everyone_in_id_order(self):
+        self.assertEqual(self.badges(""), ["101", "102", "103", "104"])
+
+    def test_membership_type_and_limit(self):
+        self.assertEqual(self.badges("jo", membership_type="Life"), ["102"])
+        self.assertEqual(sorted(self.badges("smi", membership_type="All")), ["101", "102", "104"])
+        self.assertEqual(len(self.badges("jo", limit=2)), 2)
+        self.assertEqual(self.badges("", membership_type="Regular", limit=2), ["101", "103"])
+
+    def test_like_fallback_without_fts(self):
+        self.drop_fts()
+        self.assertFalse(database._has_member_fts(database.get_connection()))
+        self.assertEqual(self.badges("jo smi"), ["101", "102", "104"])  # by last name
+        self.assertEqual(self.badges("mith", membership_type="Life"), ["102"])
+        self.assertEqual(self.badges("smith", limit=1), ["101"])
+
+    def test_migration_without_fts5_warns_and_skips_index(self):
+        class NoFts5:
+            def __init__(self, conn):
+                self.conn = conn
+
+            def execute(self, sql, *params):
+                if "fts5" in sql:
+                    raise sqlite3.OperationalError("no such module: fts5")
+                return self.conn.execute(sql, *params)
+
+        self.drop_fts()
+        conn = database.get_connection()
+        with self.assertWarns(RuntimeWarning):
+            database._migration_4_member_fts(NoFts5(conn))
+        self.assertFalse(database._has_member_fts(conn))
+        self.assertEqual(self.badges("smith"), ["101", "102", "104"])
+
+
+if __name__ == "__main__":
+    unittest.main()
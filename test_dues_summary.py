@@ -0,0 +1,97 @@
+"""
+get_dues_summary() against the per-member queries the dues report used
+before it, on a fresh database in a temporary folder:
+
+    python -m pytest test_dues_summary.py
+"""
+import os
+import tempfile
+import unittest
+
+import database
+
+
+class DuesSummaryTest(unittest.TestCase):
+    YEAR = 2025
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._db_name = database.DB_NAME
+        database.DB_NAME = os.path.join(self._tmp.name, "members.db")
+        database.set_setting("dues_regular", "150")
+        database.set_setting("dues_life", "0")
+        self.paid_up = self.add_member("1", "Regular")
+        self.partial = self.add_member("2", "Regular")
+        self.unpaid = self.add_member("3", "Regular")
+        self.life = self.add_member("4", "Life")
+        self.no_setting = self.add_member("5", "Honorary")
+        self.deleted = self.add_member("6", "Regular")
+        conn = database.get_connection()
+        conn.execute("UPDATE members SET deleted = 1 WHERE id = ?", (self.deleted,))
+        conn.commit()
+
+        pay = database.add_dues_payment
+        pay(self.paid_up, 100, "2025-01-10", "Cash", year=self.YEAR)
+        pay(self.paid_up, 75, "2025-03-02", "Check", year=self.YEAR)
+        pay(self.paid_up, 150, "2026-01-05", "Card", year=self.YEAR + 1)
+        pay(self.partial, 40, "2025-02-01", "Cash", year=self.YEAR)
+        pay(self.partial, 10, "2025-02-01", "Check", year=self.YEAR)  # same day: first one wins
+        pay(self.partial, 5, "", "Card", year=self.YEAR)  # undated
+        pay(self.life, 20, "2025-06-30", "Cash", year=self.YEAR)
+        pay(self.deleted, 150, "2025-01-01", "Cash", year=self.YEAR)
+
+    def tearDown(self):
+        database.close_all_connections()
+        database.DB_NAME = self._db_name
+        self._tmp.cleanup()
+
+    @staticmethod
+    def add_member(badge, membership_type):
+        return database.add_member((badge, membership_type, f"First{badge}", f"Last{badge}")
+                                   + ("",) * 12)
+
+    def baseline_summary(self, year):
+        """
+        The dues report's old loop: a settings lookup and a dues query per
+        member.
+        """
+        rows = []
+        for m in database.get_all_members():
+            membership_type = m["membership_type"]
+            amount_due = float(database.get_setting(f"dues_{membership_type.lower()}") or 0)
+            total_paid, last_payment_date, method = 0, "", ""
+            for d in database.get_dues_by_member(m["id"]):
+                if int(d["year"]) != year:
+                    continue
+                total_paid += float(d["amount"])
+                date = d["payment_date"]
+                if date and (not last_payment_date or date > last_payment_date):
+                    last_payment_date = date
+                    method = d["method"]
+            rows.append((m["id"], amount_due, total_paid, last_payment_date, method,
+                         max(amount_due - total_paid, 0)))
+        return rows
+
+    def summary(self, year):
+        return [(r["id"], r["amount_due"], r["total_paid"], r["last_payment_date"], r["method"],
+                 r["balance_due"])
+                for r in database.get_dues_summary(year)]
+
+    def test_matches_per_member_queries(self):
+        for year in (self.YEAR, self.YEAR + 1, self.YEAR - 1):
+            with self.subTest(year=year):
+                self.assertEqual(self.summary(year), self.baseline_summary(year))
+
+    def test_summary_values(self):
+        rows = {r["id"]: r for r in database.get_dues_summary(self.YEAR)}
+        self.assertNotIn(self.deleted, rows)
+        self.assertEqual((rows[self.paid_up]["total_paid"], rows[self.paid_up]["balance_due"]),
+                         (175.0, 0.0))
+        self.assertEqual((rows[self.partial]["last_payment_date"], rows[self.partial]["method"],
+                          rows[self.partial]["balance_due"]), ("2025-02-01", "Cash", 95.0))
+        self.assertEqual((rows[self.unpaid]["total_paid"], rows[self.unpaid]["method"]), (0.0, ""))
+        self.assertEqual(rows[self.no_setting]["amount_due"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Checks for the scanner CSV import in import_meeting_data.py, run against a
+fresh database in a temporary folder:
+
+    python -m pytest test_import_meeting_data.py
+"""
+import os
+import tempfile
+import unittest
+
+import database
+from import_meeting_data import add_meeting_records_from_csv
+
+
+class MeetingCsvImportTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._db_name = database.DB_NAME
+        database.DB_NAME = os.path.join(self._tmp.name, "members.db")
+        self.ids = {}
+        for badge, card in (("101", "A1"), ("102", "B2"), ("103", "C3")):
+            self.ids[card] = database.add_member(
+                (badge, "Active", "First", "Last") + ("",) * 10 + (card, ""))
+
+    def tearDown(self):
+        database.close_all_connections()
+        database.DB_NAME = self._db_name
+        self._tmp.cleanup()
+
+    def write_csv(self, text):
+        path = os.path.join(self._tmp.name, "scans.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def attendance(self):
+        conn = database.get_connection()
+        return sorted(tuple(row) for row in conn.execute(
+            "SELECT member_id, meeting_date, status FROM meeting_attendance"))
+
+    def test_repeat_swipes_and_recorded_members_are_skipped(self):
+        database.add_meeting_attendance_many([(self.ids["C3"], "2025-03-04", "Present", None)])
+        path = self.write_csv(
+            "Card,Timestamp\n"
+            "A1,2025-03-04 19:01:00\n"
+            "A1,2025-03-04 19:02:00\n"    # repeat swipe
+            "B2,03/04/2025 07:05 PM\n"
+            " C3 ,2025-03-04 19:06:00\n"  # already recorded
+            "A1,2025-04-01 19:00:00\n"    # next meeting
+            ",2025-03-04 19:07:00\n"      # no card
+        )
+        summary = add_meeting_records_from_csv(path, batch_size=1)
+        self.assertEqual((summary["added"], summary["skipped"]), (3, 2))
+        self.assertEqual(summary["errors"], [])
+        self.assertEqual(self.attendance(), [
+            (self.ids["A1"], "2025-03-04", "Present"),
+            (self.ids["A1"], "2025-04-01", "Present"),
+            (self.ids["B2"], "2025-03-04", "Present"),
+            (self.ids["C3"], "2025-03-04", "Present"),
+        ])
+
+        # Importing the same log again adds nothing
+        summary = add_meeting_records_from_csv(path)
+        self.assertEqual((summary["added"], summary["skipped"]), (0, 5))
+
+    def test_meeting_date_overrides_timestamps(self):
+        path = self.write_csv("Card\nA1\nB2\nA1\n")
+        summary = add_meeting_records_from_csv(path, meeting_date="2025-05-06", status="Exempt")
+        self.assertEqual((summary["added"], summary["skipped"]), (2, 1))
+        self.assertEqual(self.attendance(), [(self.ids["A1"], "2025-05-06", "Exempt"),
+                                             (self.ids["B2"], "2025-05-06", "Exempt")])
+
+    def test_unknown_cards_and_bad_timestamps_are_reported(self):
+        path = self.write_csv("UID,Scan Time\nZZ9,2025-03-04 19:00\nA1,sometime\nB2,2025-03-04\n")
+        summary = add_meeting_records_from_csv(path)
+        self.assertEqual(summary["added"], 1)
+        self.assertEqual(summary["unmatched"], [{"line": 2, "card": "ZZ9"}])
+        self.assertEqual(summary["errors"], [(3, "Unreadable timestamp: 'sometime'")])
+
+    def test_missing_columns_are_rejected(self):
+        with self.assertRaises(ValueError):
+            add_meeting_records_from_csv(self.write_csv("Name,Timestamp\nx,2025-03-04\n"))
+        with self.assertRaises(ValueError):
+            add_meeting_records_from_csv(self.write_csv("Card\nA1\n"))
+        self.assertEqual(self.attendance(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
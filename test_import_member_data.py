@@ -0,0 +1,108 @@
+"""
+Checks for import_member_data.py, run against a fresh database in a
+temporary folder:
+
+    python -m pytest test_import_member_data.py
+"""
+import csv
+import os
+import tempfile
+import unittest
+
+import database
+from import_member_data import CSV_COLUMNS, import_members_from_csv
+
+
+class ImportMembersFromCsvTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._db_name = database.DB_NAME
+        database.DB_NAME = os.path.join(self._tmp.name, "members.db")
+        self.existing = database.add_member(("101", "Active", "John", "Smith") + ("",) * 12)
+
+    def tearDown(self):
+        database.close_all_connections()
+        database.DB_NAME = self._db_name
+        self._tmp.cleanup()
+
+    def write_csv(self, rows):
+        path = os.path.join(self._tmp.name, "import.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(CSV_COLUMNS.values()))
+            writer.writeheader()
+            for badge, first, last in rows:
+                writer.writerow({"Badge": badge, "Membership Type": "Active",
+                                 "First Name": first, "Last Name": last})
+        return path
+
+    def names(self):
+        conn = database.get_connection()
+        return {row["badge_number"]: (row["first_name"], row["last_name"])
+                for row in conn.execute("SELECT * FROM members")}
+
+    def import_csv(self, rows, on_duplicate, chunk_size=2):
+        return import_members_from_csv(self.write_csv(rows), on_duplicate, chunk_size)
+
+    ROWS = [
+        ("101", "Johnny", "Smith"),  # already in the database
+        ("102", "Mary", "Jones"),
+        ("", "No", "Badge"),
+        ("103", "Jon", "Smithson"),
+        ("102", "Maria", "Jones"),  # repeated in the file, in another chunk
+    ]
+
+    def test_skip_mode_keeps_existing_members(self):
+        summary = self.import_csv(self.ROWS, "skip")
+        self.assertEqual((summary["inserted"], summary["updated"], summary["skipped"]), (2, 0, 2))
+        self.assertEqual(summary["errors"], [(4, "Missing badge number")])
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(self.names(), {"101": ("John", "Smith"), "102": ("Mary", "Jones"),
+                                        "103": ("Jon", "Smithson")})
+
+    def test_update_mode_overwrites_existing_members(self):
+        summary = self.import_csv(self.ROWS, "update")
+        self.assertEqual((summary["inserted"], summary["updated"], summary["skipped"]), (2, 2, 0))
+        self.assertEqual(self.names(), {"101": ("Johnny", "Smith"), "102": ("Maria", "Jones"),
+                                        "103": ("Jon", "Smithson")})
+        self.assertEqual(database.get_member_by_id(self.existing)["first_name"], "Johnny")
+
+    def test_update_mode_last_row_wins_within_a_chunk(self):
+        summary = self.import_csv([("104", "A", "One"), ("104", "B", "Two")], "update")
+        self.assertEqual((summary["inserted"], summary["updated"]), (1, 0))
+        self.assertEqual(self.names()["104"], ("B", "Two"))
+
+    def test_fail_mode_aborts_without_writing(self):
+        summary = self.import_csv(self.ROWS, "fail")
+        self.assertTrue(summary["aborted"])
+        self.assertEqual((summary["inserted"], summary["updated"], summary["skipped"]), (0, 0, 0))
+        self.assertIn((2, "Line 2: badge 101 already exists"), summary["errors"])
+        self.assertEqual(self.names(), {"101": ("John", "Smith")})
+
+    def test_fail_mode_imports_a_clean_file(self):
+        summary = self.import_csv([("102", "Mary", "Jones"), ("103", "Jon", "Smithson")], "fail")
+        self.assertFalse(summary["aborted"])
+        self.assertEqual(summary["inserted"], 2)
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.import_csv(self.ROWS, "merge")
+
+    def test_one_notification_after_commit(self):
+        changes = []
+
+        def listener(action, member_id):
+            changes.append((action, member_id))
+
+        database.add_member_listener(listener)
+        self.addCleanup(database.remove_member_listener, listener)
+
+        self.import_csv(self.ROWS, "update")
+        self.assertEqual(changes, [(database.MEMBERS_IMPORTED, None)])
+        changes.clear()
+        self.import_csv(self.ROWS, "fail")  # rolled back
+        self.import_csv([("101", "John", "Smith")], "skip")  # nothing written
+        self.assertEqual(changes, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
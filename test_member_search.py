@@ -0,0 +1,83 @@
+"""
+Checks for member_search.py:
+
+    python -m pytest test_member_search.py
+"""
+import unittest
+
+from member_search import MemberSearchIndex, tokenize
+
+
+def member(member_id, first, last, badge="", email="", phone="", membership_type="Active"):
+    return {"id": member_id, "badge_number": badge, "first_name": first, "last_name": last,
+            "membership_type": membership_type, "email": email, "email2": "", "phone": phone}
+
+
+MEMBERS = [
+    member(1, "John", "Smith", "101", "john.smith@example.com", "(410) 555-0101"),
+    member(2, "Johanna", "Smithers", "102", "jo@example.com"),
+    member(3, "Mary", "Jones", "203", phone="410-555-0303", membership_type="Life"),
+    member(4, "Jon", "Smithson", "204"),
+]
+
+
+class MemberSearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = MemberSearchIndex(MEMBERS)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("John.Doe@Example.com"), ["john", "doe", "example", "com"])
+        self.assertEqual(tokenize(None), [])
+
+    def test_empty_query_means_everyone(self):
+        self.assertIsNone(self.index.search(""))
+        self.assertIsNone(self.index.search("  -- "))
+
+    def test_every_term_must_prefix_a_token(self):
+        self.assertEqual(self.index.search("jo"), {"1", "2", "3", "4"})
+        self.assertEqual(self.index.search("jo smith"), {"1", "2", "4"})
+        self.assertEqual(self.index.search("smith jo"), {"1", "2", "4"})
+        self.assertEqual(self.index.search("life"), {"3"})
+        self.assertEqual(self.index.search("example"), {"1", "2"})
+        self.assertEqual(self.index.search("zzz"), set())
+
+    def test_phone_digits_are_searchable(self):
+        self.assertEqual(self.index.search("4105550303"), {"3"})
+        self.assertEqual(self.index.search("555"), {"1", "3"})
+
+    def test_extended_query_narrows_previous_result(self):
+        self.assertEqual(self.index.search("jo"), {"1", "2", "3", "4"})
+        # Narrowing filters the last result: the postings are not consulted.
+        self.index._postings = None
+        self.assertEqual(self.index.search("joh"), {"1", "2"})
+        self.assertEqual(self.index.search("john"), {"1"})
+        self.assertEqual(self.index.search("john smi"), {"1"})
+
+    def test_unrelated_query_searches_again(self):
+        self.assertEqual(self.index.search("john"), {"1"})
+        self.assertEqual(self.index.search("mary"), {"3"})
+        self.assertEqual(self.index.search("jo"), {"1", "2", "3", "4"})
+
+    def test_update_reindexes_a_member(self):
+        self.assertEqual(self.index.search("jo"), {"1", "2", "3", "4"})
+        self.index.update(member(3, "Mary", "Zimmer", "203"))
+        self.assertEqual(self.index.search("jo"), {"1", "2", "4"})  # cached result dropped
+        self.assertEqual(self.index.search("zim"), {"3"})
+        self.index.update(member(5, "Zack", "Newman", "305"))
+        self.assertEqual(self.index.search("z"), {"3", "5"})
+        self.assertEqual(len(self.index), 5)
+        self.assertTrue(self.index.matches(5, "new"))
+
+    def test_remove_drops_a_member_and_its_tokens(self):
+        self.assertEqual(self.index.search("smith"), {"1", "2", "4"})
+        self.index.remove(2)
+        self.assertEqual(self.index.search("smith"), {"1", "4"})
+        self.assertEqual(self.index.search("johanna"), set())
+        self.assertNotIn("johanna", self.index._sorted_tokens)
+        self.assertFalse(self.index.matches(2, ""))
+        self.index.remove(99)  # not indexed
+        self.assertEqual(len(self.index), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+The migration chain, run on a database in the shape the old init_* functions
+created (user_version 0):
+
+    python -m pytest test_migrations.py
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import database
+
+# Tables as the pre-migration builds created them.
+BASELINE_SCHEMA = """
+    CREATE TABLE members (
+        id INTEGER PRIMARY KEY, badge_number TEXT, membership_type TEXT,
+        first_name TEXT, last_name TEXT, dob TEXT, email TEXT, phone TEXT,
+        address TEXT, city TEXT, state TEXT, zip TEXT, join_date TEXT,
+        email2 TEXT, sponsor TEXT, card_internal TEXT, card_external TEXT,
+        phone2 TEXT, waiver TEXT DEFAULT 'No', deleted_at TEXT
+    );
+    CREATE TABLE dues (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, member_id INTEGER, amount REAL,
+        payment_date TEXT, year TEXT DEFAULT (strftime('%Y','now')),
+        method TEXT, notes TEXT
+    );
+    CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT);
+    CREATE TABLE work_hours (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, member_id INTEGER NOT NULL,
+        date TEXT NOT NULL, hours REAL NOT NULL, work_type TEXT, notes TEXT
+    );
+    CREATE TABLE meeting_attendance (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, member_id INTEGER NOT NULL,
+        meeting_date TEXT NOT NULL,
+        status TEXT NOT NULL CHECK(status IN ('Attended','Exemption Approved')),
+        notes TEXT
+    );
+    CREATE TABLE deleted_members (
+        id INTEGER PRIMARY KEY, badge_number TEXT, membership_type TEXT,
+        first_name TEXT, last_name TEXT, dob TEXT, email TEXT, phone TEXT,
+        address TEXT, city TEXT, state TEXT, zip TEXT, join_date TEXT,
+        email2 TEXT, sponsor TEXT, card_internal TEXT, card_external TEXT,
+        phone2 TEXT, waiver TEXT DEFAULT 'No', deleted_at TEXT
+    );
+    INSERT INTO members (id, badge_number, membership_type, first_name, last_name)
+        VALUES (1, '101', 'Active', 'John', 'Smith');
+    INSERT INTO dues (member_id, amount, payment_date, year) VALUES (1, 150, '2025-01-10', '2025');
+    INSERT INTO settings (key, value) VALUES ('dues_active', '175');
+    INSERT INTO work_hours (member_id, date, hours, work_type) VALUES (1, '2025-04-05', 3, 'Range');
+    INSERT INTO deleted_members (id, badge_number, zip) VALUES (7, '107', '21074');
+"""
+
+
+class MigrationChainTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "members.db")
+        conn = sqlite3.connect(self.path)
+        conn.executescript(BASELINE_SCHEMA)
+        conn.close()
+
+    def tearDown(self):
+        database.close_all_connections()
+        database._migrated_paths.discard(os.path.abspath(self.path))
+        self._tmp.cleanup()
+
+    def columns(self, conn, table):
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+    def test_baseline_database_is_brought_up_to_date(self):
+        conn = database.get_connection(self.path)
+        self.assertEqual(database.get_schema_version(conn), database.SCHEMA_VERSION)
+
+        for column in ("deleted", "middle_name", "nickname", "suffix"):
+            self.assertIn(column, self.columns(conn, "members"))
+        self.assertIn("activity", self.columns(conn, "work_hours"))
+        self.assertNotIn("work_type", self.columns(conn, "work_hours"))
+        self.assertIn("zip_code", self.columns(conn, "deleted_members"))
+        for table in ("recycle_bin", "deletion_log", "roles", "committees"):
+            self.assertTrue(self.columns(conn, table), table)
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertLessEqual({"idx_meeting_attendance_member_date", "idx_dues_member_payment_date",
+                              "idx_dues_member_year", "idx_work_hours_member_date"}, indexes)
+
+    def test_existing_rows_are_kept(self):
+        conn = database.get_connection(self.path)
+        member = conn.execute("SELECT * FROM members WHERE id = 1").fetchone()
+        self.assertEqual((member["first_name"], member["deleted"]), ("John", 0))
+        self.assertEqual(conn.execute("SELECT activity, hours FROM work_hours").fetchone()[:],
+                         ("Range", 3.0))
+        self.assertEqual(conn.execute("SELECT zip_code FROM deleted_members").fetchone()[0],
+                         "21074")
+        settings = dict(conn.execute("SELECT key, value FROM settings").fetchall())
+        self.assertEqual(settings["dues_active"], "175")  # not reset to the default
+        self.assertEqual(settings["dues_associate"], "300")
+
+    def test_current_database_is_left_alone(self):
+        conn = database.get_connection(self.path)
+        self.assertEqual(database.migrate(conn), 0)
+
+    def test_failed_migration_rolls_back_and_is_retried(self):
+        def broken(conn):
+            conn.execute("CREATE TABLE half_done (id INTEGER)")
+            raise sqlite3.OperationalError("disk I/O error")
+
+        migrations = database.MIGRATIONS[:-1] + (broken,)
+        with mock.patch.object(database, "MIGRATIONS", migrations):
+            with self.assertRaises(sqlite3.OperationalError):
+                database.get_connection(self.path)
+        conn = sqlite3.connect(self.path)
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 0)
+        self.assertNotIn("deleted", self.columns(conn, "members"))
+        self.assertIsNone(conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'half_done'").fetchone())
+        conn.close()
+
+        conn = database.get_connection(self.path)
+        self.assertEqual(database.get_schema_version(conn), database.SCHEMA_VERSION)
+        self.assertIn("deleted", self.columns(conn, "members"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Checks for report_data.py:
+
+    python -m pytest test_report_data.py
+"""
+import csv
+import io
+import unittest
+from datetime import date
+
+from report_data import BADGE, DATE, MONEY, NUMBER, ReportColumn, ReportDataset
+
+COLUMNS = [
+    ReportColumn("badge", "Badge", BADGE),
+    ReportColumn("name", "Name"),
+    ReportColumn("paid_on", "Paid On", DATE),
+    ReportColumn("amount", "Amount", MONEY, align="RIGHT", total=True),
+    ReportColumn("hours", "Hours", NUMBER, align="RIGHT", total=True),
+]
+
+ROWS = [
+    ("12", "Smith, John", date(2025, 3, 1), 150.0, 2.5),
+    ("9", "Jones, Mary", None, 75.5, None),
+    ("101", "Adams, Sam", "2025-01-15", None, 4),
+]
+
+
+class ReportDatasetTest(unittest.TestCase):
+    def setUp(self):
+        self.data = ReportDataset(COLUMNS, ROWS, filters={"year": 2025})
+
+    def test_totals_skip_blanks(self):
+        self.assertEqual(self.data.totals, {"amount": 225.5, "hours": 6.5})
+        self.assertEqual(self.data.total_lines(), ["Totals - Amount: 225.50    Hours: 6.5"])
+
+    def test_no_total_columns_no_total_line(self):
+        data = ReportDataset(COLUMNS[:2], [row[:2] for row in ROWS])
+        self.assertEqual(data.totals, {})
+        self.assertEqual(data.total_lines(), [])
+
+    def test_csv_has_headings_and_formatted_rows(self):
+        out = io.StringIO()
+        self.data.write_csv(csv.writer(out))
+        self.assertEqual(list(csv.reader(io.StringIO(out.getvalue()))), [
+            ["Badge", "Name", "Paid On", "Amount", "Hours"],
+            ["12", "Smith, John", "03-01-2025", "150.00", "2.5"],
+            ["9", "Jones, Mary", "", "75.50", ""],
+            ["101", "Adams, Sam", "2025-01-15", "", "4"],
+        ])
+
+    def test_csv_follows_the_sort_order(self):
+        self.data.sort("badge")
+        self.assertEqual(self.data.sorted_by, ("badge", False))
+        out = io.StringIO()
+        self.data.write_csv(csv.writer(out))
+        badges = [row[0] for row in csv.reader(io.StringIO(out.getvalue()))][1:]
+        self.assertEqual(badges, ["9", "12", "101"])
+
+    def test_sort_by_date_and_money(self):
+        self.data.sort("paid_on")
+        self.assertEqual(self.data.order, ["2", "0", "1"])  # blank date last
+        self.data.sort("amount")
+        self.assertEqual(self.data.order, ["1", "0", "2"])
+
+    def test_report_table_matches_the_tree(self):
+        self.data.sort("name")
+        table = self.data.report_table("Dues Report", subtitles=["Year 2025"])
+        self.assertEqual(table.headers, self.data.headings())
+        self.assertEqual([tuple(row) for row in table.rows()],
+                         [values for _, values in self.data.display_rows()])
+        self.assertEqual(table.footer_lines, self.data.total_lines())
+        self.assertEqual(table.align[3], "RIGHT")
+
+
+if __name__ == "__main__":
+    unittest.main()
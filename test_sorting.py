@@ -0,0 +1,59 @@
+"""
+Checks for sorting.py:
+
+    python -m pytest test_sorting.py
+"""
+import unittest
+from datetime import date
+
+from sorting import BADGE, DATE, MONEY, TEXT, ColumnSorter, sort_key
+
+
+class SortKeyTest(unittest.TestCase):
+    def test_blanks(self):
+        for kind in (TEXT, BADGE, DATE, MONEY):
+            self.assertIsNone(sort_key(kind, None))
+            self.assertIsNone(sort_key(kind, "  "))
+
+    def test_typed_keys(self):
+        self.assertLess(sort_key(BADGE, "9"), sort_key(BADGE, "10"))
+        self.assertLess(sort_key(BADGE, "999"), sort_key(BADGE, "A1"))  # malformed after
+        self.assertEqual(sort_key(DATE, "03/01/2025"), sort_key(DATE, date(2025, 3, 1)))
+        self.assertLess(sort_key(DATE, "2024-12-31"), sort_key(DATE, "01-01-2025"))
+        self.assertLess(sort_key(MONEY, "9.50"), sort_key(MONEY, 10))
+        self.assertEqual(sort_key(TEXT, "Smith"), sort_key(TEXT, "smith"))
+
+
+class ColumnSorterTest(unittest.TestCase):
+    ROWS = {"a": "10", "b": "", "c": "9", "d": None, "e": "100"}
+
+    def setUp(self):
+        self.sorter = ColumnSorter({"badge": BADGE})
+        self.calls = 0
+
+    def values(self):
+        self.calls += 1
+        return iter(self.ROWS.items())
+
+    def test_blanks_stay_last_both_ways(self):
+        self.assertEqual(self.sorter.order("badge", self.values), ["c", "a", "e", "b", "d"])
+        self.assertEqual(self.sorter.order("badge", self.values, reverse=True),
+                         ["e", "a", "c", "b", "d"])
+
+    def test_descending_reuses_the_cached_keys(self):
+        self.sorter.order("badge", self.values)
+        self.sorter.order("badge", self.values, reverse=True)
+        self.sorter.order("badge", self.values)
+        self.assertEqual(self.calls, 1)
+
+    def test_columns_are_cached_separately_until_invalidated(self):
+        self.sorter.order("badge", self.values)
+        self.assertEqual(self.sorter.order("name", self.values), ["a", "e", "c", "b", "d"])
+        self.assertEqual(self.calls, 2)
+        self.sorter.invalidate()
+        self.sorter.order("badge", self.values, reverse=True)
+        self.assertEqual(self.calls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+from tkinter import ttk
+from sorting import TEXT, ColumnSorter, sort_key
+
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    A flat Treeview backed by an in-memory row model.
+
+    load() takes the whole roster, but Tk items are only created for the rows
+    scrolled into view plus an overscan page. More rows are paged in as the
+    view approaches the end of what has been materialized. The scrollbar
+    reports positions over the full model, so dragging the thumb halfway down
+    lands halfway through the roster.
+
+    The model, not the widget, is authoritative: use visible_ids() and
+    row_values() instead of get_children()/item(), which only see the rows
+    materialized so far. Filtering and sorting reorder the model and reuse
+    the items already created (detaching the ones that drop out of view).
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, master=None, **kw):
+        self._values = {}     # iid -> row values, for every row in the model
+        self._order = []      # every iid, in the current sort order
+        self._filter = None   # set of iids to show, or None for all
+        self._view = []       # iids to show, in order
+        self._shown = 0       # leading rows of _view attached to the widget
+        self._created = set() # iids that have a Tk item (attached or not)
+        self._paging = False
+        self._sorter = ColumnSorter(kw.pop("column_kinds", None))
+        self._sort = None     # (key(values), reverse) of the last sort, if any
+        self._yscrollcommand = kw.pop("yscrollcommand", None)
+        super().__init__(master, yscrollcommand=self._on_tk_scroll, **kw)
+
+    # ---------- Configuration ----------
+    def configure(self, cnf=None, **kw):
+        # The widget's own yscrollcommand stays pointed at _on_tk_scroll; the
+        # caller's scrollbar receives positions scaled to the full model.
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand")
+        if isinstance(cnf, dict) and "yscrollcommand" in cnf:
+            cnf = dict(cnf)
+            self._yscrollcommand = cnf.pop("yscrollcommand")
+        if cnf is None and not kw:
+            return super().configure()
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    # ---------- Row model ----------
+    def load(self, rows):
+        """Replace the model with rows, an iterable of (iid, values) pairs."""
+        if self._created:
+            self.delete(*self._created)
+            self._created.clear()
+        self._values = {}
+        self._order = []
+        self._sort = None
+        self._sorter.invalidate()
+        for iid, values in rows:
+            iid = str(iid)
+            self._values[iid] = list(values)
+            self._order.append(iid)
+        self._refresh_view()
+
+    def visible_ids(self):
+        """Every row passing the current filter, in display order."""
+        return list(self._view)
+
+    def row_values(self, iid):
+        return self._values[str(iid)]
+
+    def has_row(self, iid):
+        return str(iid) in self._values
+
+    def set_filter(self, iids):
+        """Show only the rows whose iid is in iids (None shows every row)."""
+        self._filter = None if iids is None else set(iids)
+        self._refresh_view()
+
+    def sort_rows(self, key, reverse=False):
+        """Reorder the model with key(values) -> sort key."""
+        self._order.sort(key=lambda iid: key(self._values[iid]), reverse=reverse)
+        self._sort = (lambda values: (key(values),), reverse)
+        self._refresh_view()
+
+    def sort_column(self, col, reverse=False):
+        """
+        Reorder the model by one column using typed, cached sort keys (see
+        sorting.ColumnSorter; pass column_kinds= to the constructor).
+        """
+        index = list(self["columns"]).index(col)
+        self._order = self._sorter.order(
+            col, lambda: ((iid, values[index]) for iid, values in self._values.items()), reverse)
+        kind = self._sorter.kinds.get(col, TEXT)
+        self._sort = (lambda values: sort_key(kind, values[index]), reverse)
+        self._refresh_view()
+
+    def column_values(self, col):
+        """(text, iid) pairs for one column across the whole model."""
+        index = list(self["columns"]).index(col)
+        return [(str(self._values[iid][index]), iid) for iid in self._order]
+
+    def set_row(self, iid, values, matches_filter=True):
+        """
+        Add or replace one row without rebuilding the view. While the model
+        is sorted, a new or changed row moves to its place in the current
+        order; otherwise a new row goes to the end. matches_filter says
+        whether it passes the active filter.
+        """
+        iid = str(iid)
+        values = list(values)
+        old = self._values.get(iid)
+        moved = old is None or (self._sort is not None and old != values)
+        if old is not None and moved:
+            self._order.remove(iid)
+            if iid in self._view:
+                self._drop_from_view(iid)
+        self._values[iid] = values
+        self._sorter.invalidate()
+        if iid in self._created:
+            self.item(iid, values=values)
+        if moved:
+            self._order.insert(self._sorted_position(self._order, iid), iid)
+
+        if self._filter is not None:
+            if matches_filter:
+                self._filter.add(iid)
+            else:
+                self._filter.discard(iid)
+        visible = self._filter is None or iid in self._filter
+        in_view = iid in self._view
+        if visible and not in_view:
+            position = self._sorted_position(self._view, iid)
+            self._view.insert(position, iid)
+            if position < self._shown:
+                if iid not in self._created:
+                    self.insert("", position, iid=iid, values=values)
+                    self._created.add(iid)
+                else:
+                    self.move(iid, "", position)
+                self._shown += 1
+            elif self._shown == len(self._view) - 1:
+                # Everything above it is attached, so attach it too.
+                self._materialize(self._shown + 1)
+        elif in_view and not visible:
+            self._drop_from_view(iid)
+
+    def _sorted_position(self, iids, iid):
+        """
+        Where iid belongs in iids (which does not contain it): after every
+        row that sorts before or level with it, or at the end if unsorted.
+        Rows with a blank key stay at the bottom, as in sort_column().
+        """
+        if self._sort is None:
+            return len(iids)
+        key_of, reverse = self._sort
+        key = key_of(self._values[iid])
+        if key is None:
+            return len(iids)
+        lo, hi = 0, len(iids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = key_of(self._values[iids[mid]])
+            if other is not None and (other >= key if reverse else other <= key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def remove_row(self, iid):
+        iid = str(iid)
+        if iid not in self._values:
+            return
+        if iid in self._view:
+            self._drop_from_view(iid)
+        del self._values[iid]
+        self._order.remove(iid)
+        self._sorter.invalidate()
+        if self._filter is not None:
+            self._filter.discard(iid)
+        if iid in self._created:
+            self.delete(iid)
+            self._created.discard(iid)
+
+    def _drop_from_view(self, iid):
+        position = self._view.index(iid)
+        del self._view[position]
+        if position < self._shown:
+            self._shown -= 1
+            self.detach(iid)
+
+    def see_row(self, iid):
+        """Materialize rows down to iid (if it is in view) and scroll to it."""
+        iid = str(iid)
+        if iid not in self._view:
+            return
+        self._materialize(self._view.index(iid) + 1 + self.PAGE_SIZE)
+        self.see(iid)
+
+    # ---------- Materialization ----------
+    def _refresh_view(self):
+        if self._filter is None:
+            self._view = list(self._order)
+        else:
+            self._view = [iid for iid in self._order if iid in self._filter]
+        count = min(max(self._shown, self.PAGE_SIZE), len(self._view))
+        shown = self._view[:count]
+        for iid in shown:
+            if iid not in self._created:
+                self._create(iid)
+        self.set_children("", *shown)
+        self._shown = count
+
+    def _create(self, iid):
+        self.insert("", "end", iid=iid, values=self._values[iid])
+        self._created.add(iid)
+
+    def _materialize(self, count):
+        count = min(count, len(self._view))
+        for iid in self._view[self._shown:count]:
+            if iid in self._created:
+                self.move(iid, "", "end")
+            else:
+                self._create(iid)
+        self._shown = max(self._shown, count)
+
+    # ---------- Scrolling ----------
+    def _on_tk_scroll(self, first, last):
+        first, last = float(first), float(last)
+        shown, total = self._shown, len(self._view)
+        if shown < total and last * shown >= shown - self.PAGE_SIZE // 2 and not self._paging:
+            # Page in the next block once the view nears the materialized end.
+            # Deferred so the new rows are not inserted from inside Tk's
+            # scroll callback.
+            self._paging = True
+            self.after_idle(self._page_in)
+        if self._yscrollcommand:
+            if total and shown:
+                first, last = first * shown / total, last * shown / total
+            self._yscrollcommand(first, last)
+
+    def _page_in(self):
+        self._paging = False
+        if self.winfo_exists():
+            first, last = super().yview()
+            self._materialize(int(last * self._shown) + self.PAGE_SIZE)
+
+    def yview(self, *args):
+        """Scrollbar/keyboard scrolling in terms of the whole model."""
+        if not args:
+            first, last = super().yview()
+            shown, total = self._shown, len(self._view)
+            if total and shown:
+                return first * shown / total, last * shown / total
+            return first, last
+        if args[0] == "moveto":
+            return self.yview_moveto(args[1])
+        return super().yview(*args)
+
+    def yview_moveto(self, fraction):
+        total = len(self._view)
+        if not total:
+            return super().yview_moveto(fraction)
+        target = int(float(fraction) * total)
+        self._materialize(target + self.PAGE_SIZE)
+        return super().yview_moveto(target / self._shown)